@@ -1,4 +1,4 @@
-import React, { Suspense, useEffect } from 'react';
+import React, { Suspense, useEffect, useLayoutEffect, useRef } from 'react';
 import { Canvas, useFrame, useThree } from '@react-three/fiber';
 import Game from './components/Game';
 import UI from './components/UI';
@@ -8,6 +8,35 @@ import MainMenu from './components/MainMenu';
 import LoadingScreen from './components/LoadingScreen';
 import { useGameStore } from './store/gameStore';
 
+// States where Game draws nothing - the canvas only repaints on demand there
+// (as it does while paused, when the simulation should not advance either).
+// Switching frameloop restarts the r3f clock, so resuming gets a fresh delta;
+// ClockContinuity restores elapsedTime so time-driven animations don't reset
+const STATIC_GAME_STATES = new Set(['startup', 'gameOver', 'gameWon', 'loading']);
+
+// r3f's setFrameloop zeroes clock.elapsedTime on every frameloop switch,
+// which would snap every elapsedTime-driven animation (shader time uniforms,
+// drift, wobble) back to its starting phase on each pause/resume. Track the
+// elapsed time each frame and write it back after a switch; the restarted
+// clock still gives a small first delta.
+function ClockContinuity() {
+  const clock = useThree((state) => state.clock);
+  const frameloop = useThree((state) => state.frameloop);
+  const elapsedTimeRef = useRef(null);
+  
+  useFrame(() => {
+    elapsedTimeRef.current = clock.elapsedTime;
+  });
+  
+  useLayoutEffect(() => {
+    if (elapsedTimeRef.current !== null) {
+      clock.elapsedTime = elapsedTimeRef.current;
+    }
+  }, [clock, frameloop]);
+  
+  return null;
+}
+
 // Dynamic fog component that follows player position
 function DynamicFog() {
   const { scene, camera } = useThree();
@@ -38,6 +67,7 @@ function App() {
   const gameState = useGameStore((state) => state.gameState);
   const showMenu = useGameStore((state) => state.showMenu);
   const gameMode = useGameStore((state) => state.gameMode);
+  const isPaused = useGameStore((state) => state.isPaused);
   const loadDebugPreferences = useGameStore((state) => state.loadDebugPreferences);
   
   // Load debug preferences on app start
@@ -56,36 +86,35 @@ function App() {
   return (
     <>
       {gameState === 'loading' && <LoadingScreen />}
-      {gameState !== 'loading' && (
-        <>
-          <Canvas
-            gl={{ antialias: true, alpha: false }}
-            style={{ background: '#000' }}
-          >
-            <FollowCamera />
-            
-            <ambientLight intensity={0.5} />
-            <pointLight position={[0, 50, 50]} intensity={1} />
-            
-            {/* Mild directional light from top left */}
-            <directionalLight 
-              position={[-30, 40, 20]} 
-              intensity={0.3} 
-              color="#ffffff"
-            />
-            
-            <fog attach="fog" args={['#404040', 175, 850]} />
-            <DynamicFog />
-            
-            <Suspense fallback={null}>
-              <Game />
-            </Suspense>
-          </Canvas>
-          
-          <UI />
-          {/* <CursorZoomOverlay /> */}
-        </>
-      )}
+      {/* Canvas stays mounted through 'loading' so a restart reuses the WebGL context */}
+      <Canvas
+        gl={{ antialias: true, alpha: false }}
+        frameloop={isPaused || STATIC_GAME_STATES.has(gameState) ? 'demand' : 'always'}
+        style={{ background: '#000' }}
+      >
+        <ClockContinuity />
+        <FollowCamera />
+        
+        <ambientLight intensity={0.5} />
+        <pointLight position={[0, 50, 50]} intensity={1} />
+        
+        {/* Mild directional light from top left */}
+        <directionalLight 
+          position={[-30, 40, 20]} 
+          intensity={0.3} 
+          color="#ffffff"
+        />
+        
+        <fog attach="fog" args={['#404040', 175, 850]} />
+        <DynamicFog />
+        
+        <Suspense fallback={null}>
+          <Game />
+        </Suspense>
+      </Canvas>
+      
+      {gameState !== 'loading' && <UI />}
+      {/* <CursorZoomOverlay /> */}
     </>
   );
 }
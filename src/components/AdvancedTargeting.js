@@ -1,6 +1,5 @@
 import React, { useState, useEffect, useRef, useMemo } from 'react';
 import { useThree } from '@react-three/fiber';
-import { Box3, Vector3 } from 'three';
 import * as THREE from 'three';
 import { Html, Billboard } from '@react-three/drei';
 import { useGameStore } from '../store/gameStore';
@@ -84,19 +83,19 @@ function AdvancedTargeting() {
       missileSpawnOffset: { x: 0, y: 0, z: -3 }
     };
     
-    const targetPos = new Vector3(targetPosition.x, targetPosition.y, targetPosition.z);
-    const targetVel = new Vector3(targetVelocity.x, targetVelocity.y, targetVelocity.z);
-    const playerVel = new Vector3(playerVelocity.x, playerVelocity.y, playerVelocity.z);
+    const targetPos = new THREE.Vector3(targetPosition.x, targetPosition.y, targetPosition.z);
+    const targetVel = new THREE.Vector3(targetVelocity.x, targetVelocity.y, targetVelocity.z);
+    const playerVel = new THREE.Vector3(playerVelocity.x, playerVelocity.y, playerVelocity.z);
     
     // Enhanced missile spawn calculation with firing delay compensation
-    const missileSpawnOffset = new Vector3(config.missileSpawnOffset.x, config.missileSpawnOffset.y, config.missileSpawnOffset.z);
+    const missileSpawnOffset = new THREE.Vector3(config.missileSpawnOffset.x, config.missileSpawnOffset.y, config.missileSpawnOffset.z);
     const rotationMatrix = new THREE.Matrix4().makeRotationFromEuler(
       new THREE.Euler(playerRotation.x, playerRotation.y, playerRotation.z)
     );
     missileSpawnOffset.applyMatrix4(rotationMatrix);
     
     // Account for player movement during firing delay
-    const shooterPos = new Vector3(
+    const shooterPos = new THREE.Vector3(
       playerPosition.x + missileSpawnOffset.x + playerVel.x * config.firingDelay,
       playerPosition.y + missileSpawnOffset.y + playerVel.y * config.firingDelay,
       playerPosition.z + missileSpawnOffset.z + playerVel.z * config.firingDelay
@@ -202,19 +201,19 @@ function AdvancedTargeting() {
       missileSpawnOffset: { x: 0, y: 0, z: -3 }
     };
     
-    const targetPos = new Vector3(targetPosition.x, targetPosition.y, targetPosition.z);
-    const targetVel = new Vector3(targetVelocity.x, targetVelocity.y, targetVelocity.z);
-    const playerVel = new Vector3(playerVelocity.x, playerVelocity.y, playerVelocity.z);
+    const targetPos = new THREE.Vector3(targetPosition.x, targetPosition.y, targetPosition.z);
+    const targetVel = new THREE.Vector3(targetVelocity.x, targetVelocity.y, targetVelocity.z);
+    const playerVel = new THREE.Vector3(playerVelocity.x, playerVelocity.y, playerVelocity.z);
     
     // Calculate enhanced shooter position
     const calculateShooterPosition = () => {
-      const missileSpawnOffset = new Vector3(config.missileSpawnOffset.x, config.missileSpawnOffset.y, config.missileSpawnOffset.z);
+      const missileSpawnOffset = new THREE.Vector3(config.missileSpawnOffset.x, config.missileSpawnOffset.y, config.missileSpawnOffset.z);
       const rotationMatrix = new THREE.Matrix4().makeRotationFromEuler(
         new THREE.Euler(playerRotation.x, playerRotation.y, playerRotation.z)
       );
       missileSpawnOffset.applyMatrix4(rotationMatrix);
       
-      return new Vector3(
+      return new THREE.Vector3(
         playerPosition.x + missileSpawnOffset.x + playerVel.x * config.firingDelay,
         playerPosition.y + missileSpawnOffset.y + playerVel.y * config.firingDelay,
         playerPosition.z + missileSpawnOffset.z + playerVel.z * config.firingDelay
@@ -305,9 +304,9 @@ function AdvancedTargeting() {
       missileSpawnOffset: { x: 0, y: 0, z: -3 }
     };
     
-    const targetPos = new Vector3(targetPosition.x, targetPosition.y, targetPosition.z);
-    const targetVel = new Vector3(targetVelocity.x, targetVelocity.y, targetVelocity.z);
-    const playerVel = new Vector3(playerVelocity.x, playerVelocity.y, playerVelocity.z);
+    const targetPos = new THREE.Vector3(targetPosition.x, targetPosition.y, targetPosition.z);
+    const targetVel = new THREE.Vector3(targetVelocity.x, targetVelocity.y, targetVelocity.z);
+    const playerVel = new THREE.Vector3(playerVelocity.x, playerVelocity.y, playerVelocity.z);
     
     // Calculate combined speed for high-speed detection
     const playerSpeed = playerVel.length();
@@ -316,7 +315,7 @@ function AdvancedTargeting() {
     const isHighSpeed = combinedSpeed > config.highSpeedThreshold;
     
     // Enhanced missile spawn calculation with velocity-based offset
-    const missileSpawnOffset = new Vector3(config.missileSpawnOffset.x, config.missileSpawnOffset.y, config.missileSpawnOffset.z);
+    const missileSpawnOffset = new THREE.Vector3(config.missileSpawnOffset.x, config.missileSpawnOffset.y, config.missileSpawnOffset.z);
     const rotationMatrix = new THREE.Matrix4().makeRotationFromEuler(
       new THREE.Euler(playerRotation.x, playerRotation.y, playerRotation.z)
     );
@@ -334,7 +333,7 @@ function AdvancedTargeting() {
       frameDelay += (combinedSpeed / 1000); // Add delay proportional to speed
     }
     
-    const shooterPos = new Vector3(
+    const shooterPos = new THREE.Vector3(
       playerPosition.x + missileSpawnOffset.x + playerVel.x * frameDelay,
       playerPosition.y + missileSpawnOffset.y + playerVel.y * frameDelay,
       playerPosition.z + missileSpawnOffset.z + playerVel.z * frameDelay
@@ -438,9 +437,9 @@ function AdvancedTargeting() {
       missileSpawnOffset: { x: 0, y: 0, z: -3 }
     };
     
-    const targetPos = new Vector3(targetPosition.x, targetPosition.y, targetPosition.z);
-    const targetVel = new Vector3(targetVelocity.x, targetVelocity.y, targetVelocity.z);
-    const playerVel = new Vector3(playerVelocity.x, playerVelocity.y, playerVelocity.z);
+    const targetPos = new THREE.Vector3(targetPosition.x, targetPosition.y, targetPosition.z);
+    const targetVel = new THREE.Vector3(targetVelocity.x, targetVelocity.y, targetVelocity.z);
+    const playerVel = new THREE.Vector3(playerVelocity.x, playerVelocity.y, playerVelocity.z);
     
     // Calculate scenario complexity for adaptive iterations
     const playerSpeed = playerVel.length();
@@ -456,13 +455,13 @@ function AdvancedTargeting() {
     }
     
     // Enhanced missile spawn calculation
-    const missileSpawnOffset = new Vector3(config.missileSpawnOffset.x, config.missileSpawnOffset.y, config.missileSpawnOffset.z);
+    const missileSpawnOffset = new THREE.Vector3(config.missileSpawnOffset.x, config.missileSpawnOffset.y, config.missileSpawnOffset.z);
     const rotationMatrix = new THREE.Matrix4().makeRotationFromEuler(
       new THREE.Euler(playerRotation.x, playerRotation.y, playerRotation.z)
     );
     missileSpawnOffset.applyMatrix4(rotationMatrix);
     
-    const shooterPos = new Vector3(
+    const shooterPos = new THREE.Vector3(
       playerPosition.x + missileSpawnOffset.x,
       playerPosition.y + missileSpawnOffset.y,
       playerPosition.z + missileSpawnOffset.z
@@ -561,26 +560,26 @@ function AdvancedTargeting() {
       missileSpawnOffset: { x: 0, y: 0, z: -2.5 } // Slightly different offset
     };
     
-    const targetPos = new Vector3(targetPosition.x, targetPosition.y, targetPosition.z);
-    const targetVel = new Vector3(targetVelocity.x, targetVelocity.y, targetVelocity.z);
-    const playerVel = new Vector3(playerVelocity.x, playerVelocity.y, playerVelocity.z);
+    const targetPos = new THREE.Vector3(targetPosition.x, targetPosition.y, targetPosition.z);
+    const targetVel = new THREE.Vector3(targetVelocity.x, targetVelocity.y, targetVelocity.z);
+    const playerVel = new THREE.Vector3(playerVelocity.x, playerVelocity.y, playerVelocity.z);
     
     // Calculate shooter position using alternative method
     let shooterPos;
     if (config.useCameraPosition) {
       // Use camera position with minimal offset
-      const cameraDirection = new Vector3();
+      const cameraDirection = new THREE.Vector3();
       camera.getWorldDirection(cameraDirection);
       shooterPos = camera.position.clone().add(cameraDirection.multiplyScalar(-2.5));
     } else {
       // Use enhanced player position calculation
-      const missileSpawnOffset = new Vector3(config.missileSpawnOffset.x, config.missileSpawnOffset.y, config.missileSpawnOffset.z);
+      const missileSpawnOffset = new THREE.Vector3(config.missileSpawnOffset.x, config.missileSpawnOffset.y, config.missileSpawnOffset.z);
       const rotationMatrix = new THREE.Matrix4().makeRotationFromEuler(
         new THREE.Euler(playerRotation.x, playerRotation.y, playerRotation.z)
       );
       missileSpawnOffset.applyMatrix4(rotationMatrix);
       
-      shooterPos = new Vector3(
+      shooterPos = new THREE.Vector3(
         playerPosition.x + missileSpawnOffset.x,
         playerPosition.y + missileSpawnOffset.y,
         playerPosition.z + missileSpawnOffset.z
@@ -741,8 +740,8 @@ function AdvancedTargeting() {
     const targetsWithData = validTargets.map(alien => {
       // Get position from enemy ship or legacy alien structure
       const alienPosition = alien.enemyShip ? alien.enemyShip.position : alien.position;
-      const worldPos = new Vector3(alienPosition.x, alienPosition.y, alienPosition.z);
-      const playerPos = new Vector3(playerPosition.x, playerPosition.y, playerPosition.z);
+      const worldPos = new THREE.Vector3(alienPosition.x, alienPosition.y, alienPosition.z);
+      const playerPos = new THREE.Vector3(playerPosition.x, playerPosition.y, playerPosition.z);
       const screenPos = worldPos.clone().project(camera);
       
       const distance = worldPos.distanceTo(playerPos);
@@ -1095,20 +1094,20 @@ function AdvancedTargeting() {
     
     // Calculate where the ship is actually aiming by projecting missile trajectory
     // This matches exactly where a manually fired missile would go
-    const missileSpawnOffset = new Vector3(0, 0, -3);
+    const missileSpawnOffset = new THREE.Vector3(0, 0, -3);
     const rotationMatrix = new THREE.Matrix4().makeRotationFromEuler(
       new THREE.Euler(playerRotation.x, playerRotation.y, playerRotation.z)
     );
     missileSpawnOffset.applyMatrix4(rotationMatrix);
     
-    const missileSpawnPos = new Vector3(
+    const missileSpawnPos = new THREE.Vector3(
       playerPosition.x + missileSpawnOffset.x,
       playerPosition.y + missileSpawnOffset.y,
       playerPosition.z + missileSpawnOffset.z
     );
     
     // Ship's nose points in negative Z direction
-    const shipDirection = new Vector3(0, 0, -1);
+    const shipDirection = new THREE.Vector3(0, 0, -1);
     shipDirection.applyMatrix4(rotationMatrix);
     
     // Calculate engagement distance (matching FreeFlightCrosshair.js)
@@ -1129,7 +1128,7 @@ function AdvancedTargeting() {
     const shipAimDirection = shipDirection.clone().normalize();
     
     // Calculate required aiming direction to hit target
-    const requiredAimDirection = new Vector3(prediction.point.x, prediction.point.y, prediction.point.z)
+    const requiredAimDirection = new THREE.Vector3(prediction.point.x, prediction.point.y, prediction.point.z)
       .sub(missileSpawnPos).normalize();
     
     // Calculate angular difference between ship direction and required direction
@@ -1162,7 +1161,7 @@ function AdvancedTargeting() {
     
     // Calculate crosshair positions for manual fire logging
     const freeLookCrosshairPos = missileSpawnPos.clone().add(shipAimDirection.clone().multiplyScalar(engagementDistance));
-    const predictiveWorldPos = new Vector3(prediction.point.x, prediction.point.y, prediction.point.z);
+    const predictiveWorldPos = new THREE.Vector3(prediction.point.x, prediction.point.y, prediction.point.z);
     const worldThreshold = alignmentThreshold;
     
     // Store current alignment data for manual fire logging
@@ -1,11 +1,21 @@
-import React, { useRef } from 'react';
+import React, { useMemo, useRef } from 'react';
 import { useFrame } from '@react-three/fiber';
 import Alien from './Alien';
+import { AlienBatch } from './alien/AlienBatch';
 import { useGameStore } from '../store/gameStore';
 import { useEntityPool } from '../hooks/useEntityPool';
 import { UnifiedGamespace } from '../config/UnifiedGamespace';
 import { EnemyShip } from '../entities/EnemyShip';
 
+// Number of failed Bernoulli(probability) trials before the next success.
+// Sampling the gap directly costs one random draw per success instead of
+// one per trial, with identical per-trial odds.
+function sampleGeometricGap(probability) {
+  if (probability <= 0) return Infinity;
+  if (probability >= 1) return 0;
+  return Math.floor(Math.log(1 - Math.random()) / Math.log(1 - probability));
+}
+
 function AlienWave({ level, difficultyMultiplier }) {
   const spawnRef = useRef({ 
     spawnTimer: 0, 
@@ -16,7 +26,7 @@ function AlienWave({ level, difficultyMultiplier }) {
   });
   
   const updateAliens = useGameStore((state) => state.updateAliens);
-  const addMissile = useGameStore((state) => state.addMissile);
+  const addMissilesBatch = useGameStore((state) => state.addMissilesBatch);
   const playerPosition = useGameStore((state) => state.playerPosition);
   const playerPowerUps = useGameStore((state) => state.playerPowerUps);
   const gameMode = useGameStore((state) => state.gameMode);
@@ -305,32 +315,39 @@ function AlienWave({ level, difficultyMultiplier }) {
     const adjustedDelta = delta * timeMultiplier * difficultyMultiplier;
     const now = Date.now();
     
+    // Shots fired this frame go to the store in one batch after the pass
+    // instead of one missiles-array copy per shot
+    const firedMissiles = [];
+    
     const updatedAliens = freshAliens.map((alien) => {
-      let newX = alien.position.x + alien.velocity.x * adjustedDelta;
-      let newY = alien.position.y + alien.velocity.y * adjustedDelta;
-      let newZ = alien.position.z + alien.velocity.z * adjustedDelta;
-      
-      let updatedAlien = { ...alien };
-      
-      // Handle enemy ship AI
-      if (alien.enemyShip) {
-        // Update enemy ship AI
-        alien.enemyShip.update(adjustedDelta, playerPosition, now);
-        
-        // Sync position and velocity
-        updatedAlien.position = { ...alien.enemyShip.position };
-        updatedAlien.velocity = { ...alien.enemyShip.velocity };
-        updatedAlien.rotation = { ...alien.enemyShip.rotation };
+      // Handle enemy ship AI - the ship integrates its own motion, so the
+      // legacy velocity step below is skipped and the alien is built in one go
+      const enemyShip = alien.enemyShip;
+      if (enemyShip) {
+        enemyShip.update(adjustedDelta, playerPosition, now);
         
         // Check if enemy can fire
-        const missile = alien.enemyShip.fire(playerPosition, now);
+        const missile = enemyShip.fire(playerPosition, now);
         if (missile) {
-          addMissile(missile);
+          firedMissiles.push(missile);
         }
         
-        return updatedAlien;
+        // Sync position, velocity and rotation
+        const { position, velocity, rotation } = enemyShip;
+        return {
+          ...alien,
+          position: { x: position.x, y: position.y, z: position.z },
+          velocity: { x: velocity.x, y: velocity.y, z: velocity.z },
+          rotation: { x: rotation.x, y: rotation.y, z: rotation.z }
+        };
       }
       
+      let newX = alien.position.x + alien.velocity.x * adjustedDelta;
+      let newY = alien.position.y + alien.velocity.y * adjustedDelta;
+      let newZ = alien.position.z + alien.velocity.z * adjustedDelta;
+      
+      let updatedAlien = { ...alien };
+      
       // Handle spawn animations
       if (alien.isSpawning) {
         const timeSinceSpawn = now - alien.spawnStartTime;
@@ -413,7 +430,7 @@ function AlienWave({ level, difficultyMultiplier }) {
         ...updatedAlien,
         position: { x: newX, y: newY, z: newZ },
       };
-    }).filter(alien => alien !== null);
+    });
     
     // Legacy AI firing for aliens without enemy ship AI
     const useWebWorkerAI = useGameStore.getState().useWebWorkerAI;
@@ -422,6 +439,9 @@ function AlienWave({ level, difficultyMultiplier }) {
       const fireChance = 0.002 * difficultyMultiplier;
       const earlyShootingDistance = -50.625;
       const playerHasStealth = useGameStore.getState().playerPowerUps.stealth;
+      const fireProbability = fireChance * adjustedDelta * 60;
+      // Eligible aliens left to pass over before the next one fires
+      let aliensUntilShot = sampleGeometricGap(fireProbability);
       
       updatedAliens.forEach((alien) => {
         // Skip aliens with enemy ship AI (they handle their own firing)
@@ -429,17 +449,22 @@ function AlienWave({ level, difficultyMultiplier }) {
         
         // Legacy firing logic for old aliens
         if (!alien.isInvulnerable && !playerHasStealth && (alien.isAtCombatDistance || alien.position.z > earlyShootingDistance)) {
-          if (Math.random() < fireChance * adjustedDelta * 60) {
+          if (aliensUntilShot > 0) {
+            aliensUntilShot--;
+          } else {
+            aliensUntilShot = sampleGeometricGap(fireProbability);
             const dx = playerPosition.x - alien.position.x;
             const dy = playerPosition.y - alien.position.y;
-            const distance = Math.sqrt(dx * dx + dy * dy);
+            const distanceSquared = dx * dx + dy * dy;
             
-            if (distance > 0) {
-              const vx = (dx / distance) * 0.2;
-              const vy = (dy / distance) * 0.2;
+            if (distanceSquared > 0) {
+              // Normalize and apply the 0.2 aim speed with one reciprocal
+              const aimScale = 0.2 / Math.sqrt(distanceSquared);
+              const vx = dx * aimScale;
+              const vy = dy * aimScale;
               
-              addMissile({
-                id: `alien-missile-${Date.now()}-${alien.id}`,
+              firedMissiles.push({
+                id: `alien-missile-${now}-${alien.id}`,
                 position: { ...alien.position },
                 velocity: { x: vx, y: vy, z: 2.5 },
                 type: 'alien',
@@ -450,15 +475,34 @@ function AlienWave({ level, difficultyMultiplier }) {
       });
     }
     
+    if (firedMissiles.length > 0) {
+      addMissilesBatch(firedMissiles);
+    }
+    
     updateAliens(updatedAliens);
   });
   
   const aliens = useGameStore((state) => state.aliens);
   const highlightedAlienId = useGameStore((state) => state.highlightedAlienId);
   
+  // Split the drawn set once per store update, so the batch walks only the
+  // aliens it draws and charging aliens keep the full component
+  const { batchedAliens, chargingAliens } = useMemo(() => {
+    const batched = [];
+    const charging = [];
+    for (let i = 0; i < aliens.length; i++) {
+      const alien = aliens[i];
+      if (!alien || !alien.position) continue;
+      (alien.isCharging ? charging : batched).push(alien);
+    }
+    return { batchedAliens: batched, chargingAliens: charging };
+  }, [aliens]);
+  
   return (
     <>
-      {aliens.map((alien, index) => (
+      <AlienBatch aliens={batchedAliens} highlightedAlienId={highlightedAlienId} />
+      {/* Charging aliens keep the full component for their charge effect */}
+      {chargingAliens.map((alien) => (
         <Alien 
           key={alien.id} 
           alien={alien} 
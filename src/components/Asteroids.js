@@ -3,7 +3,78 @@ import { useFrame } from '@react-three/fiber';
 import { useGameStore } from '../store/gameStore';
 import { useEntityPool } from '../hooks/useEntityPool';
 import { UnifiedGamespace } from '../config/UnifiedGamespace';
+import { SpatialHashGrid } from '../utils/spatialHashGrid';
 
+// Asteroids are removed once they leave 10x the gamespace in x/y
+const CULL_HALF_WIDTH = (36 * 10) / 2; // 360 units wide (10x gamespace width)
+const CULL_HALF_HEIGHT = (20 * 10) / 2; // 200 units tall (10x gamespace height)
+const CULL_CENTER_X = 0;
+const CULL_CENTER_Y = 12;
+const CULL_MAX_Z = 50; // Cull if passed behind player
+
+// Cell size must cover the largest asteroid-alien hit radius (SuperLarge
+// size 12 + 2) for the 3x3x3 neighbourhood query to be complete
+const ALIEN_GRID_CELL_SIZE = 20;
+const alienGrid = new SpatialHashGrid(ALIEN_GRID_CELL_SIZE);
+
+// Flat per-frame copy of alien positions (index i = aliens[i]) so the
+// asteroid-alien check is a tight numeric loop over typed arrays instead of
+// chasing alien.position objects for every asteroid/alien pair
+const alienPositions = {
+  count: 0,
+  x: new Float64Array(64),
+  y: new Float64Array(64),
+  z: new Float64Array(64)
+};
+
+function packAlienPositions(aliens) {
+  if (aliens.length > alienPositions.x.length) {
+    const capacity = Math.max(aliens.length, alienPositions.x.length * 2);
+    alienPositions.x = new Float64Array(capacity);
+    alienPositions.y = new Float64Array(capacity);
+    alienPositions.z = new Float64Array(capacity);
+  }
+  const { x, y, z } = alienPositions;
+  alienGrid.clear();
+  for (let i = 0; i < aliens.length; i++) {
+    const position = aliens[i].position;
+    x[i] = position.x;
+    y[i] = position.y;
+    z[i] = position.z;
+    alienGrid.insert(i, x[i], y[i], z[i]);
+  }
+  alienGrid.build();
+  alienPositions.count = aliens.length;
+}
+
+// Lowest alien index (first in store order) within radius of a point, or -1.
+// Uses the grid when the radius fits in one cell, otherwise scans every alien.
+function findFirstAlienInRange(px, py, pz, radius) {
+  const { count, x, y, z } = alienPositions;
+  const radiusSquared = radius * radius;
+  let hitIndex = -1;
+  
+  if (radius <= ALIEN_GRID_CELL_SIZE) {
+    const candidates = alienGrid.query(px, py, pz);
+    for (let c = 0; c < alienGrid.queryCount; c++) {
+      const i = candidates[c];
+      if (hitIndex !== -1 && i >= hitIndex) continue;
+      const dx = px - x[i];
+      const dy = py - y[i];
+      const dz = pz - z[i];
+      if (dx * dx + dy * dy + dz * dz < radiusSquared) hitIndex = i;
+    }
+    return hitIndex;
+  }
+  
+  for (let i = 0; i < count; i++) {
+    const dx = px - x[i];
+    const dy = py - y[i];
+    const dz = pz - z[i];
+    if (dx * dx + dy * dy + dz * dz < radiusSquared) return i;
+  }
+  return hitIndex;
+}
 
 function Asteroid({ asteroid }) {
   const meshRef = useRef();
@@ -548,33 +619,28 @@ function Asteroids({ level = 1 }) {
       return;
     }
     
+    packAlienPositions(aliens);
+    
+    // Brake/boost states are the same for every asteroid this frame
+    const { isBraking, isBoosting } = useGameStore.getState();
+    let movementMultiplier = 1.0;
+    if (isBraking) {
+      movementMultiplier = 0.1; // Asteroids slow down when player brakes
+    } else if (isBoosting) {
+      movementMultiplier = 2.0; // Asteroids speed up when player boosts
+    }
+    const adjustedDelta = delta * movementMultiplier;
+    
     const updatedAsteroids = currentAsteroids.map((asteroid) => {
-      // Get brake/boost states for movement adjustment
-      const isBraking = useGameStore.getState().isBraking;
-      const isBoosting = useGameStore.getState().isBoosting;
-      
-      let movementMultiplier = 1.0;
-      if (isBraking) {
-        movementMultiplier = 0.1; // Asteroids slow down when player brakes
-      } else if (isBoosting) {
-        movementMultiplier = 2.0; // Asteroids speed up when player boosts
-      }
-      
       // Move asteroid with brake/boost effects
-      const adjustedDelta = delta * movementMultiplier;
       const newX = asteroid.position.x + asteroid.velocity.x * adjustedDelta;
       const newY = asteroid.position.y + asteroid.velocity.y * adjustedDelta;
       const newZ = asteroid.position.z + asteroid.velocity.z * adjustedDelta;
       
-      // Remove asteroids only if they go to negative z or 10x gamespace bounds in x/y
-      const extendedWidth = 36 * 10; // 360 units wide (10x gamespace width)
-      const extendedHeight = 20 * 10; // 200 units tall (10x gamespace height)
-      const centerX = 0;
-      const centerY = 12;
-      
-      const isWayOutside = Math.abs(newX - centerX) > extendedWidth/2 || 
-                          Math.abs(newY - centerY) > extendedHeight/2 ||
-                          newZ > 50; // Cull if passed behind player
+      // Remove asteroids only if they pass the player or leave 10x gamespace bounds in x/y
+      const isWayOutside = Math.abs(newX - CULL_CENTER_X) > CULL_HALF_WIDTH || 
+                          Math.abs(newY - CULL_CENTER_Y) > CULL_HALF_HEIGHT ||
+                          newZ > CULL_MAX_Z;
       
       if (isWayOutside) {
         return null;
@@ -586,29 +652,24 @@ function Asteroids({ level = 1 }) {
         const playerDx = newX - playerPosition.x;
         const playerDy = newY - playerPosition.y;
         const playerDz = newZ - 0; // Player is at Z=0
-        const playerDistance = Math.sqrt(playerDx * playerDx + playerDy * playerDy + playerDz * playerDz);
+        const playerDistanceSquared = playerDx * playerDx + playerDy * playerDy + playerDz * playerDz;
+        const playerHitRadius = asteroid.size + 1;
         
-        if (playerDistance < asteroid.size + 1) {
+        if (playerDistanceSquared < playerHitRadius * playerHitRadius) {
           loseLife();
           return null; // Remove asteroid after hit
         }
         
-        // Check collision with aliens
-        for (const alien of aliens) {
-          const alienDx = newX - alien.position.x;
-          const alienDy = newY - alien.position.y;
-          const alienDz = newZ - alien.position.z;
-          const alienDistance = Math.sqrt(alienDx * alienDx + alienDy * alienDy + alienDz * alienDz);
-          
-          if (alienDistance < asteroid.size + 2) { // Slightly larger collision radius for aliens
-            // Handle asteroid splitting when hitting aliens
-            if (asteroid.type === 'SuperLarge' || asteroid.type === 'Large') {
-              splitAsteroid(asteroid, { x: newX, y: newY, z: newZ });
-            }
-            
-            removeAlien(alien.id);
-            return null; // Remove original asteroid after destroying alien
+        // Check collision with aliens (slightly larger collision radius for aliens)
+        const hitAlienIndex = findFirstAlienInRange(newX, newY, newZ, asteroid.size + 2);
+        if (hitAlienIndex !== -1) {
+          // Handle asteroid splitting when hitting aliens
+          if (asteroid.type === 'SuperLarge' || asteroid.type === 'Large') {
+            splitAsteroid(asteroid, { x: newX, y: newY, z: newZ });
           }
+          
+          removeAlien(aliens[hitAlienIndex].id);
+          return null; // Remove original asteroid after destroying alien
         }
       }
       
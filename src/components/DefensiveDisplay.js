@@ -107,4 +107,4 @@ function DefensiveDisplay() {
   );
 }
 
-export default DefensiveDisplay;
\ No newline at end of file
+export default React.memo(DefensiveDisplay);
\ No newline at end of file
@@ -4,9 +4,12 @@ import { useGameStore } from '../store/gameStore';
 import effectsPool from '../systems/EffectsPool';
 import * as THREE from 'three';
 
+// Matches the 1 second particle animation in EffectsPool
+const EFFECT_DURATION_MS = 1000;
+
 function Effects() {
   const effects = useGameStore((state) => state.effects);
-  const removeEffect = useGameStore((state) => state.removeEffect);
+  const removeExpiredEffects = useGameStore((state) => state.removeExpiredEffects);
   const { scene } = useThree();
   const activeEffectsRef = useRef(new Map()); // Track active pooled effects
   const prevEffectsRef = useRef(new Map());
@@ -51,31 +54,21 @@ function Effects() {
             const angle = (index / particles.length) * Math.PI * 2;
             const speed = 0.1 + Math.random() * 0.2;
             
-            // Set initial position
-            particle.userData.initialPosition.set(
-              effect.position.x, 
-              effect.position.y, 
-              effect.position.z || 0
-            );
-            particle.position.copy(particle.userData.initialPosition);
-            
-            // Set velocity
-            particle.userData.velocity.set(
+            // Set initial position, velocity, scale and rotation
+            // Scale reduced by 25% from (0.2-0.5) to (0.15-0.375)
+            effectsPool.initializeParticle(
+              particle,
+              effect.position.x,
+              effect.position.y,
+              effect.position.z || 0,
               Math.cos(angle) * speed,
               Math.sin(angle) * speed,
-              (Math.random() - 0.5) * speed * 0.5
+              (Math.random() - 0.5) * speed * 0.5,
+              0.15 + Math.random() * 0.225,
+              Math.random() * Math.PI * 2,
+              effect.startTime
             );
             
-            // Set scale and rotation
-            // Reduced by 25% from (0.2-0.5) to (0.15-0.375)
-            particle.userData.initialScale = 0.15 + Math.random() * 0.225;
-            particle.userData.initialRotation = Math.random() * Math.PI * 2;
-            particle.userData.startTime = effect.startTime;
-            
-            // Set initial transform
-            particle.scale.setScalar(particle.userData.initialScale);
-            particle.rotation.z = particle.userData.initialRotation;
-            
             // Update material color if needed
             if (effect.color && effect.type === 'powerupCollect') {
               particle.material.color.set(effect.color);
@@ -98,28 +91,18 @@ function Effects() {
 
   // Update animations and check for completion
   useFrame(() => {
-    const now = Date.now();
-    const activeEffects = activeEffectsRef.current;
-    
     // Update pool animations
     effectsPool.updateAnimations();
     
-    // Check for completed effects and remove them
-    const effectsToRemove = [];
-    
-    effects.forEach(effect => {
-      const elapsed = now - effect.startTime;
-      const progress = elapsed / 1000;
-      
-      if (progress > 1) {
-        effectsToRemove.push(effect.id);
+    // Completed effects are dropped together in a single store update
+    // rather than one removeEffect (and re-render) per effect
+    const cutoffTime = Date.now() - EFFECT_DURATION_MS;
+    for (let i = 0; i < effects.length; i++) {
+      if (effects[i].startTime < cutoffTime) {
+        removeExpiredEffects(cutoffTime);
+        break;
       }
-    });
-    
-    // Remove completed effects
-    effectsToRemove.forEach(effectId => {
-      removeEffect(effectId);
-    });
+    }
   });
 
   // Cleanup on unmount
@@ -4,6 +4,20 @@ import { useGameStore } from '../store/gameStore';
 import { useKeyboard } from '../hooks/useKeyboard';
 import * as THREE from 'three';
 
+// Fade and size curves over a particle's life, sampled once at module load so
+// the per-particle update is a table read instead of a Math.pow per frame
+const FLAME_MAX_LIFETIME = 0.4;
+const FLAME_CURVE_STEPS = 64;
+const FLAME_FADE = new Float32Array(FLAME_CURVE_STEPS + 1);
+const FLAME_SIZE = new Float32Array(FLAME_CURVE_STEPS + 1);
+for (let step = 0; step <= FLAME_CURVE_STEPS; step++) {
+  const lifetimeRatio = step / FLAME_CURVE_STEPS;
+  const fade = Math.sqrt(lifetimeRatio); // Square root for slower fade
+  FLAME_FADE[step] = fade;
+  // Size grows then shrinks
+  FLAME_SIZE[step] = lifetimeRatio < 0.3 ? lifetimeRatio / 0.3 : fade;
+}
+
 function EngineTrails() {
   const trailsRef = useRef();
   const playerPosition = useGameStore((state) => state.playerPosition);
@@ -45,7 +59,18 @@ function EngineTrails() {
       lifetimes.push(Math.random()); // Random initial lifetime
     }
     
-    return { positions, velocities, colors, sizes, lifetimes, count };
+    return {
+      positions,
+      velocities,
+      colors,
+      sizes,
+      lifetimes,
+      count,
+      // Attribute buffers are created once; re-renders reuse them
+      positionArray: new Float32Array(positions),
+      colorArray: new Float32Array(colors),
+      sizeArray: new Float32Array(sizes)
+    };
   }, []);
   
   useFrame((state, delta) => {
@@ -93,8 +118,9 @@ function EngineTrails() {
         }
         
         // Calculate fade based on lifetime - updated for shorter max lifetime
-        const lifetimeRatio = trailData.lifetimes[i] / 0.4;
-        const fade = Math.pow(lifetimeRatio, 0.5); // Square root for slower fade
+        const lifetimeRatio = trailData.lifetimes[i] / FLAME_MAX_LIFETIME;
+        const curveStep = Math.min(FLAME_CURVE_STEPS, (lifetimeRatio * FLAME_CURVE_STEPS) | 0);
+        const fade = FLAME_FADE[curveStep];
         
         // Orange/fiery colors with movement intensity
         const heat = 1.0 - lifetimeRatio; // Gets cooler as it ages
@@ -102,9 +128,7 @@ function EngineTrails() {
         colors[i3 + 1] = (0.4 + heat * 0.6) * fade * movementIntensity; // G: orange to yellow
         colors[i3 + 2] = heat * 0.1 * fade * movementIntensity;         // B: minimal blue for hot orange
         
-        // Size grows then shrinks
-        const sizeMultiplier = lifetimeRatio < 0.3 ? lifetimeRatio / 0.3 : fade;
-        sizes[i] = trailData.sizes[i] * sizeMultiplier * movementIntensity;
+        sizes[i] = trailData.sizes[i] * FLAME_SIZE[curveStep] * movementIntensity;
       }
       
       trailsRef.current.attributes.position.needsUpdate = true;
@@ -120,19 +144,19 @@ function EngineTrails() {
           <bufferAttribute
             attach="attributes-position"
             count={trailData.count}
-            array={new Float32Array(trailData.positions)}
+            array={trailData.positionArray}
             itemSize={3}
           />
           <bufferAttribute
             attach="attributes-color"
             count={trailData.count}
-            array={new Float32Array(trailData.colors)}
+            array={trailData.colorArray}
             itemSize={3}
           />
           <bufferAttribute
             attach="attributes-size"
             count={trailData.count}
-            array={new Float32Array(trailData.sizes)}
+            array={trailData.sizeArray}
             itemSize={1}
           />
         </bufferGeometry>
@@ -11,6 +11,95 @@ THREE.BufferGeometry.prototype.computeBoundsTree = computeBoundsTree;
 THREE.BufferGeometry.prototype.disposeBoundsTree = disposeBoundsTree;
 THREE.Mesh.prototype.raycast = acceleratedRaycast;
 
+// Procedural sprite textures are drawn and uploaded once and shared by every
+// Ground mount, instead of re-rasterizing a fresh canvas on each remount
+
+// Cloud texture for nebula
+let sharedCloudTexture = null;
+
+function getCloudTexture() {
+  if (sharedCloudTexture) return sharedCloudTexture;
+
+  const canvas = document.createElement('canvas');
+  canvas.width = 512;
+  canvas.height = 512;
+  const ctx = canvas.getContext('2d');
+  
+  const gradient = ctx.createRadialGradient(256, 256, 0, 256, 256, 256);
+  gradient.addColorStop(0, 'rgba(255,255,255,1)');
+  gradient.addColorStop(0.2, 'rgba(255,255,255,0.8)');
+  gradient.addColorStop(0.4, 'rgba(255,255,255,0.3)');
+  gradient.addColorStop(1, 'rgba(255,255,255,0)');
+  
+  ctx.fillStyle = gradient;
+  ctx.fillRect(0, 0, 512, 512);
+  
+  sharedCloudTexture = new THREE.CanvasTexture(canvas);
+  return sharedCloudTexture;
+}
+
+// Star texture for background blooms
+let sharedStarTexture = null;
+
+function getStarTexture() {
+  if (sharedStarTexture) return sharedStarTexture;
+
+  const canvas = document.createElement('canvas');
+  canvas.width = 256;
+  canvas.height = 256;
+  const ctx = canvas.getContext('2d');
+  
+  // Clear canvas
+  ctx.fillStyle = 'rgba(0,0,0,0)';
+  ctx.fillRect(0, 0, 256, 256);
+  
+  // Draw star with bright center and rays
+  const centerX = 128;
+  const centerY = 128;
+  
+  // Bright core
+  const coreGradient = ctx.createRadialGradient(centerX, centerY, 0, centerX, centerY, 20);
+  coreGradient.addColorStop(0, 'rgba(255,255,255,1)');
+  coreGradient.addColorStop(0.2, 'rgba(255,255,255,0.9)');
+  coreGradient.addColorStop(1, 'rgba(255,255,255,0)');
+  
+  ctx.fillStyle = coreGradient;
+  ctx.fillRect(0, 0, 256, 256);
+  
+  // Add star rays
+  ctx.strokeStyle = 'rgba(255,255,255,0.3)';
+  ctx.lineWidth = 2;
+  
+  // Horizontal ray
+  ctx.beginPath();
+  ctx.moveTo(0, centerY);
+  ctx.lineTo(256, centerY);
+  ctx.stroke();
+  
+  // Vertical ray
+  ctx.beginPath();
+  ctx.moveTo(centerX, 0);
+  ctx.lineTo(centerX, 256);
+  ctx.stroke();
+  
+  // Diagonal rays
+  ctx.strokeStyle = 'rgba(255,255,255,0.2)';
+  ctx.lineWidth = 1;
+  
+  ctx.beginPath();
+  ctx.moveTo(0, 0);
+  ctx.lineTo(256, 256);
+  ctx.stroke();
+  
+  ctx.beginPath();
+  ctx.moveTo(256, 0);
+  ctx.lineTo(0, 256);
+  ctx.stroke();
+  
+  sharedStarTexture = new THREE.CanvasTexture(canvas);
+  return sharedStarTexture;
+}
+
 function Ground({ 
   mode = 'asteroid-tunnel',
   showNebula = true,          // Toggle nebula particles
@@ -379,81 +468,9 @@ function Ground({
     return geometry;
   }, []);
   
-  // Create cloud texture for nebula
-  const cloudTexture = useMemo(() => {
-    const canvas = document.createElement('canvas');
-    canvas.width = 512;
-    canvas.height = 512;
-    const ctx = canvas.getContext('2d');
-    
-    const gradient = ctx.createRadialGradient(256, 256, 0, 256, 256, 256);
-    gradient.addColorStop(0, 'rgba(255,255,255,1)');
-    gradient.addColorStop(0.2, 'rgba(255,255,255,0.8)');
-    gradient.addColorStop(0.4, 'rgba(255,255,255,0.3)');
-    gradient.addColorStop(1, 'rgba(255,255,255,0)');
-    
-    ctx.fillStyle = gradient;
-    ctx.fillRect(0, 0, 512, 512);
-    
-    return new THREE.CanvasTexture(canvas);
-  }, []);
-  
-  // Create star texture for background blooms
-  const starTexture = useMemo(() => {
-    const canvas = document.createElement('canvas');
-    canvas.width = 256;
-    canvas.height = 256;
-    const ctx = canvas.getContext('2d');
-    
-    // Clear canvas
-    ctx.fillStyle = 'rgba(0,0,0,0)';
-    ctx.fillRect(0, 0, 256, 256);
-    
-    // Draw star with bright center and rays
-    const centerX = 128;
-    const centerY = 128;
-    
-    // Bright core
-    const coreGradient = ctx.createRadialGradient(centerX, centerY, 0, centerX, centerY, 20);
-    coreGradient.addColorStop(0, 'rgba(255,255,255,1)');
-    coreGradient.addColorStop(0.2, 'rgba(255,255,255,0.9)');
-    coreGradient.addColorStop(1, 'rgba(255,255,255,0)');
-    
-    ctx.fillStyle = coreGradient;
-    ctx.fillRect(0, 0, 256, 256);
-    
-    // Add star rays
-    ctx.strokeStyle = 'rgba(255,255,255,0.3)';
-    ctx.lineWidth = 2;
-    
-    // Horizontal ray
-    ctx.beginPath();
-    ctx.moveTo(0, centerY);
-    ctx.lineTo(256, centerY);
-    ctx.stroke();
-    
-    // Vertical ray
-    ctx.beginPath();
-    ctx.moveTo(centerX, 0);
-    ctx.lineTo(centerX, 256);
-    ctx.stroke();
-    
-    // Diagonal rays
-    ctx.strokeStyle = 'rgba(255,255,255,0.2)';
-    ctx.lineWidth = 1;
-    
-    ctx.beginPath();
-    ctx.moveTo(0, 0);
-    ctx.lineTo(256, 256);
-    ctx.stroke();
-    
-    ctx.beginPath();
-    ctx.moveTo(256, 0);
-    ctx.lineTo(0, 256);
-    ctx.stroke();
-    
-    return new THREE.CanvasTexture(canvas);
-  }, []);
+  // Shared procedural textures (see getCloudTexture/getStarTexture)
+  const cloudTexture = getCloudTexture();
+  const starTexture = getStarTexture();
   
   // Ubiquitous asteroid shader material (similar to nebula but for rocky asteroids)
   const ubiquitousAsteroidMaterial = useMemo(() => {
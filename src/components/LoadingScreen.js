@@ -5,6 +5,9 @@ import effectsPool from '../systems/EffectsPool';
 import asyncAssetManager from '../systems/AsyncAssetManager';
 import gpuPrecompiler from '../systems/GPUPrecompiler';
 
+// Pools and assets outlive a single game, so only the first load runs the pipeline
+let assetsPrepared = false;
+
 function LoadingScreen() {
   const gameState = useGameStore((state) => state.gameState);
   const setGameReady = useGameStore((state) => state.setGameReady);
@@ -24,6 +27,11 @@ function LoadingScreen() {
   useEffect(() => {
     if (gameState !== 'loading') return;
 
+    if (assetsPrepared) {
+      setGameReady();
+      return;
+    }
+
     const loadAssets = async () => {
       try {
         // Step 1: Load high-quality async assets first
@@ -113,6 +121,7 @@ function LoadingScreen() {
         await new Promise(resolve => setTimeout(resolve, 500));
         
         // Transition to playing state
+        assetsPrepared = true;
         setGameReady();
         
       } catch (error) {
@@ -1,7 +1,13 @@
 import React, { useRef, useState, useEffect, useMemo } from 'react';
 import { useFrame } from '@react-three/fiber';
+import * as THREE from 'three';
 import { useGameStore } from '../store/gameStore';
 
+// Fixed-size bolts share one geometry across every missile
+const LASER_GEOMETRY = new THREE.CylinderGeometry(0.05, 0.05, 6, 6);
+const DEFAULT_BOLT_GEOMETRY = new THREE.SphereGeometry(0.15, 6, 4);
+const NO_ROTATION = [0, 0, 0];
+
 // Memoize the missile component to prevent unnecessary re-renders
 const Missile = React.memo(function Missile({ missile }) {
   const meshRef = useRef();
@@ -28,18 +34,15 @@ const Missile = React.memo(function Missile({ missile }) {
     }
   }, [weaponType]);
   
+  // Rotation is fixed when the missile is fired, so it is resolved once and
+  // applied as a prop; the per-frame work is just the position copy
+  const groupRotation = useMemo(() => (
+    rotation ? [rotation.x || 0, rotation.y || 0, rotation.z || 0] : NO_ROTATION
+  ), [rotation]);
+  
   useFrame(() => {
     if (meshRef.current) {
-      meshRef.current.position.x = position.x;
-      meshRef.current.position.y = position.y;
-      meshRef.current.position.z = position.z;
-      
-      // Apply rotation if provided
-      if (rotation) {
-        meshRef.current.rotation.x = rotation.x || 0;
-        meshRef.current.rotation.y = rotation.y || 0;
-        meshRef.current.rotation.z = rotation.z || 0;
-      }
+      meshRef.current.position.copy(position);
     }
   });
   
@@ -48,8 +51,7 @@ const Missile = React.memo(function Missile({ missile }) {
       case 'laser':
         return (
           // Simplified to single mesh for performance
-          <mesh rotation={[Math.PI / 2, 0, 0]} renderOrder={15}>
-            <cylinderGeometry args={[0.05, 0.05, 6, 6]} />
+          <mesh rotation={[Math.PI / 2, 0, 0]} renderOrder={15} geometry={LASER_GEOMETRY}>
             <meshBasicMaterial color={color} transparent opacity={0.8} depthTest={false} />
           </mesh>
         );
@@ -236,8 +238,7 @@ const Missile = React.memo(function Missile({ missile }) {
       default:
         return (
           // Simplified to single mesh for performance
-          <mesh renderOrder={15}>
-            <sphereGeometry args={[0.15, 6, 4]} />
+          <mesh renderOrder={15} geometry={DEFAULT_BOLT_GEOMETRY}>
             <meshBasicMaterial color={color} depthTest={false} />
           </mesh>
         );
@@ -245,7 +246,7 @@ const Missile = React.memo(function Missile({ missile }) {
   };
 
   return (
-    <group ref={meshRef} renderOrder={15}>
+    <group ref={meshRef} rotation={groupRotation} renderOrder={15}>
       {renderProjectile()}
       
       {/* Collision circle for debugging - general collisions */}
@@ -3,143 +3,149 @@ import { useFrame, useThree } from '@react-three/fiber';
 import { useGameStore } from '../store/gameStore';
 import PooledMissile from './PooledMissile';
 import Missile from './Missile';
+import * as THREE from 'three';
 import weaponMeshPool from '../systems/WeaponMeshPool2';
 import gpuPrecompiler from '../systems/GPUPrecompiler';
 
-// Batched simple missile renderer - replaces individual Missile components
+// Max simple missiles drawn per batch (per weapon look)
+const SIMPLE_MISSILE_CAPACITY = 512;
+
+const getSimpleMissileColor = (missile) => missile.color || (missile.type === 'player' ? '#00ffff' : '#ff0000');
+
+// Publish this frame's instance count and flag the buffers for upload
+const commitInstances = (mesh, count) => {
+  mesh.count = count;
+  mesh.instanceMatrix.needsUpdate = true;
+  if (mesh.instanceColor) mesh.instanceColor.needsUpdate = true;
+};
+
+// Batched simple missile renderer - one InstancedMesh (one draw call) per
+// weapon look instead of a mesh + geometry + material per missile
 function SimpleMissileBatch({ missiles }) {
-  const meshRefs = useRef(new Map());
+  const laserRef = useRef();
+  const chaingunRef = useRef();
+  const defaultRef = useRef();
   const showCollisionCircles = useGameStore((state) => state.debug.showCollisionCircles);
   const showBlasterCollisions = useGameStore((state) => state.debug.showBlasterCollisions);
   
+  // Shared geometries: the laser bolt is pre-rotated to lie along Z, spheres
+  // are unit size and scaled per instance by missile size
+  const geometries = useMemo(() => ({
+    laser: new THREE.CylinderGeometry(0.05, 0.05, 6, 6).rotateX(Math.PI / 2),
+    chaingun: new THREE.SphereGeometry(1, 6, 4),
+    default: new THREE.SphereGeometry(1, 8, 6)
+  }), []);
+  
+  // Scratch objects reused for every instance write
+  const scratch = useMemo(() => ({
+    object: new THREE.Object3D(),
+    color: new THREE.Color()
+  }), []);
+  
+  useEffect(() => () => {
+    geometries.laser.dispose();
+    geometries.chaingun.dispose();
+    geometries.default.dispose();
+  }, [geometries]);
+  
   // Debug logging
   useEffect(() => {
     console.log(`[SIMPLE MISSILE BATCH] Rendering ${missiles.length} simple missiles`);
   }, [missiles.length]);
-  
-  // Debug logging for simple missile rendering
-  useEffect(() => {
-    console.log(`[SIMPLE MISSILE DEBUG] Rendering ${missiles.length} simple missiles`);
-    if (missiles.length > 0) {
-      console.log(`[SIMPLE MISSILE DEBUG] Missile IDs:`, missiles.map(m => m.id));
-    }
-  }, [missiles.length]);
 
-  // Single useFrame for ALL simple missiles (massive performance improvement)
+  // Single useFrame writes every simple missile into its batch
   useFrame(() => {
-    if (missiles.length === 0) return;
+    const laserMesh = laserRef.current;
+    const chaingunMesh = chaingunRef.current;
+    const defaultMesh = defaultRef.current;
+    if (!laserMesh || !chaingunMesh || !defaultMesh) return;
     
-    // Debug: Show optimization impact occasionally
-    if (missiles.length > 0) {
-      console.log(`[BATCH OPTIMIZATION] Updating ${missiles.length} simple missile positions in useFrame`);
-    }
+    const { object, color } = scratch;
+    let laserCount = 0;
+    let chaingunCount = 0;
+    let defaultCount = 0;
     
-    missiles.forEach(missile => {
-      const meshRef = meshRefs.current.get(missile.id);
-      if (meshRef?.current) {
-        // Batch position updates - single loop instead of N useFrame callbacks
-        meshRef.current.position.set(missile.position.x, missile.position.y, missile.position.z);
-        
-        // Debug first frame position
-        if (!meshRef.current.userData.loggedFirstPosition) {
-          console.log(`[MISSILE POSITION] First frame position for ${missile.id}:`, missile.position);
-          meshRef.current.userData.loggedFirstPosition = true;
-        }
-        
-        if (missile.rotation) {
-          meshRef.current.rotation.set(
-            missile.rotation.x || 0,
-            missile.rotation.y || 0, 
-            missile.rotation.z || 0
-          );
-        }
+    for (let i = 0; i < missiles.length; i++) {
+      const missile = missiles[i];
+      const position = missile.position;
+      if (!position || position.x === undefined || position.y === undefined || position.z === undefined) {
+        continue;
       }
-    });
-  });
-
-  // Clean up refs for removed missiles
-  useEffect(() => {
-    const currentMissileIds = new Set(missiles.map(m => m.id));
-    const existingIds = Array.from(meshRefs.current.keys());
-    
-    existingIds.forEach(id => {
-      if (!currentMissileIds.has(id)) {
-        meshRefs.current.delete(id);
+      
+      let mesh;
+      let index;
+      if (missile.weaponType === 'laser') {
+        if (laserCount === SIMPLE_MISSILE_CAPACITY) continue;
+        mesh = laserMesh;
+        index = laserCount++;
+        object.scale.set(1, 1, 1);
+      } else {
+        const size = missile.size || 0.2;
+        if (missile.weaponType === 'chaingun') {
+          if (chaingunCount === SIMPLE_MISSILE_CAPACITY) continue;
+          mesh = chaingunMesh;
+          index = chaingunCount++;
+        } else {
+          if (defaultCount === SIMPLE_MISSILE_CAPACITY) continue;
+          mesh = defaultMesh;
+          index = defaultCount++;
+        }
+        object.scale.set(size, size, size);
       }
-    });
-  }, [missiles]);
-
-  const renderMissile = (missile) => {
-    const { weaponType = 'default', size = 0.2, color: missileColor, type } = missile;
-    const color = missileColor || (type === 'player' ? '#00ffff' : '#ff0000');
-    const projectileSize = size;
-    
-    // Debug log individual missile render
-    if (!missile.position || missile.position.x === undefined || missile.position.y === undefined || missile.position.z === undefined) {
-      console.error(`[SIMPLE MISSILE BATCH] Invalid missile position:`, missile);
-      return null;
-    }
-
-    // Create ref if doesn't exist
-    if (!meshRefs.current.has(missile.id)) {
-      meshRefs.current.set(missile.id, React.createRef());
-    }
-    const meshRef = meshRefs.current.get(missile.id);
-
-    switch (weaponType) {
-      case 'laser':
-        return (
-          <group key={missile.id} ref={meshRef}>
-            <mesh rotation={[Math.PI / 2, 0, 0]} renderOrder={15}>
-              <cylinderGeometry args={[0.05, 0.05, 6, 6]} />
-              <meshBasicMaterial color={color} transparent opacity={0.8} depthTest={false} />
-            </mesh>
-            {showBlasterCollisions && (
-              <mesh>
-                <sphereGeometry args={[projectileSize, 8, 6]} />
-                <meshBasicMaterial color="#ff0000" wireframe transparent opacity={0.3} />
-              </mesh>
-            )}
-          </group>
-        );
       
-      case 'chaingun':
-        return (
-          <group key={missile.id} ref={meshRef}>
-            <mesh renderOrder={15}>
-              <sphereGeometry args={[projectileSize, 6, 4]} />
-              <meshBasicMaterial color={color} depthTest={false} />
-            </mesh>
-            {showCollisionCircles && (
-              <mesh>
-                <sphereGeometry args={[projectileSize, 8, 6]} />
-                <meshBasicMaterial color="#00ff00" wireframe transparent opacity={0.3} />
-              </mesh>
-            )}
-          </group>
+      object.position.set(position.x, position.y, position.z);
+      if (missile.rotation) {
+        object.rotation.set(
+          missile.rotation.x || 0,
+          missile.rotation.y || 0,
+          missile.rotation.z || 0
         );
+      } else {
+        object.rotation.set(0, 0, 0);
+      }
+      object.updateMatrix();
+      mesh.setMatrixAt(index, object.matrix);
+      mesh.setColorAt(index, color.set(getSimpleMissileColor(missile)));
+    }
+    
+    commitInstances(laserMesh, laserCount);
+    commitInstances(chaingunMesh, chaingunCount);
+    commitInstances(defaultMesh, defaultCount);
+  });
 
-      default: // Simple sphere for default missiles
-        return (
-          <group key={missile.id} ref={meshRef}>
-            <mesh renderOrder={15}>
-              <sphereGeometry args={[projectileSize, 8, 6]} />
-              <meshBasicMaterial color={color} />
-            </mesh>
-            {showCollisionCircles && (
-              <mesh>
-                <sphereGeometry args={[projectileSize, 8, 6]} />
-                <meshBasicMaterial color="#ffffff" wireframe transparent opacity={0.3} />
-              </mesh>
-            )}
-          </group>
-        );
+  // Debug collision spheres are rare, so they stay as plain meshes
+  const renderCollisionSphere = (missile) => {
+    const { weaponType = 'default', size = 0.2, position } = missile;
+    if (!position) return null;
+    
+    let debugColor = null;
+    if (weaponType === 'laser') {
+      if (showBlasterCollisions) debugColor = '#ff0000';
+    } else if (showCollisionCircles) {
+      debugColor = weaponType === 'chaingun' ? '#00ff00' : '#ffffff';
     }
+    if (!debugColor) return null;
+    
+    return (
+      <mesh key={missile.id} position={[position.x, position.y, position.z]}>
+        <sphereGeometry args={[size, 8, 6]} />
+        <meshBasicMaterial color={debugColor} wireframe transparent opacity={0.3} />
+      </mesh>
+    );
   };
 
   return (
     <>
-      {missiles.map(missile => renderMissile(missile))}
+      <instancedMesh ref={laserRef} args={[geometries.laser, undefined, SIMPLE_MISSILE_CAPACITY]} count={0} renderOrder={15} frustumCulled={false}>
+        <meshBasicMaterial transparent opacity={0.8} depthTest={false} />
+      </instancedMesh>
+      <instancedMesh ref={chaingunRef} args={[geometries.chaingun, undefined, SIMPLE_MISSILE_CAPACITY]} count={0} renderOrder={15} frustumCulled={false}>
+        <meshBasicMaterial depthTest={false} />
+      </instancedMesh>
+      <instancedMesh ref={defaultRef} args={[geometries.default, undefined, SIMPLE_MISSILE_CAPACITY]} count={0} renderOrder={15} frustumCulled={false}>
+        <meshBasicMaterial />
+      </instancedMesh>
+      {(showCollisionCircles || showBlasterCollisions) && missiles.map(renderCollisionSphere)}
     </>
   );
 }
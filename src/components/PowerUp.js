@@ -4,6 +4,35 @@ import * as THREE from 'three';
 import { useGameStore } from '../store/gameStore';
 // Removed unused GameSpace imports
 import { UnifiedGamespace } from '../config/UnifiedGamespace';
+import { fastSin } from '../utils/trigTables';
+
+// Constant element offsets for the power-up models, built once instead of per render
+const SLOW_TIME_LOWER_CONE_ROTATION = [0, 0, Math.PI];
+const SPEED_RING_ROTATIONS = [[Math.PI / 2, 0, 0], [0, Math.PI / 2, 0], [0, 0, 0]];
+const ORBITAL_ELEMENT_ANGLES = [0, Math.PI / 2, Math.PI, 3 * Math.PI / 2];
+
+// Power-up part geometries are shared across every power-up instance and
+// render, keyed by kind and constructor args, instead of one per mesh
+const GEOMETRY_TYPES = {
+  box: THREE.BoxGeometry,
+  cone: THREE.ConeGeometry,
+  dodecahedron: THREE.DodecahedronGeometry,
+  octahedron: THREE.OctahedronGeometry,
+  ring: THREE.RingGeometry,
+  sphere: THREE.SphereGeometry,
+  torus: THREE.TorusGeometry
+};
+const geometryCache = new Map();
+
+function sharedGeometry(kind, ...args) {
+  const key = `${kind}:${args.join(',')}`;
+  let geometry = geometryCache.get(key);
+  if (!geometry) {
+    geometry = new GEOMETRY_TYPES[kind](...args);
+    geometryCache.set(key, geometry);
+  }
+  return geometry;
+}
 
 function PowerUp({ powerUp }) {
   const meshRef = useRef();
@@ -16,31 +45,30 @@ function PowerUp({ powerUp }) {
   const gameMode = useGameStore((state) => state.gameMode);
   
   const getPowerUpAppearance = () => {
+    // One clock read per render shared by all animated elements below
+    const now = Date.now();
     switch (type) {
       case 'shield':
         return {
-          geometry: <torusGeometry args={[0.4, 0.2, 8, 16]} />,
+          geometry: sharedGeometry('torus', 0.4, 0.2, 8, 16),
           color: '#00ffff',
           rotationSpeed: 2,
         };
       
       case 'rapidFire':
         return {
-          geometry: <boxGeometry args={[0.1, 0.6, 0.1]} />,
+          geometry: sharedGeometry('box', 0.1, 0.6, 0.1),
           color: '#ffff00',
           rotationSpeed: 3,
           customMesh: (
             <group>
-              <mesh>
-                <boxGeometry args={[0.1, 0.6, 0.1]} />
+              <mesh geometry={sharedGeometry('box', 0.1, 0.6, 0.1)}>
                 <meshStandardMaterial color="#ffff00" emissive="#ffff00" emissiveIntensity={0.5} />
               </mesh>
-              <mesh position={[-0.2, 0, 0]}>
-                <boxGeometry args={[0.1, 0.6, 0.1]} />
+              <mesh position={[-0.2, 0, 0]} geometry={sharedGeometry('box', 0.1, 0.6, 0.1)}>
                 <meshStandardMaterial color="#ffff00" emissive="#ffff00" emissiveIntensity={0.5} />
               </mesh>
-              <mesh position={[0.2, 0, 0]}>
-                <boxGeometry args={[0.1, 0.6, 0.1]} />
+              <mesh position={[0.2, 0, 0]} geometry={sharedGeometry('box', 0.1, 0.6, 0.1)}>
                 <meshStandardMaterial color="#ffff00" emissive="#ffff00" emissiveIntensity={0.5} />
               </mesh>
             </group>
@@ -49,21 +77,18 @@ function PowerUp({ powerUp }) {
       
       case 'multiShot':
         return {
-          geometry: <boxGeometry args={[0.8, 0.1, 0.1]} />,
+          geometry: sharedGeometry('box', 0.8, 0.1, 0.1),
           color: '#00ff00',
           rotationSpeed: 1.5,
           customMesh: (
             <group>
-              <mesh>
-                <boxGeometry args={[0.8, 0.1, 0.1]} />
+              <mesh geometry={sharedGeometry('box', 0.8, 0.1, 0.1)}>
                 <meshStandardMaterial color="#00ff00" emissive="#00ff00" emissiveIntensity={0.5} />
               </mesh>
-              <mesh position={[0, 0.3, 0]}>
-                <boxGeometry args={[0.8, 0.1, 0.1]} />
+              <mesh position={[0, 0.3, 0]} geometry={sharedGeometry('box', 0.8, 0.1, 0.1)}>
                 <meshStandardMaterial color="#00ff00" emissive="#00ff00" emissiveIntensity={0.5} />
               </mesh>
-              <mesh position={[0, -0.3, 0]}>
-                <boxGeometry args={[0.8, 0.1, 0.1]} />
+              <mesh position={[0, -0.3, 0]} geometry={sharedGeometry('box', 0.8, 0.1, 0.1)}>
                 <meshStandardMaterial color="#00ff00" emissive="#00ff00" emissiveIntensity={0.5} />
               </mesh>
             </group>
@@ -72,17 +97,15 @@ function PowerUp({ powerUp }) {
       
       case 'extraLife':
         return {
-          geometry: <sphereGeometry args={[0.4, 8, 8]} />,
+          geometry: sharedGeometry('sphere', 0.4, 8, 8),
           color: '#ff0000',
           rotationSpeed: 1,
           customMesh: (
             <group>
-              <mesh scale={[1, 1.2, 0.8]}>
-                <sphereGeometry args={[0.3, 8, 8]} />
+              <mesh scale={[1, 1.2, 0.8]} geometry={sharedGeometry('sphere', 0.3, 8, 8)}>
                 <meshStandardMaterial color="#ff0000" emissive="#ff0000" emissiveIntensity={0.5} />
               </mesh>
-              <mesh scale={[1.2, 1, 0.8]}>
-                <sphereGeometry args={[0.3, 8, 8]} />
+              <mesh scale={[1.2, 1, 0.8]} geometry={sharedGeometry('sphere', 0.3, 8, 8)}>
                 <meshStandardMaterial color="#ff0000" emissive="#ff0000" emissiveIntensity={0.5} />
               </mesh>
             </group>
@@ -91,17 +114,15 @@ function PowerUp({ powerUp }) {
       
       case 'slowTime':
         return {
-          geometry: <coneGeometry args={[0.4, 0.4, 6]} />,
+          geometry: sharedGeometry('cone', 0.4, 0.4, 6),
           color: '#ff00ff',
           rotationSpeed: 0.5,
           customMesh: (
             <group>
-              <mesh position={[0, 0.2, 0]}>
-                <coneGeometry args={[0.4, 0.4, 6]} />
+              <mesh position={[0, 0.2, 0]} geometry={sharedGeometry('cone', 0.4, 0.4, 6)}>
                 <meshStandardMaterial color="#ff00ff" emissive="#ff00ff" emissiveIntensity={0.5} />
               </mesh>
-              <mesh position={[0, -0.2, 0]} rotation={[0, 0, Math.PI]}>
-                <coneGeometry args={[0.4, 0.4, 6]} />
+              <mesh position={[0, -0.2, 0]} rotation={SLOW_TIME_LOWER_CONE_ROTATION} geometry={sharedGeometry('cone', 0.4, 0.4, 6)}>
                 <meshStandardMaterial color="#ff00ff" emissive="#ff00ff" emissiveIntensity={0.5} />
               </mesh>
             </group>
@@ -110,44 +131,35 @@ function PowerUp({ powerUp }) {
       
       case 'responsiveness':
         return {
-          geometry: <dodecahedronGeometry args={[0.4]} />,
+          geometry: sharedGeometry('dodecahedron', 0.4),
           color: '#00ffaa',
           rotationSpeed: 3,
           customMesh: (
             <group>
               {/* Main body - fast spinning dodecahedron */}
-              <mesh>
-                <dodecahedronGeometry args={[0.4]} />
+              <mesh geometry={sharedGeometry('dodecahedron', 0.4)}>
                 <meshStandardMaterial color="#00ffaa" emissive="#00ffaa" emissiveIntensity={0.6} />
               </mesh>
               
               {/* Speed trail rings */}
-              <mesh rotation={[Math.PI / 2, 0, 0]}>
-                <torusGeometry args={[0.6, 0.03, 8, 16]} />
-                <meshStandardMaterial color="#ffffff" transparent opacity={0.4} />
-              </mesh>
-              <mesh rotation={[0, Math.PI / 2, 0]}>
-                <torusGeometry args={[0.6, 0.03, 8, 16]} />
-                <meshStandardMaterial color="#ffffff" transparent opacity={0.4} />
-              </mesh>
-              <mesh rotation={[0, 0, 0]}>
-                <torusGeometry args={[0.6, 0.03, 8, 16]} />
-                <meshStandardMaterial color="#ffffff" transparent opacity={0.4} />
-              </mesh>
+              {SPEED_RING_ROTATIONS.map((rotation, index) => (
+                <mesh key={index} rotation={rotation} geometry={sharedGeometry('torus', 0.6, 0.03, 8, 16)}>
+                  <meshStandardMaterial color="#ffffff" transparent opacity={0.4} />
+                </mesh>
+              ))}
             </group>
           ),
         };
       
       case 'stealth':
         return {
-          geometry: <octahedronGeometry args={[0.4]} />,
+          geometry: sharedGeometry('octahedron', 0.4),
           color: '#4400aa',
           rotationSpeed: 1.5,
           customMesh: (
             <group>
               {/* Main body - semi-transparent octahedron */}
-              <mesh>
-                <octahedronGeometry args={[0.4]} />
+              <mesh geometry={sharedGeometry('octahedron', 0.4)}>
                 <meshStandardMaterial 
                   color="#4400aa" 
                   emissive="#4400aa" 
@@ -158,23 +170,20 @@ function PowerUp({ powerUp }) {
               </mesh>
               
               {/* Stealth shimmer effect */}
-              <mesh>
-                <sphereGeometry args={[0.6, 8, 6]} />
+              <mesh geometry={sharedGeometry('sphere', 0.6, 8, 6)}>
                 <meshStandardMaterial 
                   color="#ffffff" 
                   transparent 
-                  opacity={0.1 + Math.sin(Date.now() * 0.005) * 0.1}
+                  opacity={0.1 + fastSin(now * 0.005) * 0.1}
                   wireframe
                 />
               </mesh>
               
               {/* Cloaking field rings */}
-              <mesh rotation={[0, Date.now() * 0.001, 0]}>
-                <torusGeometry args={[0.8, 0.02, 6, 12]} />
+              <mesh rotation={[0, now * 0.001, 0]} geometry={sharedGeometry('torus', 0.8, 0.02, 6, 12)}>
                 <meshStandardMaterial color="#4400aa" transparent opacity={0.3} />
               </mesh>
-              <mesh rotation={[Math.PI / 3, Date.now() * -0.001, 0]}>
-                <torusGeometry args={[0.7, 0.02, 6, 12]} />
+              <mesh rotation={[Math.PI / 3, now * -0.001, 0]} geometry={sharedGeometry('torus', 0.7, 0.02, 6, 12)}>
                 <meshStandardMaterial color="#4400aa" transparent opacity={0.3} />
               </mesh>
             </group>
@@ -184,23 +193,20 @@ function PowerUp({ powerUp }) {
       
       case 'wingmen':
         return {
-          geometry: <boxGeometry args={[0.6, 0.6, 0.6]} />,
+          geometry: sharedGeometry('box', 0.6, 0.6, 0.6),
           color: '#ffffff',
           rotationSpeed: 2,
           customMesh: (
             <group>
               {/* Two small ship icons */}
-              <mesh position={[-0.3, 0, 0]} scale={[0.5, 0.5, 0.5]}>
-                <boxGeometry args={[0.3, 0.2, 0.6]} />
+              <mesh position={[-0.3, 0, 0]} scale={[0.5, 0.5, 0.5]} geometry={sharedGeometry('box', 0.3, 0.2, 0.6)}>
                 <meshStandardMaterial color="#ffffff" emissive="#ffffff" emissiveIntensity={0.5} />
               </mesh>
-              <mesh position={[0.3, 0, 0]} scale={[0.5, 0.5, 0.5]}>
-                <boxGeometry args={[0.3, 0.2, 0.6]} />
+              <mesh position={[0.3, 0, 0]} scale={[0.5, 0.5, 0.5]} geometry={sharedGeometry('box', 0.3, 0.2, 0.6)}>
                 <meshStandardMaterial color="#ffffff" emissive="#ffffff" emissiveIntensity={0.5} />
               </mesh>
               {/* Connection between them */}
-              <mesh>
-                <boxGeometry args={[0.8, 0.05, 0.05]} />
+              <mesh geometry={sharedGeometry('box', 0.8, 0.05, 0.05)}>
                 <meshStandardMaterial color="#00ffff" emissive="#00ffff" emissiveIntensity={0.8} />
               </mesh>
             </group>
@@ -209,23 +215,20 @@ function PowerUp({ powerUp }) {
       
       case 'weaponBoost':
         return {
-          geometry: <boxGeometry args={[0.5, 0.5, 0.5]} />,
+          geometry: sharedGeometry('box', 0.5, 0.5, 0.5),
           color: '#ff00ff',
           rotationSpeed: 3,
           customMesh: (
             <group>
               {/* Central crystal */}
-              <mesh>
-                <octahedronGeometry args={[0.4, 0]} />
+              <mesh geometry={sharedGeometry('octahedron', 0.4, 0)}>
                 <meshStandardMaterial color="#ff00ff" emissive="#ff00ff" emissiveIntensity={0.8} />
               </mesh>
               {/* Orbiting energy rings */}
-              <mesh rotation={[0, 0, Math.PI / 4]}>
-                <torusGeometry args={[0.6, 0.05, 8, 16]} />
+              <mesh rotation={[0, 0, Math.PI / 4]} geometry={sharedGeometry('torus', 0.6, 0.05, 8, 16)}>
                 <meshStandardMaterial color="#ffff00" emissive="#ffff00" emissiveIntensity={0.6} />
               </mesh>
-              <mesh rotation={[Math.PI / 2, 0, 0]}>
-                <torusGeometry args={[0.5, 0.03, 8, 16]} />
+              <mesh rotation={[Math.PI / 2, 0, 0]} geometry={sharedGeometry('torus', 0.5, 0.03, 8, 16)}>
                 <meshStandardMaterial color="#00ffff" emissive="#00ffff" emissiveIntensity={0.6} />
               </mesh>
             </group>
@@ -234,41 +237,36 @@ function PowerUp({ powerUp }) {
       
       case 'homingWeapons':
         return {
-          geometry: <coneGeometry args={[0.4, 0.8, 6]} />,
+          geometry: sharedGeometry('cone', 0.4, 0.8, 6),
           color: '#ff8800',
           rotationSpeed: 3,
           customMesh: (
             <group>
               {/* Main homing missile shape */}
-              <mesh>
-                <coneGeometry args={[0.4, 0.8, 6]} />
+              <mesh geometry={sharedGeometry('cone', 0.4, 0.8, 6)}>
                 <meshStandardMaterial color="#ff8800" emissive="#ff4400" emissiveIntensity={0.6} />
               </mesh>
               
               {/* Tracking rings */}
-              <mesh position={[0, 0.2, 0]}>
-                <torusGeometry args={[0.5, 0.05, 8, 16]} />
+              <mesh position={[0, 0.2, 0]} geometry={sharedGeometry('torus', 0.5, 0.05, 8, 16)}>
                 <meshStandardMaterial color="#ffff00" emissive="#ffff00" emissiveIntensity={0.8} />
               </mesh>
-              <mesh position={[0, -0.2, 0]}>
-                <torusGeometry args={[0.6, 0.05, 8, 16]} />
+              <mesh position={[0, -0.2, 0]} geometry={sharedGeometry('torus', 0.6, 0.05, 8, 16)}>
                 <meshStandardMaterial color="#ffff00" emissive="#ffff00" emissiveIntensity={0.8} />
               </mesh>
               
               {/* Pulsing center core */}
-              <mesh>
-                <sphereGeometry args={[0.15, 8, 6]} />
+              <mesh geometry={sharedGeometry('sphere', 0.15, 8, 6)}>
                 <meshStandardMaterial 
                   color="#ffffff" 
                   emissive="#ffffff" 
-                  emissiveIntensity={0.5 + Math.sin(Date.now() * 0.01) * 0.3}
+                  emissiveIntensity={0.5 + fastSin(now * 0.01) * 0.3}
                 />
               </mesh>
               
               {/* Orbital tracking elements */}
-              {[0, Math.PI/2, Math.PI, 3*Math.PI/2].map((rotation, index) => (
-                <mesh key={index} rotation={[0, rotation + Date.now() * 0.005, 0]} position={[0.7, 0, 0]}>
-                  <sphereGeometry args={[0.05, 4, 4]} />
+              {ORBITAL_ELEMENT_ANGLES.map((rotation, index) => (
+                <mesh key={index} rotation={[0, rotation + now * 0.005, 0]} position={[0.7, 0, 0]} geometry={sharedGeometry('sphere', 0.05, 4, 4)}>
                   <meshStandardMaterial color="#ff0000" emissive="#ff0000" emissiveIntensity={0.8} />
                 </mesh>
               ))}
@@ -278,7 +276,7 @@ function PowerUp({ powerUp }) {
       
       default:
         return {
-          geometry: <boxGeometry args={[0.5, 0.5, 0.5]} />,
+          geometry: sharedGeometry('box', 0.5, 0.5, 0.5),
           color: '#ffffff',
           rotationSpeed: 1,
         };
@@ -294,15 +292,17 @@ function PowerUp({ powerUp }) {
       meshRef.current.position.z = position.z;
       
       meshRef.current.rotation.y += rotationSpeed * delta;
-      meshRef.current.rotation.z = Math.sin(state.clock.elapsedTime * 2) * 0.2;
+      meshRef.current.rotation.z = fastSin(state.clock.elapsedTime * 2) * 0.2;
       
       // Add attraction toward player (20% faster)
       const attractionSpeed = 8.0; // Attraction strength
       const attractDx = playerPosition.x - position.x;
       const attractDy = playerPosition.y - position.y;
-      const attractDistance = Math.sqrt(attractDx * attractDx + attractDy * attractDy);
+      const attractDistanceSquared = attractDx * attractDx + attractDy * attractDy;
       
-      if (attractDistance > 0 && attractDistance < 15) { // Start attracting when close
+      // Squared-range test first; the sqrt is only needed inside the range
+      if (attractDistanceSquared > 0 && attractDistanceSquared < 225) { // Start attracting when close (15 units)
+        const attractDistance = Math.sqrt(attractDistanceSquared);
         const attractionForce = Math.min(1, 5 / attractDistance); // Stronger when closer
         velocity.x += (attractDx / attractDistance) * attractionSpeed * delta * attractionForce;
         velocity.y += (attractDy / attractDistance) * attractionSpeed * delta * attractionForce;
@@ -321,9 +321,8 @@ function PowerUp({ powerUp }) {
       
       const dx = position.x - playerPosition.x;
       const dy = position.y - playerPosition.y;
-      const distance = Math.sqrt(dx * dx + dy * dy);
       
-      if (distance < 1.3) { // Adjusted for 10% larger player ship
+      if (dx * dx + dy * dy < 1.69) { // 1.3 * 1.3 - adjusted for 10% larger player ship
         // This component only handles modifier powerups, not weapons
         activatePowerUp(type);
         removePowerUp(id);
@@ -348,8 +347,7 @@ function PowerUp({ powerUp }) {
   return (
     <group ref={meshRef}>
       {customMesh || (
-        <mesh>
-          {geometry}
+        <mesh geometry={geometry}>
           <meshStandardMaterial 
             color={color} 
             emissive={color} 
@@ -367,8 +365,7 @@ function PowerUp({ powerUp }) {
         distance={3}
       />
       
-      <mesh scale={[1.5, 1.5, 1.5]}>
-        <ringGeometry args={[0.6, 0.7, 32]} />
+      <mesh scale={[1.5, 1.5, 1.5]} geometry={sharedGeometry('ring', 0.6, 0.7, 32)}>
         <meshBasicMaterial 
           color={color} 
           transparent 
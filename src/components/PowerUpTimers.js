@@ -1,42 +1,65 @@
 import React, { useState, useEffect } from 'react';
 import { useGameStore } from '../store/gameStore';
 
+const POWERUP_DURATION = 20000; // 20 seconds
+
+// Timed power-ups shown in the panel, in display order
+const TIMED_POWERUPS = [
+  { type: 'rapidFire', icon: '⚡', name: 'Rapid Fire', color: '#ffff00' },
+  { type: 'multiShot', icon: '🔫', name: 'Multi Shot', color: '#00ff00' },
+  { type: 'slowTime', icon: '⏰', name: 'Slow Time', color: '#ff00ff' },
+  { type: 'responsiveness', icon: '🚀', name: 'Responsive', color: '#00aaff' },
+];
+
+const getTimeRemaining = (startTime, now) => {
+  if (!startTime) return 0;
+  // Clamped at both ends so a tick time older than the pickup still reads
+  // as the full duration
+  const elapsed = now - startTime;
+  const remaining = Math.min(POWERUP_DURATION, Math.max(0, POWERUP_DURATION - elapsed));
+  return Math.ceil(remaining / 1000); // Convert to seconds
+};
+
+// True when any active timer would display a different whole second at
+// `now` than at `previousTime`
+const hasDisplayChanged = (previousTime, now) => {
+  const { playerPowerUps, powerUpTimers } = useGameStore.getState();
+  for (let i = 0; i < TIMED_POWERUPS.length; i++) {
+    const type = TIMED_POWERUPS[i].type;
+    if (playerPowerUps[type] &&
+        getTimeRemaining(powerUpTimers[type], previousTime) !== getTimeRemaining(powerUpTimers[type], now)) {
+      return true;
+    }
+  }
+  return false;
+};
+
 function PowerUpTimers() {
   const playerPowerUps = useGameStore((state) => state.playerPowerUps);
   const powerUpTimers = useGameStore((state) => state.powerUpTimers);
   const shieldLevel = useGameStore((state) => state.shieldLevel);
   const [currentTime, setCurrentTime] = useState(Date.now());
-  
+
+  const activePowerUps = TIMED_POWERUPS.filter(p => playerPowerUps[p.type]);
+  const hasTimedPowerUp = activePowerUps.length > 0;
+
   useEffect(() => {
+    // Nothing to count down without a timed power-up
+    if (!hasTimedPowerUp) return undefined;
+
+    // Poll every 100ms, but only re-render when a displayed second changes
     const interval = setInterval(() => {
-      setCurrentTime(Date.now());
-    }, 100); // Update every 100ms
-    
+      const now = Date.now();
+      setCurrentTime((previousTime) => (hasDisplayChanged(previousTime, now) ? now : previousTime));
+    }, 100);
+
     return () => clearInterval(interval);
-  }, []);
-  
-  const POWERUP_DURATION = 20000; // 20 seconds
-  
-  const getTimeRemaining = (startTime) => {
-    if (!startTime) return 0;
-    const elapsed = currentTime - startTime;
-    const remaining = Math.max(0, POWERUP_DURATION - elapsed);
-    return Math.ceil(remaining / 1000); // Convert to seconds
-  };
-  
-  const powerUps = [
-    { type: 'rapidFire', icon: '⚡', name: 'Rapid Fire', color: '#ffff00' },
-    { type: 'multiShot', icon: '🔫', name: 'Multi Shot', color: '#00ff00' },
-    { type: 'slowTime', icon: '⏰', name: 'Slow Time', color: '#ff00ff' },
-    { type: 'responsiveness', icon: '🚀', name: 'Responsive', color: '#00aaff' },
-  ];
-  
-  const activePowerUps = powerUps.filter(p => playerPowerUps[p.type]);
-  
-  if (activePowerUps.length === 0 && !playerPowerUps.shield) {
+  }, [hasTimedPowerUp]);
+
+  if (!hasTimedPowerUp && !playerPowerUps.shield) {
     return null;
   }
-  
+
   return (
     <div className="powerup-timers">
       {playerPowerUps.shield && (
@@ -47,7 +70,7 @@ function PowerUpTimers() {
         </div>
       )}
       {activePowerUps.map(powerUp => {
-        const timeRemaining = getTimeRemaining(powerUpTimers[powerUp.type]);
+        const timeRemaining = getTimeRemaining(powerUpTimers[powerUp.type], currentTime);
         return (
           <div key={powerUp.type} className="powerup-timer" style={{ color: powerUp.color }}>
             <span className="timer-icon">{powerUp.icon}</span>
@@ -60,4 +83,4 @@ function PowerUpTimers() {
   );
 }
 
-export default PowerUpTimers;
\ No newline at end of file
+export default React.memo(PowerUpTimers);
@@ -5,6 +5,18 @@ import { useGameStore } from '../store/gameStore';
 // Removed unused GameSpace imports - using UnifiedGamespace instead
 import { UnifiedGamespace } from '../config/UnifiedGamespace';
 
+// Level-based powerup availability, built once (index = level - 1; later
+// levels use the last table)
+const POWERUP_TYPES_BY_LEVEL = [
+  ['shield', 'multiShot', 'laser', 'extraLife'],
+  ['shield', 'rapidFire', 'multiShot', 'extraLife', 'slowTime', 'laser', 'chaingun', 'responsiveness'],
+  ['shield', 'rapidFire', 'multiShot', 'extraLife', 'slowTime', 'laser', 'chaingun', 'rocketAmmo', 'railgunAmmo', 'wingmen', 'weaponBoost', 'responsiveness'],
+  ['shield', 'rapidFire', 'multiShot', 'extraLife', 'slowTime', 'laser', 'chaingun', 'bfg', 'rocketAmmo', 'railgunAmmo', 'wingmen', 'weaponBoost', 'responsiveness', 'stealth']
+];
+
+const getPowerUpTypes = (level) =>
+  POWERUP_TYPES_BY_LEVEL[level - 1] || POWERUP_TYPES_BY_LEVEL[POWERUP_TYPES_BY_LEVEL.length - 1];
+
 function PowerUps() {
   const powerUps = useGameStore((state) => state.powerUps);
   const addPowerUp = useGameStore((state) => state.addPowerUp);
@@ -17,25 +29,7 @@ function PowerUps() {
     
     const spawnInterval = setInterval(() => {
       if (Math.random() < 0.3) {
-        // Level-based powerup availability
-        let availableTypes = [];
-        
-        switch (level) {
-          case 1:
-            availableTypes = ['shield', 'multiShot', 'laser', 'extraLife'];
-            break;
-          case 2:
-            availableTypes = ['shield', 'rapidFire', 'multiShot', 'extraLife', 'slowTime', 'laser', 'chaingun', 'responsiveness'];
-            break;
-          case 3:
-            availableTypes = ['shield', 'rapidFire', 'multiShot', 'extraLife', 'slowTime', 'laser', 'chaingun', 'rocketAmmo', 'railgunAmmo', 'wingmen', 'weaponBoost', 'responsiveness'];
-            break;
-          case 4:
-          default:
-            availableTypes = ['shield', 'rapidFire', 'multiShot', 'extraLife', 'slowTime', 'laser', 'chaingun', 'bfg', 'rocketAmmo', 'railgunAmmo', 'wingmen', 'weaponBoost', 'responsiveness', 'stealth'];
-            break;
-        }
-        
+        const availableTypes = getPowerUpTypes(level);
         const type = availableTypes[Math.floor(Math.random() * availableTypes.length)];
         
         // Use unified spawning system - spawn closer to player than aliens
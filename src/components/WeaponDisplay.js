@@ -84,4 +84,4 @@ function WeaponDisplay() {
   );
 }
 
-export default WeaponDisplay;
\ No newline at end of file
+export default React.memo(WeaponDisplay);
\ No newline at end of file
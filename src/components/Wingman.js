@@ -3,6 +3,9 @@ import { useFrame } from '@react-three/fiber';
 import { useGameStore } from '../store/gameStore';
 import * as THREE from 'three';
 
+// Seconds between wingman shots
+const WINGMAN_FIRE_INTERVAL = 0.5;
+
 function Wingman({ wingman }) {
   const meshRef = useRef();
   const addMissile = useGameStore((state) => state.addMissile);
@@ -11,7 +14,8 @@ function Wingman({ wingman }) {
   const playerPosition = useGameStore((state) => state.playerPosition);
   const removeWingman = useGameStore((state) => state.removeWingman);
   
-  const lastFireTime = useRef(0);
+  // Counts down by frame delta like `wingman.lifetime`; fire when it reaches 0
+  const fireCooldown = useRef(0);
   
   useFrame((state, delta) => {
     if (!meshRef.current) return;
@@ -58,6 +62,9 @@ function Wingman({ wingman }) {
     
     // Handle lifetime
     wingman.lifetime -= delta;
+    if (fireCooldown.current > 0) {
+      fireCooldown.current -= delta;
+    }
     if (wingman.lifetime <= 0) {
       // Time to fly away
       wingman.isLeaving = true;
@@ -73,8 +80,9 @@ function Wingman({ wingman }) {
         removeWingman(wingman.id);
         return;
       }
-    } else {
-      // Combat behavior - find nearest target (alien or asteroid)
+    } else if (fireCooldown.current <= 0) {
+      // Combat behavior - find nearest target (alien or asteroid).
+      // Skipped entirely while the gun is cooling down.
       let nearestTarget = null;
       let nearestDistance = Infinity;
       let targetType = null;
@@ -113,8 +121,7 @@ function Wingman({ wingman }) {
       });
       
       // Fire at nearest target (only if within 135 degree cone in front)
-      const now = Date.now();
-      if (nearestTarget && now - lastFireTime.current > 500) { // Fire every 0.5 seconds
+      if (nearestTarget) {
         // Calculate direction to target
         const dx = nearestTarget.position.x - wingman.position.x;
         const dy = nearestTarget.position.y - wingman.position.y;
@@ -137,7 +144,7 @@ function Wingman({ wingman }) {
           
           // Only fire if target is within the 135 degree cone (dotProduct > threshold)
           if (dotProduct > fireAngleThreshold) {
-            lastFireTime.current = now;
+            fireCooldown.current = WINGMAN_FIRE_INTERVAL;
             
             // Create missile
             const missile = {
@@ -0,0 +1,197 @@
+import React, { useMemo, useRef } from 'react';
+import { useFrame } from '@react-three/fiber';
+import * as THREE from 'three';
+import { useGameStore } from '../../store/gameStore';
+import { ALIEN_CONFIG } from './alienConfig';
+import { getAlienColor, getComponentColor } from './alienUtils';
+import { updateAlienFrame } from './alienAnimationStates';
+import {
+  SAUCER_DISC_GEOMETRY,
+  SAUCER_DOME_GEOMETRY,
+  SAUCER_HULL_GEOMETRY,
+  SHIP_BODY_GEOMETRY,
+  SHIP_NOSE_GEOMETRY,
+  LEFT_WING_GEOMETRY,
+  RIGHT_WING_GEOMETRY
+} from './AlienGeometry';
+
+// Max aliens drawn per batch (entity pools hold 150 aliens in total)
+const ALIEN_BATCH_CAPACITY = 256;
+
+const SAUCER = ALIEN_CONFIG.saucer;
+const SHIP = ALIEN_CONFIG.ship;
+
+// Part transforms relative to the alien root: the 180 degree face-player
+// turn from AlienGeometry, then the part's own offset and rotation
+const FACE_PLAYER_MATRIX = new THREE.Matrix4().makeRotationY(Math.PI);
+
+function createPartMatrix(position, rotation) {
+  const matrix = new THREE.Matrix4().compose(
+    new THREE.Vector3(...position),
+    new THREE.Quaternion().setFromEuler(new THREE.Euler(...(rotation || [0, 0, 0]))),
+    new THREE.Vector3(1, 1, 1)
+  );
+  return matrix.premultiply(FACE_PLAYER_MATRIX);
+}
+
+// One InstancedMesh per part; `component` is the shipComponents key used for
+// damage tinting and wing destruction (saucer parts use the flat alien color)
+const SHIP_PARTS = [
+  {
+    key: 'body',
+    component: 'body',
+    geometry: SHIP_BODY_GEOMETRY,
+    matrix: createPartMatrix(SHIP.body.position)
+  },
+  {
+    key: 'nose',
+    component: 'nose',
+    geometry: SHIP_NOSE_GEOMETRY,
+    matrix: createPartMatrix(SHIP.nose.position, SHIP.nose.rotation)
+  },
+  {
+    key: 'leftWing',
+    component: 'leftWing',
+    geometry: LEFT_WING_GEOMETRY,
+    matrix: createPartMatrix(SHIP.leftWing.position),
+    doubleSided: true
+  },
+  {
+    key: 'rightWing',
+    component: 'rightWing',
+    geometry: RIGHT_WING_GEOMETRY,
+    matrix: createPartMatrix(SHIP.rightWing.position),
+    doubleSided: true
+  }
+];
+
+const SAUCER_PARTS = [
+  {
+    key: 'saucerDisc',
+    geometry: SAUCER_DISC_GEOMETRY,
+    matrix: createPartMatrix([0, 0, 0])
+  },
+  {
+    key: 'saucerDome',
+    geometry: SAUCER_DOME_GEOMETRY,
+    matrix: createPartMatrix(SAUCER.domePosition)
+  },
+  {
+    key: 'saucerHull',
+    geometry: SAUCER_HULL_GEOMETRY,
+    matrix: createPartMatrix(SAUCER.hullPosition)
+  }
+];
+
+const ALL_PARTS = [...SHIP_PARTS, ...SAUCER_PARTS];
+
+const isWingDestroyed = (alien, component) =>
+  !!(alien.shipComponents && alien.shipComponents[component]?.destroyed);
+
+// Batched alien renderer - one InstancedMesh (one draw call) per ship part
+// instead of a group of meshes and materials per alien. Per-alien motion
+// still runs through updateAlienFrame against a persistent Object3D.
+// `aliens` is the drawn set: positioned, non-charging aliens only.
+export function AlienBatch({ aliens, highlightedAlienId }) {
+  const meshRefs = useRef({});
+  const rootsRef = useRef(new Map()); // alien id -> Object3D carrying its transform
+  const frameRef = useRef(0);
+
+  const scratch = useMemo(() => ({
+    rootRef: { current: null },
+    matrix: new THREE.Matrix4(),
+    color: new THREE.Color(),
+    counts: {}
+  }), []);
+
+  useFrame(() => {
+    const meshes = meshRefs.current;
+    for (let p = 0; p < ALL_PARTS.length; p++) {
+      if (!meshes[ALL_PARTS[p].key]) return;
+    }
+
+    const playerPosition = useGameStore.getState().playerPosition;
+    const roots = rootsRef.current;
+    const frame = ++frameRef.current;
+    const { rootRef, matrix, color, counts } = scratch;
+    for (let p = 0; p < ALL_PARTS.length; p++) {
+      counts[ALL_PARTS[p].key] = 0;
+    }
+
+    for (let i = 0; i < aliens.length; i++) {
+      const alien = aliens[i];
+
+      let root = roots.get(alien.id);
+      if (!root) {
+        root = new THREE.Object3D();
+        root.scale.set(...ALIEN_CONFIG.shipScale);
+        roots.set(alien.id, root);
+      }
+      root.userData.frame = frame;
+
+      rootRef.current = root;
+      updateAlienFrame(alien, rootRef, playerPosition);
+      root.updateMatrix();
+
+      const isHighlighted = alien.id === highlightedAlienId;
+
+      if (alien.type === 5) {
+        color.set(getAlienColor(alien.type, isHighlighted));
+        for (let p = 0; p < SAUCER_PARTS.length; p++) {
+          const part = SAUCER_PARTS[p];
+          const index = counts[part.key];
+          if (index === ALIEN_BATCH_CAPACITY) continue;
+          counts[part.key] = index + 1;
+
+          const mesh = meshes[part.key];
+          mesh.setMatrixAt(index, matrix.multiplyMatrices(root.matrix, part.matrix));
+          mesh.setColorAt(index, color);
+        }
+        continue;
+      }
+
+      for (let p = 0; p < SHIP_PARTS.length; p++) {
+        const part = SHIP_PARTS[p];
+        if (part.doubleSided && isWingDestroyed(alien, part.component)) continue;
+        const index = counts[part.key];
+        if (index === ALIEN_BATCH_CAPACITY) continue;
+        counts[part.key] = index + 1;
+
+        const mesh = meshes[part.key];
+        mesh.setMatrixAt(index, matrix.multiplyMatrices(root.matrix, part.matrix));
+        mesh.setColorAt(index, getComponentColor(alien, part.component, isHighlighted));
+      }
+    }
+
+    for (let p = 0; p < ALL_PARTS.length; p++) {
+      const key = ALL_PARTS[p].key;
+      const mesh = meshes[key];
+      mesh.count = counts[key];
+      mesh.instanceMatrix.needsUpdate = true;
+      if (mesh.instanceColor) mesh.instanceColor.needsUpdate = true;
+    }
+
+    // Drop transforms of aliens that are gone
+    roots.forEach((root, id) => {
+      if (root.userData.frame !== frame) roots.delete(id);
+    });
+  });
+
+  return (
+    <>
+      {ALL_PARTS.map((part) => (
+        <instancedMesh
+          key={part.key}
+          ref={(mesh) => { meshRefs.current[part.key] = mesh; }}
+          args={[part.geometry, undefined, ALIEN_BATCH_CAPACITY]}
+          count={0}
+          frustumCulled={false}
+        >
+          <meshStandardMaterial side={part.doubleSided ? THREE.DoubleSide : THREE.FrontSide} />
+        </instancedMesh>
+      ))}
+    </>
+  );
+}
+
+export default AlienBatch;
@@ -1,53 +1,68 @@
 import React from 'react';
 import * as THREE from 'three';
 import { ALIEN_CONFIG } from './alienConfig';
+import { getAlienColor } from './alienUtils';
+
+// Render-time constants derived from ALIEN_CONFIG once at module load
+// instead of rebuilding the same arrays on every render of every alien
+const FACE_PLAYER_ROTATION = [0, Math.PI, 0]; // rotated 180 degrees to face player
+const SAUCER = ALIEN_CONFIG.saucer;
+const SHIP = ALIEN_CONFIG.ship;
+
+function createWingGeometry(vertices) {
+  const geometry = new THREE.BufferGeometry();
+  geometry.setAttribute('position', new THREE.BufferAttribute(new Float32Array(vertices), 3));
+  return geometry;
+}
+
+// Shared geometries - every alien of a given shape draws from the same
+// buffers instead of each mounted alien building and uploading its own
+export const SAUCER_DISC_GEOMETRY = new THREE.CylinderGeometry(SAUCER.discRadius[0], SAUCER.discRadius[1], SAUCER.discHeight, SAUCER.discSegments);
+export const SAUCER_DOME_GEOMETRY = new THREE.SphereGeometry(SAUCER.domeRadius, SAUCER.domeSegments[0], SAUCER.domeSegments[1]);
+export const SAUCER_HULL_GEOMETRY = new THREE.SphereGeometry(SAUCER.hullRadius, SAUCER.hullSegments[0], SAUCER.hullSegments[1]);
+export const SHIP_BODY_GEOMETRY = new THREE.BoxGeometry(...SHIP.body.size);
+export const SHIP_NOSE_GEOMETRY = new THREE.ConeGeometry(SHIP.nose.radius, SHIP.nose.height, SHIP.nose.segments);
+export const LEFT_WING_GEOMETRY = createWingGeometry(SHIP.leftWing.vertices);
+export const RIGHT_WING_GEOMETRY = createWingGeometry(SHIP.rightWing.vertices);
+const chargeGeometryCache = new Map(); // chargeLevel -> geometry
+
+function getChargeGeometry(chargeLevel) {
+  let geometry = chargeGeometryCache.get(chargeLevel);
+  if (!geometry) {
+    geometry = new THREE.SphereGeometry(2.0 + chargeLevel * 0.3, 8, 6);
+    chargeGeometryCache.set(chargeLevel, geometry);
+  }
+  return geometry;
+}
 
 export function AlienGeometry({ alien, isHighlighted = false, getComponentColor }) {
   const { type } = alien;
   
-  const getAlienColor = () => {
-    const alienType = ALIEN_CONFIG.alienTypes[type];
-    const baseColor = alienType ? alienType.color : ALIEN_CONFIG.defaultColor;
-    
-    // Brighten color when highlighted
-    if (isHighlighted) {
-      const color = new THREE.Color(baseColor);
-      color.lerp(new THREE.Color('#ffffff'), ALIEN_CONFIG.highlightMixRatio);
-      return `#${color.getHexString()}`;
-    }
-    
-    return baseColor;
-  };
-  
   // Flying saucer geometry
   if (type === 5) {
-    const saucer = ALIEN_CONFIG.saucer;
+    const alienColor = getAlienColor(type, isHighlighted);
     
     return (
-      <group rotation={[0, Math.PI, 0]}>
+      <group rotation={FACE_PLAYER_ROTATION}>
         {/* Main saucer disc */}
-        <mesh position={[0, 0, 0]}>
-          <cylinderGeometry args={[saucer.discRadius[0], saucer.discRadius[1], saucer.discHeight, saucer.discSegments]} />
-          <meshStandardMaterial color={getAlienColor()} />
+        <mesh geometry={SAUCER_DISC_GEOMETRY}>
+          <meshStandardMaterial color={alienColor} />
         </mesh>
         
         {/* Top dome */}
-        <mesh position={saucer.domePosition}>
-          <sphereGeometry args={[saucer.domeRadius, saucer.domeSegments[0], saucer.domeSegments[1]]} />
-          <meshStandardMaterial color={getAlienColor()} />
+        <mesh position={SAUCER.domePosition} geometry={SAUCER_DOME_GEOMETRY}>
+          <meshStandardMaterial color={alienColor} />
         </mesh>
         
         {/* Bottom hull */}
-        <mesh position={saucer.hullPosition}>
-          <sphereGeometry args={[saucer.hullRadius, saucer.hullSegments[0], saucer.hullSegments[1]]} />
-          <meshStandardMaterial color={getAlienColor()} />
+        <mesh position={SAUCER.hullPosition} geometry={SAUCER_HULL_GEOMETRY}>
+          <meshStandardMaterial color={alienColor} />
         </mesh>
         
         {/* Charge effect when charging */}
         {alien.isCharging && (
           <>
-            <mesh position={[0, 0, 0]}>
-              <sphereGeometry args={[2.0 + alien.chargeLevel * 0.3, 8, 6]} />
+            <mesh geometry={getChargeGeometry(alien.chargeLevel)}>
               <meshStandardMaterial 
                 color={ALIEN_CONFIG.chargeColors[alien.chargeLevel] || ALIEN_CONFIG.chargeColors[5]}
                 transparent 
@@ -67,48 +82,28 @@ export function AlienGeometry({ alien, isHighlighted = false, getComponentColor
   }
   
   // Standard ship geometry (rotated 180 degrees to face player)
-  const ship = ALIEN_CONFIG.ship;
-  
   return (
-    <group rotation={[0, Math.PI, 0]}>
+    <group rotation={FACE_PLAYER_ROTATION}>
       {/* FUSELAGE_BODY: Main ship body */}
-      <mesh position={ship.body.position} name="fuselage">
-        <boxGeometry args={ship.body.size} />
+      <mesh position={SHIP.body.position} name="fuselage" geometry={SHIP_BODY_GEOMETRY}>
         <meshStandardMaterial color={getComponentColor('body')} />
       </mesh>
       
       {/* NOSE_CONE: Front cone */}
-      <mesh position={ship.nose.position} rotation={ship.nose.rotation} name="nose">
-        <coneGeometry args={[ship.nose.radius, ship.nose.height, ship.nose.segments]} />
+      <mesh position={SHIP.nose.position} rotation={SHIP.nose.rotation} name="nose" geometry={SHIP_NOSE_GEOMETRY}>
         <meshStandardMaterial color={getComponentColor('nose')} />
       </mesh>
       
       {/* LEFT_WING: Triangle extending left from fuselage */}
       {(!alien.shipComponents || !alien.shipComponents.leftWing?.destroyed) && (
-        <mesh position={ship.leftWing.position} name="leftWing">
-          <bufferGeometry>
-            <bufferAttribute
-              attach="attributes-position"
-              count={3}
-              array={new Float32Array(ship.leftWing.vertices)}
-              itemSize={3}
-            />
-          </bufferGeometry>
+        <mesh position={SHIP.leftWing.position} name="leftWing" geometry={LEFT_WING_GEOMETRY}>
           <meshStandardMaterial color={getComponentColor('leftWing')} side={THREE.DoubleSide} />
         </mesh>
       )}
       
       {/* RIGHT_WING: Triangle extending right from fuselage */}
       {(!alien.shipComponents || !alien.shipComponents.rightWing?.destroyed) && (
-        <mesh position={ship.rightWing.position} name="rightWing">
-          <bufferGeometry>
-            <bufferAttribute
-              attach="attributes-position"
-              count={3}
-              array={new Float32Array(ship.rightWing.vertices)}
-              itemSize={3}
-            />
-          </bufferGeometry>
+        <mesh position={SHIP.rightWing.position} name="rightWing" geometry={RIGHT_WING_GEOMETRY}>
           <meshStandardMaterial color={getComponentColor('rightWing')} side={THREE.DoubleSide} />
         </mesh>
       )}
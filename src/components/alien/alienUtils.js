@@ -1,31 +1,52 @@
 import * as THREE from 'three';
 import { ALIEN_CONFIG } from './alienConfig';
 
-export const getAlienColor = (type, isHighlighted = false) => {
-  const alienType = ALIEN_CONFIG.alienTypes[type];
-  const baseColor = alienType ? alienType.color : ALIEN_CONFIG.defaultColor;
-  
-  // Brighten color when highlighted
-  if (isHighlighted) {
-    const color = new THREE.Color(baseColor);
-    color.lerp(new THREE.Color('#ffffff'), ALIEN_CONFIG.highlightMixRatio);
-    return `#${color.getHexString()}`;
+// [normal, highlighted] color per alien type, built on first use so the
+// per-frame lookup is an indexed load instead of a lerp and two allocations
+const alienColorPairs = new Map();
+
+const getAlienColorPair = (type) => {
+  let pair = alienColorPairs.get(type);
+  if (!pair) {
+    const alienType = ALIEN_CONFIG.alienTypes[type];
+    const baseColor = alienType ? alienType.color : ALIEN_CONFIG.defaultColor;
+    
+    // Brighten color when highlighted
+    const highlighted = new THREE.Color(baseColor);
+    highlighted.lerp(new THREE.Color('#ffffff'), ALIEN_CONFIG.highlightMixRatio);
+    
+    pair = [baseColor, `#${highlighted.getHexString()}`];
+    alienColorPairs.set(type, pair);
   }
-  
-  return baseColor;
+  return pair;
 };
 
+export const getAlienColor = (type, isHighlighted = false) =>
+  getAlienColorPair(type)[isHighlighted ? 1 : 0];
+
+// Damage-tinted colors keyed by base color and brightness. Component HP is a
+// small integer, so only a handful of entries ever exist. The returned
+// Colors are shared: callers copy them (setColorAt, color props) and must
+// not mutate them.
+const componentColorCache = new Map();
+
 export const getComponentColor = (alien, component, isHighlighted = false) => {
-  const baseColor = new THREE.Color(getAlienColor(alien.type, isHighlighted));
+  const baseColor = getAlienColor(alien.type, isHighlighted);
+  let damageMultiplier = 1;
   
   if (alien.shipComponents && alien.shipComponents[component]) {
     const hpRatio = alien.shipComponents[component].hp / alien.shipComponents[component].maxHp;
     // Reduce brightness based on damage (0.3 = 30% minimum brightness)
-    const damageMultiplier = Math.max(ALIEN_CONFIG.damageMinBrightness, hpRatio);
-    baseColor.multiplyScalar(damageMultiplier);
+    damageMultiplier = Math.max(ALIEN_CONFIG.damageMinBrightness, hpRatio);
   }
   
-  return baseColor;
+  const cacheKey = `${baseColor}:${damageMultiplier}`;
+  let color = componentColorCache.get(cacheKey);
+  if (!color) {
+    color = new THREE.Color(baseColor).multiplyScalar(damageMultiplier);
+    componentColorCache.set(cacheKey, color);
+  }
+  return color;
 };
 
 export const applyHitRecoil = (alien, meshRef) => {
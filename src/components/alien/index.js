@@ -1,5 +1,6 @@
 // Alien component exports
 export { AlienGeometry } from './AlienGeometry';
+export { AlienBatch } from './AlienBatch';
 export { ALIEN_CONFIG } from './alienConfig';
 export { 
   getAlienColor, 
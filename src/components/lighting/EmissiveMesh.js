@@ -1,6 +1,7 @@
 import React, { useMemo, useRef } from 'react';
 import { useFrame } from '@react-three/fiber';
 import * as THREE from 'three';
+import { fastSin } from '../../utils/trigTables';
 
 /**
  * Emissive mesh that provides area lighting without performance cost
@@ -48,12 +49,12 @@ function EmissiveMesh({
   useFrame((state) => {
     if (meshRef.current && pulseSpeed > 0) {
       const time = state.clock.elapsedTime;
-      const scale = 1 + Math.sin(time * pulseSpeed) * pulseAmount;
+      const scale = 1 + fastSin(time * pulseSpeed) * pulseAmount;
       meshRef.current.scale.setScalar(scale * size);
       
       // Also pulse emissive intensity
       meshRef.current.material.emissiveIntensity = 
-        emissiveIntensity * (1 + Math.sin(time * pulseSpeed * 1.5) * 0.3);
+        emissiveIntensity * (1 + fastSin(time * pulseSpeed * 1.5) * 0.3);
     }
   });
   
@@ -1,40 +1,67 @@
 import React from 'react';
+import * as THREE from 'three';
 import { PLAYER_CONFIG } from './playerConfig';
 
+// Shared geometries - built once instead of per trail point / per render
+const TRAIL_POINT_GEOMETRY = new THREE.SphereGeometry(0.1, 4, 4);
+const COLLISION_CIRCLE_GEOMETRY = new THREE.SphereGeometry(PLAYER_CONFIG.collisionRadius, 16, 12);
+const shieldGeometryCache = new Map(); // shieldLevel -> geometry
+
+// One shield material for every shield level, instead of a new one per mount
+const SHIELD_MATERIAL = new THREE.MeshBasicMaterial({
+  color: PLAYER_CONFIG.shieldColor,
+  wireframe: true,
+  transparent: true,
+  opacity: PLAYER_CONFIG.shieldOpacity,
+  depthTest: false
+});
+
+// Trail fade is quantized to a few opacity steps so all trail points share
+// TRAIL_OPACITY_STEPS + 1 materials instead of owning one material each
+const TRAIL_OPACITY_STEPS = 8;
+const TRAIL_MATERIALS = [];
+for (let step = 0; step <= TRAIL_OPACITY_STEPS; step++) {
+  TRAIL_MATERIALS.push(new THREE.MeshBasicMaterial({
+    color: PLAYER_CONFIG.defaultColor,
+    transparent: true,
+    opacity: step / TRAIL_OPACITY_STEPS,
+    depthTest: false
+  }));
+}
+
+function getTrailMaterial(opacity) {
+  return TRAIL_MATERIALS[Math.min(TRAIL_OPACITY_STEPS, Math.ceil(opacity * TRAIL_OPACITY_STEPS))];
+}
+
+function getShieldGeometry(shieldLevel) {
+  let geometry = shieldGeometryCache.get(shieldLevel);
+  if (!geometry) {
+    geometry = new THREE.SphereGeometry(PLAYER_CONFIG.shieldRadius * (1 + (shieldLevel - 1) * 0.05), 16, 12);
+    shieldGeometryCache.set(shieldLevel, geometry);
+  }
+  return geometry;
+}
+
 export function WingTrailEffect({ wingTrails }) {
+  const now = Date.now() / 1000;
+  
   return (
     <>
       {/* Left wing trail */}
       {wingTrails.left.map((point, index) => {
-        const age = Date.now() / 1000 - point.time;
+        const age = now - point.time;
         const opacity = Math.max(0, 1 - (age / 0.5));
         return (
-          <mesh key={`left-${index}`} position={[point.position.x, point.position.y, point.position.z]} renderOrder={25}>
-            <sphereGeometry args={[0.1, 4, 4]} />
-            <meshBasicMaterial 
-              color={PLAYER_CONFIG.defaultColor}
-              transparent 
-              opacity={opacity}
-              depthTest={false}
-            />
-          </mesh>
+          <mesh key={`left-${index}`} position={[point.position.x, point.position.y, point.position.z]} renderOrder={25} geometry={TRAIL_POINT_GEOMETRY} material={getTrailMaterial(opacity)} />
         );
       })}
       
       {/* Right wing trail */}
       {wingTrails.right.map((point, index) => {
-        const age = Date.now() / 1000 - point.time;
+        const age = now - point.time;
         const opacity = Math.max(0, 1 - (age / 0.5));
         return (
-          <mesh key={`right-${index}`} position={[point.position.x, point.position.y, point.position.z]} renderOrder={25}>
-            <sphereGeometry args={[0.1, 4, 4]} />
-            <meshBasicMaterial 
-              color={PLAYER_CONFIG.defaultColor}
-              transparent 
-              opacity={opacity}
-              depthTest={false}
-            />
-          </mesh>
+          <mesh key={`right-${index}`} position={[point.position.x, point.position.y, point.position.z]} renderOrder={25} geometry={TRAIL_POINT_GEOMETRY} material={getTrailMaterial(opacity)} />
         );
       })}
     </>
@@ -45,16 +72,7 @@ export function ShieldEffect({ playerPowerUps, shieldLevel, showDebugElements })
   if (!playerPowerUps.shield || !showDebugElements) return null;
   
   return (
-    <mesh renderOrder={12}>
-      <sphereGeometry args={[PLAYER_CONFIG.shieldRadius * (1 + (shieldLevel - 1) * 0.05), 16, 12]} />
-      <meshBasicMaterial 
-        color={PLAYER_CONFIG.shieldColor}
-        wireframe
-        transparent 
-        opacity={PLAYER_CONFIG.shieldOpacity}
-        depthTest={false}
-      />
-    </mesh>
+    <mesh renderOrder={12} geometry={getShieldGeometry(shieldLevel)} material={SHIELD_MATERIAL} />
   );
 }
 
@@ -62,8 +80,7 @@ export function CollisionDebugCircle({ showCollisionCircles }) {
   if (!showCollisionCircles) return null;
   
   return (
-    <mesh>
-      <sphereGeometry args={[PLAYER_CONFIG.collisionRadius, 16, 12]} />
+    <mesh geometry={COLLISION_CIRCLE_GEOMETRY}>
       <meshBasicMaterial 
         color="#ff0000" 
         wireframe
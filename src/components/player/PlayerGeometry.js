@@ -1,45 +1,71 @@
-import React from 'react';
+import React, { useMemo } from 'react';
 import * as THREE from 'three';
 import { PLAYER_CONFIG } from './playerConfig';
 
+// Ship part geometries are built once and shared by every render
+const FUSELAGE_GEOMETRY = new THREE.BoxGeometry(0.6, 0.4, 2.0);
+const NOSE_GEOMETRY = new THREE.ConeGeometry(0.4, 0.8, 4);
+
+// Flat wing triangle; `side` is -1 for the left wing and 1 for the right
+function createWingGeometry(side) {
+  const geometry = new THREE.BufferGeometry();
+  geometry.setAttribute('position', new THREE.BufferAttribute(new Float32Array([
+    0, 0, -0.8,
+    1.5 * side, 0, 0.0,
+    0, 0, 0.8
+  ]), 3));
+  return geometry;
+}
+
+const LEFT_WING_GEOMETRY = createWingGeometry(-1);
+const RIGHT_WING_GEOMETRY = createWingGeometry(1);
+
 export function PlayerGeometry({ playerPowerUps, playerShipComponents }) {
-  const getPlayerColor = () => {
-    if (playerPowerUps.shield) return PLAYER_CONFIG.shieldColor;
-    return PLAYER_CONFIG.defaultColor;
-  };
+  const hasShield = !!playerPowerUps.shield;
   
-  const getComponentColor = (component) => {
-    const baseColor = new THREE.Color(getPlayerColor());
+  // Part colors only change with the shield or component damage, so they are
+  // rebuilt on those changes rather than on every render
+  const componentColors = useMemo(() => {
+    const playerColor = hasShield ? PLAYER_CONFIG.shieldColor : PLAYER_CONFIG.defaultColor;
     
-    if (playerShipComponents && playerShipComponents[component]) {
-      const hpRatio = playerShipComponents[component].hp / playerShipComponents[component].maxHp;
-      // Reduce brightness based on damage (0.3 = 30% minimum brightness)
-      const damageMultiplier = Math.max(0.3, hpRatio);
-      baseColor.multiplyScalar(damageMultiplier);
-    }
+    const getComponentColor = (component) => {
+      const baseColor = new THREE.Color(playerColor);
+      
+      if (playerShipComponents && playerShipComponents[component]) {
+        const hpRatio = playerShipComponents[component].hp / playerShipComponents[component].maxHp;
+        // Reduce brightness based on damage (0.3 = 30% minimum brightness)
+        const damageMultiplier = Math.max(0.3, hpRatio);
+        baseColor.multiplyScalar(damageMultiplier);
+      }
+      
+      return baseColor;
+    };
     
-    return baseColor;
-  };
+    return {
+      body: getComponentColor('body'),
+      nose: getComponentColor('nose'),
+      leftWing: getComponentColor('leftWing'),
+      rightWing: getComponentColor('rightWing')
+    };
+  }, [hasShield, playerShipComponents]);
   
   const opacity = playerPowerUps.stealth ? PLAYER_CONFIG.stealthOpacity : 1.0;
   
   return (
     <group rotation={[0, 0, 0]}>
       {/* FUSELAGE_BODY: Main ship body (center at origin, extends from z=-1 to z=+1) */}
-      <mesh position={[0, 0, 0]} name="fuselage" renderOrder={10}>
-        <boxGeometry args={[0.6, 0.4, 2.0]} />
+      <mesh position={[0, 0, 0]} name="fuselage" renderOrder={10} geometry={FUSELAGE_GEOMETRY}>
         <meshStandardMaterial 
-          color={getComponentColor('body')} 
+          color={componentColors.body} 
           transparent={playerPowerUps.stealth}
           opacity={opacity}
         />
       </mesh>
       
       {/* NOSE_CONE: Front cone at NEGATIVE Z (forward direction, where missiles go) */}
-      <mesh position={[0, 0, -1.4]} rotation={[-Math.PI / 2, 0, 0]} name="nose" renderOrder={10}>
-        <coneGeometry args={[0.4, 0.8, 4]} />
+      <mesh position={[0, 0, -1.4]} rotation={[-Math.PI / 2, 0, 0]} name="nose" renderOrder={10} geometry={NOSE_GEOMETRY}>
         <meshStandardMaterial 
-          color={getComponentColor('nose')} 
+          color={componentColors.nose} 
           transparent={playerPowerUps.stealth}
           opacity={opacity}
         />
@@ -47,21 +73,9 @@ export function PlayerGeometry({ playerPowerUps, playerShipComponents }) {
       
       {/* LEFT_WING: Flat wing extending left from fuselage, inline with main body at back */}
       {(!playerShipComponents || !playerShipComponents.leftWing?.destroyed) && (
-        <mesh position={[-0.3, 0, 0]} name="leftWing" renderOrder={10}>
-          <bufferGeometry>
-            <bufferAttribute
-              attach="attributes-position"
-              count={3}
-              array={new Float32Array([
-                0, 0, -0.8,
-                -1.5, 0, 0.0,
-                0, 0, 0.8
-              ])}
-              itemSize={3}
-            />
-          </bufferGeometry>
+        <mesh position={[-0.3, 0, 0]} name="leftWing" renderOrder={10} geometry={LEFT_WING_GEOMETRY}>
           <meshStandardMaterial 
-            color={getComponentColor('leftWing')} 
+            color={componentColors.leftWing} 
             side={THREE.DoubleSide}
             transparent={playerPowerUps.stealth}
             opacity={opacity}
@@ -71,21 +85,9 @@ export function PlayerGeometry({ playerPowerUps, playerShipComponents }) {
       
       {/* RIGHT_WING: Flat wing extending right from fuselage, inline with main body at back */}
       {(!playerShipComponents || !playerShipComponents.rightWing?.destroyed) && (
-        <mesh position={[0.3, 0, 0]} name="rightWing" renderOrder={10}>
-          <bufferGeometry>
-            <bufferAttribute
-              attach="attributes-position"
-              count={3}
-              array={new Float32Array([
-                0, 0, -0.8,
-                1.5, 0, 0.0,
-                0, 0, 0.8
-              ])}
-              itemSize={3}
-            />
-          </bufferGeometry>
+        <mesh position={[0.3, 0, 0]} name="rightWing" renderOrder={10} geometry={RIGHT_WING_GEOMETRY}>
           <meshStandardMaterial 
-            color={getComponentColor('rightWing')} 
+            color={componentColors.rightWing} 
             side={THREE.DoubleSide}
             transparent={playerPowerUps.stealth}
             opacity={opacity}
@@ -19,4 +19,4 @@ const VersionDisplay = () => (
   </div>
 );
 
-export default VersionDisplay;
+export default React.memo(VersionDisplay);
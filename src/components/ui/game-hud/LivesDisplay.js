@@ -1,28 +1,25 @@
 import React from 'react';
 
-const LivesDisplay = ({ lives }) => (
-  <div className="lives">
-    Ship: {(() => {
-      try {
-        const currentLives = typeof lives === 'number' ? lives : 0;
-        const safeLives = Math.max(0, Math.min(3, Math.floor(currentLives)));
-        const ships = [];
-        const destroyed = [];
-        
-        for (let i = 0; i < safeLives; i++) {
-          ships.push('🚀');
-        }
-        for (let i = 0; i < (3 - safeLives); i++) {
-          destroyed.push('💥');
-        }
-        
-        return [...ships, ...destroyed].join(' ');
-      } catch (error) {
-        console.error('Error rendering lives:', error, { lives });
-        return '🚀 🚀 🚀'; // Default display
-      }
-    })()}
-  </div>
-);
+const MAX_LIVES = 3;
 
-export default LivesDisplay;
+// Ship strings for every possible lives count, built once at module load
+const LIVES_LABELS = [];
+for (let lives = 0; lives <= MAX_LIVES; lives++) {
+  LIVES_LABELS.push([
+    ...Array(lives).fill('🚀'),
+    ...Array(MAX_LIVES - lives).fill('💥')
+  ].join(' '));
+}
+
+const LivesDisplay = ({ lives }) => {
+  const currentLives = typeof lives === 'number' ? lives : 0;
+  const safeLives = Math.max(0, Math.min(MAX_LIVES, Math.floor(currentLives)));
+  
+  return (
+    <div className="lives">
+      Ship: {LIVES_LABELS[safeLives] || LIVES_LABELS[MAX_LIVES]}
+    </div>
+  );
+};
+
+export default React.memo(LivesDisplay);
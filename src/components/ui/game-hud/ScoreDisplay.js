@@ -1,13 +1,15 @@
 import React from 'react';
 
-const ScoreDisplay = ({ score, highScore, level, elapsedTime }) => {
-  const formatTime = (milliseconds) => {
-    const seconds = Math.floor(milliseconds / 1000);
-    const minutes = Math.floor(seconds / 60);
-    const remainingSeconds = seconds % 60;
-    return `${minutes}:${remainingSeconds.toString().padStart(2, '0')}`;
-  };
+const formatTime = (milliseconds) => {
+  const seconds = Math.floor(milliseconds / 1000);
+  const minutes = Math.floor(seconds / 60);
+  const remainingSeconds = seconds % 60;
+  return `${minutes}:${remainingSeconds.toString().padStart(2, '0')}`;
+};
 
+// Memoized: the UI overlay re-renders on every player/entity update, but the
+// score line only needs to change when one of its values does
+const ScoreDisplay = ({ score, highScore, level, elapsedTime }) => {
   return (
     <div className="score">
       Score: {score} | High Score: {highScore} | Level: {level} | Time: {formatTime(elapsedTime)}
@@ -15,4 +17,4 @@ const ScoreDisplay = ({ score, highScore, level, elapsedTime }) => {
   );
 };
 
-export default ScoreDisplay;
+export default React.memo(ScoreDisplay);
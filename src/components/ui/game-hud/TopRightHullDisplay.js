@@ -82,4 +82,4 @@ const TopRightHullDisplay = () => {
   );
 };
 
-export default TopRightHullDisplay;
\ No newline at end of file
+export default React.memo(TopRightHullDisplay);
\ No newline at end of file
@@ -26,4 +26,4 @@ const UIInteractionIndicator = ({ gameMode, uiInteractionMode }) => {
   );
 };
 
-export default UIInteractionIndicator;
+export default React.memo(UIInteractionIndicator);
@@ -1,12 +1,13 @@
 import React from 'react';
 
-const PausedScreen = () => {
-  return (
-    <div className="game-over">
-      <h1>PAUSED</h1>
-      <p>Press P to Resume</p>
-    </div>
-  );
-};
+// Static overlay - built once at module load like HELP_CONTENT
+const PAUSED_CONTENT = (
+  <div className="game-over">
+    <h1>PAUSED</h1>
+    <p>Press P to Resume</p>
+  </div>
+);
 
-export default PausedScreen;
+const PausedScreen = () => PAUSED_CONTENT;
+
+export default React.memo(PausedScreen);
@@ -1,13 +1,14 @@
 import React from 'react';
 
-const StartupScreen = ({ setGameState, startGame, resetGame }) => {
-  return (
-    <div className="game-over">
-      <h1>SPACE INVADERS 3D</h1>
-      <p>Press ENTER to Start</p>
-      <p style={{ fontSize: '16px' }}>Press H for Help</p>
-    </div>
-  );
-};
+// Static title card - built once at module load like HELP_CONTENT
+const STARTUP_CONTENT = (
+  <div className="game-over">
+    <h1>SPACE INVADERS 3D</h1>
+    <p>Press ENTER to Start</p>
+    <p style={{ fontSize: '16px' }}>Press H for Help</p>
+  </div>
+);
 
-export default StartupScreen;
+const StartupScreen = () => STARTUP_CONTENT;
+
+export default React.memo(StartupScreen);
@@ -3,6 +3,7 @@ import { useFrame } from '@react-three/fiber';
 import { useGameStore } from '../../store/gameStore';
 // Removed unused GameSpace imports
 import { UnifiedGamespace } from '../../config/UnifiedGamespace';
+import { fastSin } from '../../utils/trigTables';
 
 function WeaponPowerUp({ powerUp }) {
   const meshRef = useRef();
@@ -183,18 +184,19 @@ function WeaponPowerUp({ powerUp }) {
     }
   };
 
+  // Built once per render and shared with the frame loop below
+  const appearance = getWeaponAppearance();
+
   useFrame((state, delta) => {
     if (!meshRef.current) return;
     
-    const appearance = getWeaponAppearance();
-    
     // Rotation animation
     meshRef.current.rotation.x += appearance.rotationSpeed * delta;
     meshRef.current.rotation.y += appearance.rotationSpeed * delta;
     
     // Floating animation
     const time = state.clock.getElapsedTime();
-    meshRef.current.position.y = position.y + Math.sin(time * 3) * 0.2;
+    meshRef.current.position.y = position.y + fastSin(time * 3) * 0.2;
     
     // Update position
     position.x += velocity.x;
@@ -210,10 +212,9 @@ function WeaponPowerUp({ powerUp }) {
     const dx = position.x - playerPosition.x;
     const dy = position.y - playerPosition.y;
     const dz = position.z - playerPosition.z;
-    const distance = Math.sqrt(dx * dx + dy * dy + dz * dz);
     
     // Collection detection
-    if (distance < 2.0) {
+    if (dx * dx + dy * dy + dz * dz < 4.0) { // 2.0 * 2.0
       // Determine ammo amount based on weapon type
       let ammoAmount = 50; // Default
       switch (type) {
@@ -251,15 +252,13 @@ function WeaponPowerUp({ powerUp }) {
         position: { ...position },
         velocity: { x: 0, y: 0, z: 0 },
         lifetime: 1000,
-        color: getWeaponAppearance().color,
+        color: appearance.color,
       });
       
       removePowerUp(id);
     }
   });
 
-  const appearance = getWeaponAppearance();
-
   return (
     <mesh ref={meshRef} position={[position.x, position.y, position.z]}>
       {appearance.customMesh || (
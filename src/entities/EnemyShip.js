@@ -23,7 +23,8 @@ export class EnemyShip {
       color: '#ff0000'
     };
     
-    // Movement physics
+    // Movement physics (acceleration is mutated in place via setAcceleration
+    // so every ship keeps the same object shape for its whole lifetime)
     this.acceleration = { x: 0, y: 0, z: 0 };
     this.maxSpeed = 8;
     this.turnRate = 2; // radians per second
@@ -117,7 +118,7 @@ export class EnemyShip {
     switch (this.mode) {
       case 'passive':
         // No movement in passive mode
-        this.acceleration = { x: 0, y: 0, z: 0 };
+        this.setAcceleration(0, 0, 0);
         this.currentTarget = null;
         break;
         
@@ -171,22 +172,14 @@ export class EnemyShip {
     if (distanceToPlayer < this.modeState.evasionDistance) {
       // Too close - evasive maneuvers
       const evasionVector = this.getEvasionVector(playerPosition, gameTime);
-      this.acceleration = {
-        x: evasionVector.x * 10,
-        y: evasionVector.y * 10,
-        z: evasionVector.z * 10
-      };
+      this.setAcceleration(evasionVector.x * 10, evasionVector.y * 10, evasionVector.z * 10);
     } else if (distanceToPlayer > this.modeState.combatRange * 1.5) {
       // Too far - approach more aggressively
       this.seekTarget(playerPosition, deltaTime, 1.2);
     } else {
       // Combat range - strafe and maintain distance
       const strafeVector = this.getStrafeVector(playerPosition, gameTime);
-      this.acceleration = {
-        x: strafeVector.x * 5,
-        y: strafeVector.y * 5,
-        z: strafeVector.z * 5
-      };
+      this.setAcceleration(strafeVector.x * 5, strafeVector.y * 5, strafeVector.z * 5);
     }
   }
   
@@ -201,14 +194,20 @@ export class EnemyShip {
     if (distance > 0) {
       // Normalize and apply acceleration
       const accelMagnitude = 20 * speedFactor;
-      this.acceleration = {
-        x: (direction.x / distance) * accelMagnitude,
-        y: (direction.y / distance) * accelMagnitude,
-        z: (direction.z / distance) * accelMagnitude
-      };
+      this.setAcceleration(
+        (direction.x / distance) * accelMagnitude,
+        (direction.y / distance) * accelMagnitude,
+        (direction.z / distance) * accelMagnitude
+      );
     }
   }
   
+  setAcceleration(x, y, z) {
+    this.acceleration.x = x;
+    this.acceleration.y = y;
+    this.acceleration.z = z;
+  }
+  
   getEvasionVector(playerPosition, gameTime) {
     // Calculate perpendicular vector for evasion
     const toPlayer = {
@@ -291,23 +290,22 @@ export class EnemyShip {
   }
   
   updateRotation(deltaTime) {
-    // Rotate to face movement direction or target
-    let targetDirection;
+    // Rotate to face movement direction or target (only yaw, so x/z suffice)
+    let directionX;
+    let directionZ;
     
     if (this.currentTarget) {
-      targetDirection = {
-        x: this.currentTarget.x - this.position.x,
-        y: this.currentTarget.y - this.position.y,
-        z: this.currentTarget.z - this.position.z
-      };
+      directionX = this.currentTarget.x - this.position.x;
+      directionZ = this.currentTarget.z - this.position.z;
     } else if (Math.abs(this.velocity.x) > 0.1 || Math.abs(this.velocity.z) > 0.1) {
-      targetDirection = { ...this.velocity };
+      directionX = this.velocity.x;
+      directionZ = this.velocity.z;
     } else {
       return; // No rotation needed
     }
     
     // Calculate target rotation
-    const targetYaw = Math.atan2(targetDirection.x, targetDirection.z);
+    const targetYaw = Math.atan2(directionX, directionZ);
     
     // Smooth rotation
     const rotationDelta = targetYaw - this.rotation.y;
@@ -330,29 +328,17 @@ export class EnemyShip {
   
   isFacingTarget(target) {
     // Calculate direction to target
-    const toTarget = {
-      x: target.x - this.position.x,
-      y: target.y - this.position.y,
-      z: target.z - this.position.z
-    };
-    
-    const distance = Math.sqrt(toTarget.x ** 2 + toTarget.y ** 2 + toTarget.z ** 2);
-    if (distance === 0) return false;
-    
-    // Normalize target direction
-    toTarget.x /= distance;
-    toTarget.y /= distance;
-    toTarget.z /= distance;
+    const dx = target.x - this.position.x;
+    const dy = target.y - this.position.y;
+    const dz = target.z - this.position.z;
     
-    // Calculate ship's forward direction based on rotation
-    const forward = {
-      x: Math.sin(this.rotation.y),
-      y: 0,
-      z: Math.cos(this.rotation.y)
-    };
+    const distanceSquared = dx * dx + dy * dy + dz * dz;
+    if (distanceSquared === 0) return false;
     
-    // Calculate dot product (cosine of angle between directions)
-    const dotProduct = forward.x * toTarget.x + forward.y * toTarget.y + forward.z * toTarget.z;
+    // Ship's forward direction is (sin(rotY), 0, cos(rotY)); dotting it with
+    // the raw offset and scaling by one reciprocal length replaces three divides
+    const inverseDistance = 1 / Math.sqrt(distanceSquared);
+    const dotProduct = (Math.sin(this.rotation.y) * dx + Math.cos(this.rotation.y) * dz) * inverseDistance;
     
     // Check if within firing cone (head-on only = cos(15°) ≈ 0.966)
     const facingThreshold = 0.966; // 15 degree cone (head-on only)
@@ -362,19 +348,15 @@ export class EnemyShip {
   fire(playerPosition, gameTime) {
     if (!this.canFire(gameTime)) return null;
     
-    const direction = {
-      x: playerPosition.x - this.position.x,
-      y: playerPosition.y - this.position.y,
-      z: playerPosition.z - this.position.z
-    };
+    const dx = playerPosition.x - this.position.x;
+    const dy = playerPosition.y - this.position.y;
+    const dz = playerPosition.z - this.position.z;
     
-    const distance = Math.sqrt(direction.x ** 2 + direction.y ** 2 + direction.z ** 2);
-    if (distance === 0) return null;
+    const distanceSquared = dx * dx + dy * dy + dz * dz;
+    if (distanceSquared === 0) return null;
     
-    // Normalize
-    direction.x /= distance;
-    direction.y /= distance;
-    direction.z /= distance;
+    // Normalization and missile speed folded into one reciprocal scale
+    const velocityScale = this.weapon.velocity / Math.sqrt(distanceSquared);
     
     this.weapon.lastFireTime = gameTime;
     
@@ -397,9 +379,9 @@ export class EnemyShip {
       id: `enemy-missile-${this.id}-${gameTime}`,
       position: spawnPosition,
       velocity: {
-        x: direction.x * this.weapon.velocity,
-        y: direction.y * this.weapon.velocity,
-        z: direction.z * this.weapon.velocity
+        x: dx * velocityScale,
+        y: dy * velocityScale,
+        z: dz * velocityScale
       },
       type: 'alien',
       weaponType: this.weapon.type,
@@ -2,6 +2,35 @@ import { useRef, useCallback } from 'react';
 import { useGameStore } from '../store/gameStore';
 import entityPool from '../systems/EntityPool';
 
+// Map alien type numbers to pool entity types
+const ALIEN_POOL_TYPES = {
+  1: 'alien_scout',
+  2: 'alien_armored', 
+  3: 'alien_elite',
+  4: 'alien_boss',
+  5: 'alien_flying'
+};
+
+// Take an alien from the pool without touching the store
+const acquireAlien = (alienType, spawnData) => {
+  const poolType = ALIEN_POOL_TYPES[alienType];
+  if (!poolType) {
+    console.warn(`[ENTITY POOL] Unknown alien type: ${alienType}`);
+    return null;
+  }
+  
+  const alien = entityPool.acquire(poolType, {
+    ...spawnData,
+    type: alienType // Keep original type for compatibility
+  });
+  
+  if (alien) {
+    console.log(`[ENTITY POOL] Spawned ${poolType} with ID: ${alien.id}, health: ${alien.health}/${alien.maxHealth} at position:`, alien.position);
+  }
+  
+  return alien;
+};
+
 /**
  * Hook for managing game entities through the EntityPool system
  * Provides high-level interface for spawning, updating, and managing entities
@@ -11,25 +40,7 @@ export const useEntityPool = () => {
   
   // Spawn alien with proper pool management
   const spawnAlien = useCallback((alienType, spawnData) => {
-    // Map alien type numbers to pool entity types
-    const typeMap = {
-      1: 'alien_scout',
-      2: 'alien_armored', 
-      3: 'alien_elite',
-      4: 'alien_boss',
-      5: 'alien_flying'
-    };
-    
-    const poolType = typeMap[alienType];
-    if (!poolType) {
-      console.warn(`[ENTITY POOL] Unknown alien type: ${alienType}`);
-      return null;
-    }
-    
-    const alien = entityPool.acquire(poolType, {
-      ...spawnData,
-      type: alienType // Keep original type for compatibility
-    });
+    const alien = acquireAlien(alienType, spawnData);
     
     if (alien) {
       // Check for duplicate IDs
@@ -41,8 +52,6 @@ export const useEntityPool = () => {
       // Add to game store for immediate React updates
       const addAlien = useGameStore.getState().addAlien;
       addAlien(alien);
-      
-      console.log(`[ENTITY POOL] Spawned ${poolType} with ID: ${alien.id}, health: ${alien.health}/${alien.maxHealth} at position:`, alien.position);
     }
     
     return alien;
@@ -147,17 +156,30 @@ export const useEntityPool = () => {
   }, []);
   
   // Batch spawn operations for performance
+  // The whole wave is acquired first and added to the store in one update,
+  // with a single duplicate-id pass, instead of one store update per alien
   const spawnAlienWave = useCallback((alienSpecs) => {
     const spawnedAliens = [];
     
     alienSpecs.forEach(spec => {
-      const alien = spawnAlien(spec.type, spec.spawnData);
+      const alien = acquireAlien(spec.type, spec.spawnData);
       if (alien) spawnedAliens.push(alien);
     });
     
+    if (spawnedAliens.length > 0) {
+      const { aliens, addAliens } = useGameStore.getState();
+      const existingIds = new Set(aliens.map(a => a.id));
+      spawnedAliens.forEach(alien => {
+        if (existingIds.has(alien.id)) {
+          console.warn(`[DUPLICATE ID] Alien with ID ${alien.id} already exists!`);
+        }
+      });
+      addAliens(spawnedAliens);
+    }
+    
     console.log(`[ENTITY POOL] Spawned wave of ${spawnedAliens.length} aliens`);
     return spawnedAliens;
-  }, [spawnAlien]);
+  }, []);
   
   const spawnAsteroidField = useCallback((asteroidSpecs) => {
     const spawnedAsteroids = [];
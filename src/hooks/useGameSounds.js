@@ -28,8 +28,8 @@ export function useGameSounds() {
     switch (gameState) {
       case 'playing':
         soundManager.play('game_start');
-        // Start ambient sounds
-        const ambientLoop = soundManager.play('space_ambient', { loop: true });
+        // Start ambient sounds (deferred until loaded if loading is in flight)
+        const ambientLoop = soundManager.playWhenLoaded('space_ambient', { loop: true });
         if (ambientLoop) {
           activeLoops.current.set('ambient', ambientLoop);
         }
@@ -55,8 +55,8 @@ export function useGameSounds() {
   useEffect(() => {
     const currentCount = missiles.length;
     
-    // New missiles were added
-    if (currentCount > lastMissileCount.current) {
+    // New missiles were added (nothing to do while sound is muted)
+    if (soundManager.enabled && currentCount > lastMissileCount.current) {
       const newMissiles = missiles.slice(lastMissileCount.current);
       
       newMissiles.forEach(missile => {
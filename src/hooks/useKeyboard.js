@@ -1,86 +1,86 @@
 import { useEffect, useState } from 'react';
 
+// Every input the game tracks, all released
+const INITIAL_KEYS = {
+  ArrowLeft: false,
+  ArrowRight: false,
+  ArrowUp: false,
+  ArrowDown: false,
+  Space: false,
+  Enter: false,
+  Escape: false,
+  KeyH: false,
+  KeyP: false,
+  KeyW: false,
+  KeyA: false,
+  KeyS: false,
+  KeyD: false,
+  KeyC: false,
+  KeyF: false,
+  KeyG: false,
+  KeyQ: false,
+  KeyE: false,
+  KeyB: false,
+  KeyZ: false,
+  ShiftLeft: false,
+  ShiftRight: false,
+  ControlLeft: false,
+  ControlRight: false,
+  Digit1: false,
+  Digit2: false,
+  Digit3: false,
+  Digit4: false,
+  Digit5: false,
+  Digit6: false,
+  Digit7: false,
+  Digit8: false,
+  MouseLeft: false, // Left mouse button
+  WheelUp: false,
+  WheelDown: false,
+};
+
+// Key codes worth a state update; anything else is ignored without
+// scheduling a render
+const TRACKED_KEYS = new Set(Object.keys(INITIAL_KEYS));
+
 export function useKeyboard() {
-  const [keys, setKeys] = useState({
-    ArrowLeft: false,
-    ArrowRight: false,
-    ArrowUp: false,
-    ArrowDown: false,
-    Space: false,
-    Enter: false,
-    Escape: false,
-    KeyH: false,
-    KeyP: false,
-    KeyW: false,
-    KeyA: false,
-    KeyS: false,
-    KeyD: false,
-    KeyC: false,
-    KeyF: false,
-    KeyG: false,
-    KeyQ: false,
-    KeyE: false,
-    KeyB: false,
-    KeyZ: false,
-    ShiftLeft: false,
-    ShiftRight: false,
-    ControlLeft: false,
-    ControlRight: false,
-    Digit1: false,
-    Digit2: false,
-    Digit3: false,
-    Digit4: false,
-    Digit5: false,
-    Digit6: false,
-    Digit7: false,
-    Digit8: false,
-    MouseLeft: false, // Left mouse button
-    WheelUp: false,
-    WheelDown: false,
-  });
+  const [keys, setKeys] = useState(INITIAL_KEYS);
 
   useEffect(() => {
-    const handleKeyDown = (e) => {
+    // Only produce a new keys object (and a render) when a key actually
+    // changes state: auto-repeat keydowns and the duplicate mouse events from
+    // the canvas and window listeners are dropped
+    const setKey = (code, pressed) => {
       setKeys((prev) => {
-        if (e.code in prev) {
-          e.preventDefault();
-          const newState = { ...prev, [e.code]: true };
-          document._gameKeys = newState; // Store for stale closure fix
-          return newState;
-        }
-        return prev;
+        if (prev[code] === pressed) return prev;
+        const newState = { ...prev, [code]: pressed };
+        document._gameKeys = newState; // Store for stale closure fix
+        return newState;
       });
     };
 
+    const handleKeyDown = (e) => {
+      if (!TRACKED_KEYS.has(e.code)) return;
+      e.preventDefault();
+      if (e.repeat) return;
+      setKey(e.code, true);
+    };
+
     const handleKeyUp = (e) => {
-      setKeys((prev) => {
-        if (e.code in prev) {
-          e.preventDefault();
-          const newState = { ...prev, [e.code]: false };
-          document._gameKeys = newState; // Store for stale closure fix
-          return newState;
-        }
-        return prev;
-      });
+      if (!TRACKED_KEYS.has(e.code)) return;
+      e.preventDefault();
+      setKey(e.code, false);
     };
 
     const handleMouseDown = (e) => {
       if (e.button === 0) { // Left mouse button
-        setKeys((prev) => {
-          const newState = { ...prev, MouseLeft: true };
-          document._gameKeys = newState; // Store for stale closure fix
-          return newState;
-        });
+        setKey('MouseLeft', true);
       }
     };
 
     const handleMouseUp = (e) => {
       if (e.button === 0) { // Left mouse button
-        setKeys((prev) => {
-          const newState = { ...prev, MouseLeft: false };
-          document._gameKeys = newState; // Store for stale closure fix
-          return newState;
-        });
+        setKey('MouseLeft', false);
       }
     };
 
@@ -21,24 +21,11 @@ export const useQueueProcessor = ({
       
       console.log(`[QUEUE DEBUG] Processing ${queuedMissiles.length} queued missiles`);
       
-      // Add all queued missiles to the store in a single batch update
+      // Add all queued missiles to the store in a single batch update.
+      // The queue holds plain missile objects, so no unwrapping pass is needed.
       if (queuedMissiles.length > 0) {
         const currentMissiles = useGameStore.getState().missiles;
-        const newMissiles = queuedMissiles.map(item => {
-          // Handle both formats: direct missile objects and wrapped objects
-          if (item.type === 'add' && item.missile) {
-            console.log(`[QUEUE DEBUG] Adding wrapped missile:`, item.missile);
-            return item.missile;
-          } else if (item.id && item.position && item.velocity) {
-            // Direct missile object (charge weapons)
-            console.log(`[QUEUE DEBUG] Adding direct missile:`, item);
-            return item;
-          }
-          console.warn('[QUEUE] Unknown missile format:', item);
-          return null;
-        }).filter(Boolean);
-        
-        const updatedMissiles = [...currentMissiles, ...newMissiles];
+        const updatedMissiles = [...currentMissiles, ...queuedMissiles];
         console.log(`[QUEUE DEBUG] Updating store with ${updatedMissiles.length} total missiles (was ${currentMissiles.length})`);
         updateMissiles(updatedMissiles);
       }
@@ -4,6 +4,9 @@ import weaponMeshPool from '../systems/WeaponMeshPool2';
 import soundManager from '../systems/SoundManager';
 import * as THREE from 'three';
 
+// Horizontal spawn offsets for the multi-shot spread
+const MULTISHOT_OFFSETS = [-2, 0, 2];
+
 export const useWeaponSystem = ({ 
   keys, 
   gameState, 
@@ -313,33 +316,25 @@ export const useWeaponSystem = ({
       };
       
       if (playerPowerUps.multiShot) {
-        // Fire 3 missiles in a spread
-        const fireResults = [
-          fireProjectile(currentWeapons.current, -2),
-          fireProjectile(currentWeapons.current, 0),
-          fireProjectile(currentWeapons.current, 2)
-        ];
-        
-        // Handle simple weapons that still return missile data
-        const simpleMissiles = fireResults.filter(result => result && typeof result === 'object' && result.position);
-        simpleMissiles.forEach(missile => {
-          missileQueueRef.current.push({
-            type: 'add',
-            missile: missile
-          });
-        });
+        // Fire 3 missiles in a spread; simple weapons return missile data,
+        // which goes straight onto the flat missile queue
+        let successfulFires = 0;
+        for (let i = 0; i < MULTISHOT_OFFSETS.length; i++) {
+          const fireResult = fireProjectile(currentWeapons.current, MULTISHOT_OFFSETS[i]);
+          if (fireResult === true) {
+            successfulFires++;
+          } else if (fireResult && typeof fireResult === 'object' && fireResult.position) {
+            missileQueueRef.current.push(fireResult);
+            successfulFires++;
+          }
+        }
         
         // Play weapon sound for successful fires (both simple and complex weapons)
-        const successfulFires = fireResults.filter(result => result === true || (result && typeof result === 'object' && result.position)).length;
         if (successfulFires > 0) {
           soundManager.playWeaponSound(currentWeapons.current, {
             pitchVariation: 0.1
           });
         }
-        
-        // Count successful fires for complex weapons
-        const complexFires = fireResults.filter(result => result === true).length;
-        // Removed console.log for performance
       } else {
         // Fire single missile
         const fireResult = fireProjectile(currentWeapons.current, 0);
@@ -348,10 +343,7 @@ export const useWeaponSystem = ({
           // Complex weapon fired directly through pool - logging removed for performance
         } else if (fireResult && typeof fireResult === 'object' && fireResult.position) {
           // Simple weapon returns missile data for queue
-          missileQueueRef.current.push({
-            type: 'add',
-            missile: fireResult
-          });
+          missileQueueRef.current.push(fireResult);
           // Play weapon sound for simple weapons as backup (in case store hook fails)
           soundManager.playWeaponSound(currentWeapons.current, {
             pitchVariation: 0.1
@@ -122,6 +122,9 @@ export const useWorkerManager = ({ updateMissiles, damageArmor, damageShield, lo
           const alienMap = new Map(currentAliens.map(a => [a.id, a]));
           const asteroidMap = new Map(currentAsteroids.map(a => [a.id, a]));
           
+          // Store missiles consumed by hits this frame, removed in one pass below
+          const removedStoreMissileIds = new Set();
+          
           // Track closest distances for live targeting stats every frame
           const gameStore = useGameStore.getState();
           if (gameStore.liveTargetingStats.enabled && gameStore.liveTargetingStats.shotHistory.length > 0) {
@@ -240,8 +243,7 @@ export const useWorkerManager = ({ updateMissiles, damageArmor, damageShield, lo
                   if (['rocket', 'bfg', 'bomb', 'railgun'].includes(missile.weaponType)) {
                     weaponMeshPool.release(missile.id);
                   } else {
-                    const updatedMissiles = useGameStore.getState().missiles.filter(m => m.id !== missile.id);
-                    updateMissiles(updatedMissiles);
+                    removedStoreMissileIds.add(missile.id);
                   }
                 }
               } else {
@@ -312,8 +314,7 @@ export const useWorkerManager = ({ updateMissiles, damageArmor, damageShield, lo
                   if (['rocket', 'bfg', 'bomb', 'railgun'].includes(missile.weaponType)) {
                     weaponMeshPool.release(missile.id);
                   } else {
-                    const updatedMissiles = useGameStore.getState().missiles.filter(m => m.id !== missile.id);
-                    updateMissiles(updatedMissiles);
+                    removedStoreMissileIds.add(missile.id);
                   }
                 }
               }
@@ -333,8 +334,7 @@ export const useWorkerManager = ({ updateMissiles, damageArmor, damageShield, lo
                 if (['rocket', 'bfg', 'bomb', 'railgun'].includes(hitMissile.weaponType)) {
                   weaponMeshPool.release(hit.missileId);
                 } else {
-                  const updatedMissiles = useGameStore.getState().missiles.filter(m => m.id !== hit.missileId);
-                  updateMissiles(updatedMissiles);
+                  removedStoreMissileIds.add(hit.missileId);
                 }
               }
               
@@ -411,6 +411,11 @@ export const useWorkerManager = ({ updateMissiles, damageArmor, damageShield, lo
               }
             });
           }
+          
+          if (removedStoreMissileIds.size > 0) {
+            const remainingMissiles = useGameStore.getState().missiles.filter(m => !removedStoreMissileIds.has(m.id));
+            updateMissiles(remainingMissiles);
+          }
         }
       }
     };
@@ -1,6 +1,35 @@
 import { create } from 'zustand';
 import weaponMeshPool from '../systems/WeaponMeshPool2';
 import entityPool from '../systems/EntityPool';
+import uiPositionManager from '../utils/uiPositions';
+
+// Debris lookup tables shared by every removeAlien call
+const SAUCER_DEBRIS_COMPONENTS = ['saucerDisc', 'saucerDome', 'saucerHull', 'saucerEngine'];
+const SHIP_DEBRIS_COMPONENTS = ['fuselage', 'nose', 'leftWing', 'rightWing'];
+const DEBRIS_COLORS = {
+  1: '#ff0000',
+  2: '#0080ff',
+  3: '#00ff00',
+  4: '#ff00ff',
+  5: '#888888'
+};
+const DEFAULT_DEBRIS_COLOR = '#ffffff';
+// Outward spread (cosine of each piece's angle around the ship); both
+// component lists have four entries, so the fixed angles are shared
+const DEBRIS_SPREAD_X = SHIP_DEBRIS_COMPONENTS.map((_, index) =>
+  Math.cos((index / SHIP_DEBRIS_COMPONENTS.length) * Math.PI * 2)
+);
+// Map debris component types to ship component names
+const DEBRIS_SHIP_COMPONENTS = {
+  'fuselage': 'body',
+  'nose': 'nose',
+  'leftWing': 'leftWing',
+  'rightWing': 'rightWing',
+  'saucerDisc': 'body',
+  'saucerDome': 'nose',
+  'saucerHull': 'leftWing', // Map to leftWing for consistency
+  'saucerEngine': 'rightWing' // Map to rightWing for consistency
+};
 
 const initialState = {
   gameState: 'startup',
@@ -214,12 +243,13 @@ export const useGameStore = create((set, get) => ({
     gameStartTime: null 
   }),
   
-  setScore: (score) => set((state) => ({
+  // No-op score changes return the current state so subscribers aren't notified
+  setScore: (score) => set((state) => (score === state.score ? state : {
     score,
     highScore: Math.max(score, state.highScore),
   })),
   
-  addScore: (points) => set((state) => ({
+  addScore: (points) => set((state) => (!points ? state : {
     score: state.score + points,
     highScore: Math.max(state.score + points, state.highScore),
   })),
@@ -280,6 +310,11 @@ export const useGameStore = create((set, get) => ({
     aliens: [...state.aliens, alien],
   })),
   
+  // Append a whole wave in one update
+  addAliens: (newAliens) => set((state) => ({
+    aliens: [...state.aliens, ...newAliens],
+  })),
+  
   removeAlien: (id) => set((state) => {
     // Find the alien being removed
     const alienToRemove = state.aliens.find((alien) => alien.id === id);
@@ -294,26 +329,16 @@ export const useGameStore = create((set, get) => ({
       
       // Determine component types based on alien type
       const componentTypes = alienToRemove.type === 5 ? 
-        ['saucerDisc', 'saucerDome', 'saucerHull', 'saucerEngine'] :
-        ['fuselage', 'nose', 'leftWing', 'rightWing'];
+        SAUCER_DEBRIS_COMPONENTS :
+        SHIP_DEBRIS_COMPONENTS;
       
       // Get alien color
-      const alienColor = (() => {
-        switch (alienToRemove.type) {
-          case 1: return '#ff0000';
-          case 2: return '#0080ff';
-          case 3: return '#00ff00';
-          case 4: return '#ff00ff';
-          case 5: return '#888888';
-          default: return '#ffffff';
-        }
-      })();
+      const alienColor = DEBRIS_COLORS[alienToRemove.type] || DEFAULT_DEBRIS_COLOR;
       
       componentTypes.forEach((componentType, index) => {
         // Calculate explosion direction (outward from center)
-        const angle = (index / componentTypes.length) * Math.PI * 2;
         const explosionDirection = {
-          x: Math.cos(angle) + (Math.random() - 0.5) * 0.5,
+          x: DEBRIS_SPREAD_X[index] + (Math.random() - 0.5) * 0.5,
           y: (Math.random() - 0.5) * 0.8,
           z: (Math.random() - 0.5) * 0.3
         };
@@ -334,19 +359,7 @@ export const useGameStore = create((set, get) => ({
         // Get HP for this component from ship components if available
         const getComponentHP = () => {
           if (alienToRemove.shipComponents) {
-            // Map component types to ship component names
-            const componentMap = {
-              'fuselage': 'body',
-              'nose': 'nose',
-              'leftWing': 'leftWing',
-              'rightWing': 'rightWing',
-              'saucerDisc': 'body',
-              'saucerDome': 'nose',
-              'saucerHull': 'leftWing', // Map to leftWing for consistency
-              'saucerEngine': 'rightWing' // Map to rightWing for consistency
-            };
-            
-            const shipComponentName = componentMap[componentType];
+            const shipComponentName = DEBRIS_SHIP_COMPONENTS[componentType];
             if (shipComponentName && alienToRemove.shipComponents[shipComponentName]) {
               return alienToRemove.shipComponents[shipComponentName].hp || 1;
             }
@@ -354,6 +367,7 @@ export const useGameStore = create((set, get) => ({
           // Default HP if no ship components
           return 1;
         };
+        const componentHP = getComponentHP();
         
         const debris = {
           id: `${baseId}-${index}`,
@@ -372,8 +386,8 @@ export const useGameStore = create((set, get) => ({
           },
           lifetime: 3 + Math.random() * 2, // 3-5 seconds
           spawnTime: Date.now(),
-          hp: getComponentHP(), // Add HP based on component that was destroyed
-          maxHp: getComponentHP(), // Store original HP
+          hp: componentHP, // Add HP based on component that was destroyed
+          maxHp: componentHP, // Store original HP
           exploded: false // Track if already exploded
         };
         
@@ -678,44 +692,44 @@ export const useGameStore = create((set, get) => ({
   })),
 
   damageAlienShipComponent: (alienId, component, damage = 1) => set((state) => {
-    const newAliens = state.aliens.map(alien => {
-      if (alien.id !== alienId) return alien;
-      
-      if (!alien.shipComponents || !alien.shipComponents[component]) {
-        return alien; // Component doesn't exist or alien doesn't have ship components
-      }
-      
-      const currentComponent = alien.shipComponents[component];
-      if (currentComponent.destroyed) {
-        return alien; // Component already destroyed
-      }
-      
-      const newHp = Math.max(0, currentComponent.hp - damage);
-      const isDestroyed = newHp === 0;
-      
-      const newShipComponents = {
-        ...alien.shipComponents,
-        [component]: {
-          ...currentComponent,
-          hp: newHp,
-          destroyed: isDestroyed
-        }
-      };
-      
-      // Check if critical components (body or nose) are destroyed
-      const bodyDestroyed = newShipComponents.body.destroyed;
-      const noseDestroyed = newShipComponents.nose.destroyed;
-      
-      if (bodyDestroyed || noseDestroyed) {
-        // Alien dies - return null to be filtered out
-        return null;
+    // Touch only the hit alien - no map/filter pass over the whole wave
+    const alienIndex = state.aliens.findIndex(alien => alien.id === alienId);
+    if (alienIndex === -1) return state;
+    
+    const alien = state.aliens[alienIndex];
+    if (!alien.shipComponents || !alien.shipComponents[component]) {
+      return state; // Component doesn't exist or alien doesn't have ship components
+    }
+    
+    const currentComponent = alien.shipComponents[component];
+    if (currentComponent.destroyed) {
+      return state; // Component already destroyed
+    }
+    
+    const newHp = Math.max(0, currentComponent.hp - damage);
+    const isDestroyed = newHp === 0;
+    
+    const newShipComponents = {
+      ...alien.shipComponents,
+      [component]: {
+        ...currentComponent,
+        hp: newHp,
+        destroyed: isDestroyed
       }
-      
-      return {
+    };
+    
+    const newAliens = state.aliens.slice();
+    
+    // Check if critical components (body or nose) are destroyed
+    if (newShipComponents.body.destroyed || newShipComponents.nose.destroyed) {
+      // Alien dies - drop it from the live list
+      newAliens.splice(alienIndex, 1);
+    } else {
+      newAliens[alienIndex] = {
         ...alien,
         shipComponents: newShipComponents
       };
-    }).filter(alien => alien !== null); // Remove destroyed aliens
+    }
     
     return {
       ...state,
@@ -822,7 +836,6 @@ export const useGameStore = create((set, get) => ({
   // UI Position Management
   resetUIPositions: () => {
     try {
-      const uiPositionManager = require('../utils/uiPositions').default;
       uiPositionManager.resetPositions();
       // Trigger UI update
       window.dispatchEvent(new CustomEvent('ui-positions-reset'));
@@ -868,6 +881,11 @@ export const useGameStore = create((set, get) => ({
     effects: state.effects.filter((effect) => effect.id !== id),
   })),
 
+  // Drop every effect started before cutoffTime in one update
+  removeExpiredEffects: (cutoffTime) => set((state) => ({
+    effects: state.effects.filter((effect) => !(effect.startTime < cutoffTime)),
+  })),
+
   addAsteroid: (asteroid) => set((state) => ({
     asteroids: [...state.asteroids, asteroid],
   })),
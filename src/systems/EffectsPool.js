@@ -14,6 +14,10 @@ class EffectsPool {
     // Object pools
     this.pools = new Map();
     
+    // Recycled per-effect particle lists, so each new effect reuses a
+    // released effect's container instead of allocating a fresh array
+    this.particleListPool = [];
+    
     // Pre-built geometries and materials (shared across all instances)
     this.geometryCache = new Map();
     this.materialCache = new Map();
@@ -68,17 +72,20 @@ class EffectsPool {
     
     // Create pools for each effect type
     Object.entries(this.poolConfigs).forEach(([effectType, config]) => {
-      this.pools.set(effectType, {
+      const pool = {
         available: [],
         active: new Map(), // effectId -> array of pooled particles
+        meshes: [], // slot -> mesh
+        data: this.createParticleData(config.size), // per-slot animation state (SOA)
         totalCreated: 0
-      });
+      };
+      this.pools.set(effectType, pool);
       
       // Pre-create pool particles
       for (let i = 0; i < config.size; i++) {
-        const particle = this.createPooledParticle(effectType);
+        const particle = this.createPooledParticle(effectType, pool);
         particle.visible = false;
-        this.pools.get(effectType).available.push(particle);
+        pool.available.push(particle);
       }
       
       console.log(`[EFFECTS POOL] Created ${config.size} ${effectType} particles`);
@@ -110,24 +117,70 @@ class EffectsPool {
     console.log('[EFFECTS POOL] Scene initialization complete - particles pre-added');
   }
 
-  createPooledParticle(effectType) {
+  // Animation state lives in flat typed arrays indexed by particle slot
+  // instead of per-mesh userData objects
+  createParticleData(capacity) {
+    return {
+      capacity,
+      initialPositions: new Float32Array(capacity * 3),
+      velocities: new Float32Array(capacity * 3),
+      initialScales: new Float32Array(capacity),
+      initialRotations: new Float32Array(capacity),
+      startTimes: new Float64Array(capacity)
+    };
+  }
+
+  growParticleData(data, capacity) {
+    const grown = this.createParticleData(capacity);
+    grown.initialPositions.set(data.initialPositions);
+    grown.velocities.set(data.velocities);
+    grown.initialScales.set(data.initialScales);
+    grown.initialRotations.set(data.initialRotations);
+    grown.startTimes.set(data.startTimes);
+    return grown;
+  }
+
+  createPooledParticle(effectType, pool) {
     const geometry = this.geometryCache.get('particle');
     const material = this.materialCache.get(effectType).clone(); // Clone for individual opacity control
     
+    const slot = pool.meshes.length;
+    if (slot >= pool.data.capacity) {
+      pool.data = this.growParticleData(pool.data, pool.data.capacity * 2);
+    }
+    
     const mesh = new THREE.Mesh(geometry, material);
     mesh.userData = { 
       effectType,
       effectId: null,
-      initialPosition: new THREE.Vector3(),
-      velocity: new THREE.Vector3(),
-      initialScale: 1,
-      initialRotation: 0,
-      startTime: 0
+      slot
     };
+    pool.meshes.push(mesh);
     
     return mesh;
   }
 
+  // Set a particle's starting state and initial transform
+  initializeParticle(particle, x, y, z, vx, vy, vz, scale, rotation, startTime) {
+    const { effectType, slot } = particle.userData;
+    const data = this.pools.get(effectType).data;
+    const i3 = slot * 3;
+    
+    data.initialPositions[i3] = x;
+    data.initialPositions[i3 + 1] = y;
+    data.initialPositions[i3 + 2] = z;
+    data.velocities[i3] = vx;
+    data.velocities[i3 + 1] = vy;
+    data.velocities[i3 + 2] = vz;
+    data.initialScales[slot] = scale;
+    data.initialRotations[slot] = rotation;
+    data.startTimes[slot] = startTime;
+    
+    particle.position.set(x, y, z);
+    particle.scale.setScalar(scale);
+    particle.rotation.z = rotation;
+  }
+
   // Acquire particles for an effect
   acquireEffect(effectType, effectId, particleCount = 20) {
     const pool = this.pools.get(effectType);
@@ -136,7 +189,7 @@ class EffectsPool {
       return [];
     }
     
-    const particles = [];
+    const particles = this.particleListPool.length > 0 ? this.particleListPool.pop() : [];
     
     // Get required number of particles from pool
     for (let i = 0; i < particleCount; i++) {
@@ -144,7 +197,7 @@ class EffectsPool {
       if (pool.available.length === 0) {
         console.warn(`[EFFECTS POOL] Pool exhausted for ${effectType}, expanding...`);
         // Expand pool dynamically
-        const newParticle = this.createPooledParticle(effectType);
+        const newParticle = this.createPooledParticle(effectType, pool);
         newParticle.visible = false;
         
         // Add to scene if scene is initialized
@@ -180,7 +233,9 @@ class EffectsPool {
         const particles = pool.active.get(effectId);
         pool.active.delete(effectId);
         
-        particles.forEach(particle => {
+        for (let i = 0; i < particles.length; i++) {
+          const particle = particles[i];
+          
           // Reset particle state
           particle.visible = false;
           particle.position.set(0, 0, 0);
@@ -191,9 +246,13 @@ class EffectsPool {
           
           // Return to available pool
           pool.available.push(particle);
-        });
+        }
         
         this.poolConfigs[effectType].activeCount -= particles.length;
+        
+        // Recycle the list itself for the next effect
+        particles.length = 0;
+        this.particleListPool.push(particles);
         released = true;
         break;
       }
@@ -206,30 +265,35 @@ class EffectsPool {
   updateAnimations() {
     const now = Date.now();
     
-    this.pools.forEach((pool, effectType) => {
-      pool.active.forEach((particles, effectId) => {
-        particles.forEach(particle => {
-          const userData = particle.userData;
-          const elapsed = now - userData.startTime;
+    this.pools.forEach((pool) => {
+      const { initialPositions, velocities, initialScales, initialRotations, startTimes } = pool.data;
+      
+      pool.active.forEach((particles) => {
+        for (let i = 0; i < particles.length; i++) {
+          const particle = particles[i];
+          const slot = particle.userData.slot;
+          const elapsed = now - startTimes[slot];
           const progress = elapsed / 1000; // 1 second duration
           
           if (progress <= 1) {
             // Update position based on velocity
-            particle.position.x = userData.initialPosition.x + userData.velocity.x * progress * 10;
-            particle.position.y = userData.initialPosition.y + userData.velocity.y * progress * 10;
-            particle.position.z = userData.initialPosition.z + userData.velocity.z * progress * 10;
+            const i3 = slot * 3;
+            const travel = progress * 10;
+            particle.position.x = initialPositions[i3] + velocities[i3] * travel;
+            particle.position.y = initialPositions[i3 + 1] + velocities[i3 + 1] * travel;
+            particle.position.z = initialPositions[i3 + 2] + velocities[i3 + 2] * travel;
             
             // Update scale (shrink over time)
-            const scale = userData.initialScale * (1 - progress);
+            const scale = initialScales[slot] * (1 - progress);
             particle.scale.set(scale, scale, scale);
             
             // Update rotation
-            particle.rotation.z = userData.initialRotation + progress * Math.PI * 2;
+            particle.rotation.z = initialRotations[slot] + progress * Math.PI * 2;
             
             // Update opacity (fade out)
             particle.material.opacity = 1 - progress;
           }
-        });
+        }
       });
     });
   }
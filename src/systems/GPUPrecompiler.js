@@ -5,6 +5,7 @@
 
 import * as THREE from 'three';
 import { MeshBVH } from 'three-mesh-bvh';
+import weaponMeshPool from './WeaponMeshPool2';
 
 class GPUPrecompiler {
   constructor() {
@@ -84,9 +85,6 @@ class GPUPrecompiler {
   async compileWeaponShaders(scene, stats) {
     console.log('[GPU PRECOMPILER] Compiling weapon shaders...');
     
-    // Get weapon mesh pool reference
-    const weaponMeshPool = await import('./WeaponMeshPool2').then(m => m.default);
-    
     // Add sample meshes from each weapon pool to force compilation
     const weaponTypes = ['rocket', 'bfg', 'bomb', 'railgun'];
     
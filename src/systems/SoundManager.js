@@ -4,12 +4,214 @@
  * Gracefully handles missing sound files
  */
 
+// Shared by every sound that declares no variations, rather than one empty
+// array per loaded sound
+const NO_VARIATIONS = Object.freeze([]);
+
+// Decoded audio keyed by URL. Ids that share a file share one buffer, and
+// AudioBuffers are not tied to a context, so the cache survives dispose()
+// and re-initialization without fetching or decoding again.
+const audioBufferCache = new Map(); // url -> Promise<AudioBuffer>
+
+// Overlapping one-shot plays allowed per sound. Each sound owns a fixed ring
+// of voice slots taken round-robin; a new play reuses the oldest slot and
+// stops whatever was still sounding there, so rapid fire (chaingun, alien
+// volleys) can't pile up unbounded source nodes.
+const MAX_VOICES_PER_SOUND = 4;
+
+// Volume-override gain nodes created up front; the pool grows past this only
+// if more overrides are sounding at once
+const GAIN_POOL_PREALLOCATE = 16;
+
+// Weapon type -> sound id
+const WEAPON_SOUNDS = {
+  default: 'laser_basic',
+  laser: 'laser_beam',
+  chaingun: 'chaingun_fire',
+  bfg: 'bfg_charge',
+  rocket: 'rocket_launch',
+  charge: 'charge_shot',
+  bomb: 'bomb_drop',
+  railgun: 'railgun_fire'
+};
+
+// Impact type -> sound id
+const IMPACT_SOUNDS = {
+  bullet_hit: 'impact_small',
+  missile_hit: 'impact_medium',
+  explosion: 'explosion_large',
+  shield_hit: 'shield_impact',
+  armor_hit: 'armor_impact'
+};
+
+// Base path for sound files
+const SOUND_PATH = '/sounds/';
+
+// Sound configuration with URLs, by category
+const SOUND_CONFIGURATION = {
+  weapons: {
+    laser_basic: {
+      url: `${SOUND_PATH}laser_basic.mp3`,
+      options: { volume: 0.5 }
+    },
+    laser_beam: {
+      url: `${SOUND_PATH}laser_beam.mp3`,
+      options: { volume: 0.6 }
+    },
+    chaingun_fire: {
+      url: `${SOUND_PATH}chaingun.mp3`,
+      options: { volume: 0.4 }
+    },
+    bfg_charge: {
+      url: `${SOUND_PATH}bfg_charge.mp3`,
+      options: { volume: 0.8 }
+    },
+    rocket_launch: {
+      url: `${SOUND_PATH}rocket_launch.mp3`,
+      options: { volume: 0.7 }
+    },
+    charge_shot: {
+      url: `${SOUND_PATH}charge_shot.mp3`,
+      options: { volume: 0.6 }
+    },
+    bomb_drop: {
+      url: `${SOUND_PATH}bomb_drop.mp3`,
+      options: { volume: 0.7 }
+    },
+    railgun_fire: {
+      url: `${SOUND_PATH}railgun.mp3`,
+      options: { volume: 0.8 }
+    }
+  },
+  impacts: {
+    impact_small: {
+      url: `${SOUND_PATH}impact_small.mp3`,
+      options: { volume: 0.3 }
+    },
+    impact_medium: {
+      url: `${SOUND_PATH}impact_medium.mp3`,
+      options: { volume: 0.5 }
+    },
+    shield_impact: {
+      url: `${SOUND_PATH}shield_hit.mp3`,
+      options: { volume: 0.4 }
+    },
+    armor_impact: {
+      url: `${SOUND_PATH}armor_hit.mp3`,
+      options: { volume: 0.5 }
+    }
+  },
+  explosions: {
+    explosion_small: {
+      url: `${SOUND_PATH}explosion_small.mp3`,
+      options: { volume: 0.6 }
+    },
+    explosion_medium: {
+      url: `${SOUND_PATH}explosion_medium.mp3`,
+      options: { volume: 0.7 }
+    },
+    explosion_large: {
+      url: `${SOUND_PATH}explosion_large.mp3`,
+      options: { volume: 0.8 }
+    },
+    explosion_alien: {
+      url: `${SOUND_PATH}explosion_alien.mp3`,
+      options: { volume: 0.6 }
+    }
+  },
+  powerups: {
+    powerup_collect: {
+      url: `${SOUND_PATH}powerup_collect.mp3`,
+      options: { volume: 0.5 }
+    },
+    shield_activate: {
+      url: `${SOUND_PATH}shield_activate.mp3`,
+      options: { volume: 0.4 }
+    },
+    weapon_upgrade: {
+      url: `${SOUND_PATH}weapon_upgrade.mp3`,
+      options: { volume: 0.5 }
+    },
+    health_restore: {
+      url: `${SOUND_PATH}health_restore.mp3`,
+      options: { volume: 0.4 }
+    }
+  },
+  ui: {
+    menu_select: {
+      url: `${SOUND_PATH}menu_select.mp3`,
+      options: { volume: 0.3 }
+    },
+    menu_hover: {
+      url: `${SOUND_PATH}menu_hover.mp3`,
+      options: { volume: 0.2 }
+    },
+    game_start: {
+      url: `${SOUND_PATH}game_start.mp3`,
+      options: { volume: 0.5 }
+    },
+    game_over: {
+      url: `${SOUND_PATH}game_over.mp3`,
+      options: { volume: 0.6 }
+    },
+    level_complete: {
+      url: `${SOUND_PATH}level_complete.mp3`,
+      options: { volume: 0.6 }
+    },
+    warning: {
+      url: `${SOUND_PATH}warning.mp3`,
+      options: { volume: 0.5 }
+    }
+  },
+  enemy: {
+    alien_hurt: {
+      url: `${SOUND_PATH}alien_hurt.mp3`,
+      options: { volume: 0.4 }
+    },
+    alien_death: {
+      url: `${SOUND_PATH}alien_death.mp3`,
+      options: { volume: 0.5 }
+    },
+    alien_shoot: {
+      url: `${SOUND_PATH}alien_shoot.mp3`,
+      options: { volume: 0.3 }
+    },
+    boss_appear: {
+      url: `${SOUND_PATH}boss_appear.mp3`,
+      options: { volume: 0.7 }
+    }
+  },
+  ambient: {
+    space_ambient: {
+      url: `${SOUND_PATH}space_ambient.mp3`,
+      options: { volume: 0.2, loop: true }
+    },
+    engine_hum: {
+      url: `${SOUND_PATH}engine_hum.mp3`,
+      options: { volume: 0.1, loop: true }
+    }
+  }
+};
+
+// Flattened once at module load so each initialize() makes a single pass
+const SOUND_LOAD_LIST = Object.entries(SOUND_CONFIGURATION).flatMap(([category, sounds]) =>
+  Object.entries(sounds).map(([id, config]) => ({ id, category, ...config }))
+);
+
+// Requested output latency. 'interactive' asks the browser for its smallest
+// glitch-free buffer so shots are heard on the frame they fire; platforms
+// that underrun can construct with 'balanced' or a latency in seconds.
+const DEFAULT_LATENCY_HINT = 'interactive';
+
 class SoundManager {
-  constructor() {
+  constructor({ latencyHint = DEFAULT_LATENCY_HINT } = {}) {
     this.sounds = new Map();
+    this.latencyHint = latencyHint;
     this.enabled = true;
     this.volume = 0.7;
     this.audioContext = null;
+    this.masterGain = null; // Applies this.volume to everything played
+    this.gainPool = []; // Idle override gain nodes, connected to masterGain
     this.initialized = false;
     this.loadErrors = new Set();
     
@@ -24,20 +226,45 @@ class SoundManager {
       enemy: new Map()
     };
     
-    // Initialize on first user interaction
+    // Initialize on first user interaction; the promise is shared so
+    // concurrent callers never create a second AudioContext
     this.initPromise = null;
+    
+    // Every field is declared above; sealing fixes the instance's shape so
+    // hot-path property access stays monomorphic, and a stray assignment to
+    // an undeclared field throws instead of silently growing the object
+    Object.seal(this);
   }
 
   /**
-   * Initialize the audio context (required for web audio)
+   * Initialize the audio context (required for web audio).
+   * Deferred while sound is disabled - an AudioContext keeps the browser's
+   * audio thread running - and started by toggleSound() on re-enable.
    */
-  async initialize() {
-    if (this.initialized) return;
-    
+  initialize() {
+    if (!this.initPromise) {
+      if (!this.enabled) return Promise.resolve();
+      this.initPromise = this.createAudioSystem();
+    }
+    return this.initPromise;
+  }
+
+  /**
+   * Create the audio context and load all configured sounds
+   */
+  async createAudioSystem() {
     try {
       // Create audio context
       const AudioContext = window.AudioContext || window.webkitAudioContext;
-      this.audioContext = new AudioContext();
+      this.audioContext = new AudioContext({ latencyHint: this.latencyHint });
+      
+      this.masterGain = this.audioContext.createGain();
+      this.masterGain.gain.value = this.volume;
+      this.masterGain.connect(this.audioContext.destination);
+      
+      for (let i = 0; i < GAIN_POOL_PREALLOCATE; i++) {
+        this.gainPool.push(this.createPooledGain());
+      }
       
       // Resume context if suspended (browser policy)
       if (this.audioContext.state === 'suspended') {
@@ -52,6 +279,7 @@ class SoundManager {
     } catch (error) {
       console.warn('[SoundManager] Failed to initialize audio:', error);
       this.enabled = false;
+      this.initPromise = null; // Allow a retry when sound is re-enabled
     }
   }
 
@@ -62,20 +290,26 @@ class SoundManager {
     if (!this.initialized || !this.enabled) return;
     
     try {
-      const response = await fetch(url);
-      if (!response.ok) throw new Error(`HTTP ${response.status}`);
+      const audioBuffer = await this.loadAudioBuffer(url);
       
-      const arrayBuffer = await response.arrayBuffer();
-      const audioBuffer = await this.audioContext.decodeAudioData(arrayBuffer);
+      // Each sound keeps a gain node at its configured volume, so plays that
+      // don't override the volume connect straight to it
+      const volume = options.volume || 1.0;
+      const gainNode = this.audioContext.createGain();
+      gainNode.gain.value = volume;
+      gainNode.connect(this.masterGain);
       
       const soundData = {
         id,
         buffer: audioBuffer,
+        gainNode,
         category,
-        volume: options.volume || 1.0,
+        volume,
         pitch: options.pitch || 1.0,
         loop: options.loop || false,
-        variations: options.variations || []
+        variations: options.variations || NO_VARIATIONS,
+        voices: new Array(MAX_VOICES_PER_SOUND).fill(null),
+        nextVoice: 0
       };
       
       this.sounds.set(id, soundData);
@@ -95,25 +329,59 @@ class SoundManager {
     }
   }
 
+  /**
+   * Fetch and decode a sound file once per URL
+   */
+  loadAudioBuffer(url) {
+    let pending = audioBufferCache.get(url);
+    if (!pending) {
+      pending = fetch(url)
+        .then((response) => {
+          if (!response.ok) {
+            const error = new Error(`HTTP ${response.status}`);
+            error.status = response.status;
+            throw error;
+          }
+          return response.arrayBuffer();
+        })
+        .then((arrayBuffer) => this.audioContext.decodeAudioData(arrayBuffer));
+      audioBufferCache.set(url, pending);
+      // Most configured files are optional and absent, so a 404 stays cached
+      // for the session instead of being re-requested on every initialize().
+      // Other failures (network, decode) are evicted so they can be retried.
+      pending.catch((error) => {
+        if (error.status !== 404) audioBufferCache.delete(url);
+      });
+    }
+    return pending;
+  }
+
   /**
    * Load all configured sounds
    */
   async loadAllSounds() {
-    const soundConfig = this.getSoundConfiguration();
-    const loadPromises = [];
-    
-    for (const [category, sounds] of Object.entries(soundConfig)) {
-      for (const [id, config] of Object.entries(sounds)) {
-        loadPromises.push(
-          this.loadSound(id, config.url, category, config.options)
-        );
-      }
-    }
-    
-    await Promise.allSettled(loadPromises);
+    await Promise.allSettled(SOUND_LOAD_LIST.map(({ id, url, category, options }) =>
+      this.loadSound(id, url, category, options)
+    ));
     console.log(`[SoundManager] Sound loading complete. Loaded ${this.sounds.size} sounds`);
   }
 
+  /**
+   * Gain node for a volume-override play. Nodes stay connected to masterGain
+   * and return to the pool when their play ends.
+   */
+  createPooledGain() {
+    const gainNode = this.audioContext.createGain();
+    gainNode.connect(this.masterGain);
+    return gainNode;
+  }
+
+  acquireGain(volume) {
+    const gainNode = this.gainPool.pop() || this.createPooledGain();
+    gainNode.gain.value = volume;
+    return gainNode;
+  }
+
   /**
    * Play a sound by ID
    */
@@ -124,16 +392,12 @@ class SoundManager {
     if (!sound) return null;
     
     try {
-      const source = this.audioContext.createBufferSource();
-      const gainNode = this.audioContext.createGain();
+      const audioContext = this.audioContext;
+      const source = audioContext.createBufferSource();
       
       source.buffer = sound.buffer;
       source.loop = options.loop || sound.loop;
       
-      // Apply volume
-      const volume = (options.volume || sound.volume) * this.volume;
-      gainNode.gain.value = volume;
-      
       // Apply pitch
       const pitch = options.pitch || sound.pitch;
       source.playbackRate.value = pitch;
@@ -144,16 +408,49 @@ class SoundManager {
         source.playbackRate.value *= variation;
       }
       
-      // Connect nodes
-      source.connect(gainNode);
-      gainNode.connect(this.audioContext.destination);
+      // Own gain node only when this play overrides the sound's volume;
+      // master volume is applied downstream by masterGain
+      let gainNode = sound.gainNode;
+      let ended = false;
+      const createOwnGain = (vol) => {
+        gainNode = this.acquireGain(vol);
+        return gainNode;
+      };
+      source.connect(options.volume ? createOwnGain(options.volume) : gainNode);
+      source.onended = () => {
+        ended = true;
+        if (gainNode !== sound.gainNode) {
+          source.disconnect();
+          // A play outliving dispose() must not return a node from the old
+          // context to the new pool
+          if (gainNode.context === this.audioContext) {
+            this.gainPool.push(gainNode);
+          }
+        }
+      };
       
       // Start playback
-      const when = options.delay ? this.audioContext.currentTime + options.delay : 0;
+      const when = options.delay ? audioContext.currentTime + options.delay : 0;
       source.start(when);
       
+      // Loops are long-lived and stopped by their owner, so only one-shots
+      // take a voice slot
+      if (!source.loop) {
+        const slot = sound.nextVoice;
+        const previous = sound.voices[slot];
+        if (previous) {
+          try {
+            previous.stop(); // No-op if it already finished
+          } catch (e) {
+            // Already stopped
+          }
+        }
+        sound.voices[slot] = source;
+        sound.nextVoice = (slot + 1) % MAX_VOICES_PER_SOUND;
+      }
+      
       // Return control object
-      return {
+      const control = {
         source,
         gainNode,
         stop: () => {
@@ -164,44 +461,75 @@ class SoundManager {
           }
         },
         setVolume: (vol) => {
-          gainNode.gain.value = vol * this.volume;
+          if (ended) return; // Its gain node may already serve another play
+          if (gainNode === sound.gainNode) {
+            // Move off the shared node before changing this play's volume
+            source.disconnect();
+            source.connect(createOwnGain(vol));
+            control.gainNode = gainNode;
+          } else {
+            gainNode.gain.value = vol;
+          }
         }
       };
+      return control;
     } catch (error) {
       console.warn(`[SoundManager] Error playing sound ${soundId}:`, error);
       return null;
     }
   }
 
+  /**
+   * Play a sound that may still be loading - e.g. the ambient loop started
+   * as the game begins, while the first-interaction load is in flight.
+   * Returns immediately; the returned control's stop() also cancels a start
+   * that is still waiting on the load.
+   */
+  playWhenLoaded(soundId, options = {}) {
+    if (!this.enabled) return null;
+    if (this.sounds.has(soundId) || !this.initPromise) {
+      return this.play(soundId, options);
+    }
+    
+    let cancelled = false;
+    let playing = null;
+    this.initPromise.then(() => {
+      if (!cancelled) playing = this.play(soundId, options);
+    });
+    
+    return {
+      stop: () => {
+        cancelled = true;
+        if (playing) playing.stop();
+      },
+      setVolume: (vol) => {
+        if (playing) playing.setVolume(vol);
+      }
+    };
+  }
+
   /**
    * Play a random sound from a category
    */
   playRandom(category, options = {}) {
+    if (!this.enabled) return null;
     const categorySounds = this.categories[category];
     if (!categorySounds || categorySounds.size === 0) return null;
     
-    const soundIds = Array.from(categorySounds.keys());
-    const randomId = soundIds[Math.floor(Math.random() * soundIds.length)];
-    
-    return this.play(randomId, options);
+    // Walk to a random key instead of copying the keys into an array per call
+    let remaining = Math.floor(Math.random() * categorySounds.size);
+    for (const soundId of categorySounds.keys()) {
+      if (remaining-- === 0) return this.play(soundId, options);
+    }
+    return null;
   }
 
   /**
    * Play weapon sound based on weapon type
    */
   playWeaponSound(weaponType, options = {}) {
-    const weaponSounds = {
-      default: 'laser_basic',
-      laser: 'laser_beam',
-      chaingun: 'chaingun_fire',
-      bfg: 'bfg_charge',
-      rocket: 'rocket_launch',
-      charge: 'charge_shot',
-      bomb: 'bomb_drop',
-      railgun: 'railgun_fire'
-    };
-    
-    const soundId = weaponSounds[weaponType] || 'laser_basic';
+    if (!this.enabled) return null; // Muted: skip the lookup and options copy
+    const soundId = WEAPON_SOUNDS[weaponType] || 'laser_basic';
     return this.play(soundId, { 
       ...options, 
       pitchVariation: 0.1 // Add slight variation
@@ -212,15 +540,8 @@ class SoundManager {
    * Play impact sound based on impact type
    */
   playImpactSound(impactType, options = {}) {
-    const impactSounds = {
-      bullet_hit: 'impact_small',
-      missile_hit: 'impact_medium',
-      explosion: 'explosion_large',
-      shield_hit: 'shield_impact',
-      armor_hit: 'armor_impact'
-    };
-    
-    const soundId = impactSounds[impactType] || 'impact_small';
+    if (!this.enabled) return null;
+    const soundId = IMPACT_SOUNDS[impactType] || 'impact_small';
     return this.play(soundId, options);
   }
 
@@ -228,7 +549,13 @@ class SoundManager {
    * Set master volume
    */
   setMasterVolume(volume) {
-    this.volume = Math.max(0, Math.min(1, volume));
+    const clamped = volume < 0 ? 0 : volume > 1 ? 1 : volume;
+    if (clamped === this.volume) return; // Nothing to push to the audio graph
+    
+    this.volume = clamped;
+    if (this.masterGain) {
+      this.masterGain.gain.value = this.volume;
+    }
   }
 
   /**
@@ -236,6 +563,9 @@ class SoundManager {
    */
   toggleSound() {
     this.enabled = !this.enabled;
+    if (this.enabled) {
+      this.initialize();
+    }
     return this.enabled;
   }
 
@@ -243,153 +573,7 @@ class SoundManager {
    * Get sound configuration with URLs
    */
   getSoundConfiguration() {
-    // Base path for sound files
-    const soundPath = '/sounds/';
-    
-    return {
-      weapons: {
-        laser_basic: {
-          url: `${soundPath}laser_basic.mp3`,
-          options: { volume: 0.5 }
-        },
-        laser_beam: {
-          url: `${soundPath}laser_beam.mp3`,
-          options: { volume: 0.6 }
-        },
-        chaingun_fire: {
-          url: `${soundPath}chaingun.mp3`,
-          options: { volume: 0.4 }
-        },
-        bfg_charge: {
-          url: `${soundPath}bfg_charge.mp3`,
-          options: { volume: 0.8 }
-        },
-        rocket_launch: {
-          url: `${soundPath}rocket_launch.mp3`,
-          options: { volume: 0.7 }
-        },
-        charge_shot: {
-          url: `${soundPath}charge_shot.mp3`,
-          options: { volume: 0.6 }
-        },
-        bomb_drop: {
-          url: `${soundPath}bomb_drop.mp3`,
-          options: { volume: 0.7 }
-        },
-        railgun_fire: {
-          url: `${soundPath}railgun.mp3`,
-          options: { volume: 0.8 }
-        }
-      },
-      impacts: {
-        impact_small: {
-          url: `${soundPath}impact_small.mp3`,
-          options: { volume: 0.3 }
-        },
-        impact_medium: {
-          url: `${soundPath}impact_medium.mp3`,
-          options: { volume: 0.5 }
-        },
-        shield_impact: {
-          url: `${soundPath}shield_hit.mp3`,
-          options: { volume: 0.4 }
-        },
-        armor_impact: {
-          url: `${soundPath}armor_hit.mp3`,
-          options: { volume: 0.5 }
-        }
-      },
-      explosions: {
-        explosion_small: {
-          url: `${soundPath}explosion_small.mp3`,
-          options: { volume: 0.6 }
-        },
-        explosion_medium: {
-          url: `${soundPath}explosion_medium.mp3`,
-          options: { volume: 0.7 }
-        },
-        explosion_large: {
-          url: `${soundPath}explosion_large.mp3`,
-          options: { volume: 0.8 }
-        },
-        explosion_alien: {
-          url: `${soundPath}explosion_alien.mp3`,
-          options: { volume: 0.6 }
-        }
-      },
-      powerups: {
-        powerup_collect: {
-          url: `${soundPath}powerup_collect.mp3`,
-          options: { volume: 0.5 }
-        },
-        shield_activate: {
-          url: `${soundPath}shield_activate.mp3`,
-          options: { volume: 0.4 }
-        },
-        weapon_upgrade: {
-          url: `${soundPath}weapon_upgrade.mp3`,
-          options: { volume: 0.5 }
-        },
-        health_restore: {
-          url: `${soundPath}health_restore.mp3`,
-          options: { volume: 0.4 }
-        }
-      },
-      ui: {
-        menu_select: {
-          url: `${soundPath}menu_select.mp3`,
-          options: { volume: 0.3 }
-        },
-        menu_hover: {
-          url: `${soundPath}menu_hover.mp3`,
-          options: { volume: 0.2 }
-        },
-        game_start: {
-          url: `${soundPath}game_start.mp3`,
-          options: { volume: 0.5 }
-        },
-        game_over: {
-          url: `${soundPath}game_over.mp3`,
-          options: { volume: 0.6 }
-        },
-        level_complete: {
-          url: `${soundPath}level_complete.mp3`,
-          options: { volume: 0.6 }
-        },
-        warning: {
-          url: `${soundPath}warning.mp3`,
-          options: { volume: 0.5 }
-        }
-      },
-      enemy: {
-        alien_hurt: {
-          url: `${soundPath}alien_hurt.mp3`,
-          options: { volume: 0.4 }
-        },
-        alien_death: {
-          url: `${soundPath}alien_death.mp3`,
-          options: { volume: 0.5 }
-        },
-        alien_shoot: {
-          url: `${soundPath}alien_shoot.mp3`,
-          options: { volume: 0.3 }
-        },
-        boss_appear: {
-          url: `${soundPath}boss_appear.mp3`,
-          options: { volume: 0.7 }
-        }
-      },
-      ambient: {
-        space_ambient: {
-          url: `${soundPath}space_ambient.mp3`,
-          options: { volume: 0.2, loop: true }
-        },
-        engine_hum: {
-          url: `${soundPath}engine_hum.mp3`,
-          options: { volume: 0.1, loop: true }
-        }
-      }
-    };
+    return SOUND_CONFIGURATION;
   }
 
   /**
@@ -399,8 +583,12 @@ class SoundManager {
     if (this.audioContext) {
       this.audioContext.close();
     }
+    this.audioContext = null;
+    this.masterGain = null;
+    this.gainPool = [];
     this.sounds.clear();
     this.initialized = false;
+    this.initPromise = null;
   }
 }
 
@@ -3,6 +3,7 @@ import * as BufferGeometryUtils from 'three/examples/jsm/utils/BufferGeometryUti
 import { MeshBVH, computeBoundsTree, disposeBoundsTree } from 'three-mesh-bvh';
 import asyncAssetManager from './AsyncAssetManager';
 import bvhCache from './BVHCache';
+import { fastSin } from '../utils/trigTables';
 
 /**
  * WeaponMeshPool - High-performance pooled mesh system for complex weapons
@@ -765,7 +766,7 @@ class WeaponMeshPool {
           const animData = mesh.userData.animationData;
           const blinkSpeed = animData.isDeployed ? 4 : 2;
           const elapsed = (now - animData.startTime) * 0.001;
-          const blinkIntensity = Math.sin(elapsed * blinkSpeed * Math.PI) * 0.5 + 0.5;
+          const blinkIntensity = fastSin(elapsed * blinkSpeed * Math.PI) * 0.5 + 0.5;
           
           // Enhanced blinking effect to compensate for no PointLight
           blinkLight.material.opacity = 0.4 + blinkIntensity * 0.6; // Wider range
@@ -781,7 +782,7 @@ class WeaponMeshPool {
         const electricity = mesh.getObjectByName('rail-electricity');
         if (electricity) {
           // Enhanced animation range for better visibility without PointLight
-          const opacity = 0.4 + Math.sin(now * 0.02) * 0.3; // Range: 0.4-0.7
+          const opacity = 0.4 + fastSin(now * 0.02) * 0.3; // Range: 0.4-0.7
           electricity.material.opacity = opacity;
         }
       });
@@ -20,8 +20,9 @@ export const processPlayerMovement = ({
   // Star Fox 64-style momentum-based movement
   
   // Get free look mode and UI interaction mode for 6DOF controls
-  const freeLookMode = useGameStore.getState().freeLookMode;
-  const uiInteractionMode = useGameStore.getState().uiInteractionMode;
+  // (every store read below comes from the single snapshot taken above)
+  const freeLookMode = gameState.freeLookMode;
+  const uiInteractionMode = gameState.uiInteractionMode;
   
   // Skip all movement processing if in UI interaction mode
   if (uiInteractionMode) {
@@ -58,7 +59,7 @@ export const processPlayerMovement = ({
     // 6DOF Space Sim Controls (Ship-Relative Movement like Elite Dangerous)
     
     // Get player's current rotation to calculate ship-relative movement
-    const playerRotation = useGameStore.getState().playerRotation;
+    const playerRotation = gameState.playerRotation;
     
     // Calculate ship-relative movement inputs (in ship's local space)
     let forwardInput = 0;  // Forward/backward relative to ship nose
@@ -85,7 +86,7 @@ export const processPlayerMovement = ({
     if (keys.Space) {
       upInput += acceleration * 0.5 * adjustedDelta; // Up thrust (half forward speed)
     }
-    if (keys.ControlLeft || keys.ControlRight) {
+    if (isBoostActive) {
       upInput -= acceleration * 0.5 * adjustedDelta; // Down thrust (half forward speed)
     }
     
@@ -148,7 +149,7 @@ export const processPlayerMovement = ({
   }
   
   // Update velocity with acceleration
-  const playerVelocity = useGameStore.getState().playerVelocity;
+  const playerVelocity = gameState.playerVelocity;
   let newVelX = playerVelocity.x + accelX;
   let newVelY = playerVelocity.y + accelY;
   let newVelZ = (playerVelocity.z || 0) + accelZ;
@@ -195,7 +196,7 @@ export const processPlayerMovement = ({
   const deltaX = newVelX * adjustedDelta;
   const deltaY = newVelY * adjustedDelta;
   const deltaZ = newVelZ * adjustedDelta;
-  const playerPosition = useGameStore.getState().playerPosition;
+  const playerPosition = gameState.playerPosition;
   const newX = playerPosition.x + deltaX;
   const newY = playerPosition.y + deltaY;
   
@@ -286,7 +287,7 @@ export const processPlayerMovement = ({
 
   // Check if any alien has reached the player (Y or Z axis) - disabled in free flight mode
   if (gameMode !== 'freeflight') {
-    for (const alien of useGameStore.getState().aliens) {
+    for (const alien of gameState.aliens) {
       if (alien.position.y < -30 || alien.position.z > 5) {
         console.log('Alien reached player:', alien.position);
         damageQueueRef.current.push({
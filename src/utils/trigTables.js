@@ -0,0 +1,18 @@
+// Sine/cosine lookup tables for cosmetic per-frame animation
+// (pulses, blinks, bobbing) where table precision is plenty.
+// Gameplay math should keep using Math.sin/Math.cos.
+
+const TABLE_SIZE = 1024; // Power of two so wrap-around is a bit mask
+const TABLE_MASK = TABLE_SIZE - 1;
+const RADIANS_TO_INDEX = TABLE_SIZE / (Math.PI * 2);
+const QUARTER_TURN = TABLE_SIZE / 4;
+
+export const SIN_TABLE = new Float32Array(TABLE_SIZE);
+for (let i = 0; i < TABLE_SIZE; i++) {
+  SIN_TABLE[i] = Math.sin((i / TABLE_SIZE) * Math.PI * 2);
+}
+
+// `& TABLE_MASK` wraps both large (Date.now()-based) and negative angles
+export const fastSin = (radians) => SIN_TABLE[(radians * RADIANS_TO_INDEX) & TABLE_MASK];
+
+export const fastCos = (radians) => SIN_TABLE[((radians * RADIANS_TO_INDEX) + QUARTER_TURN) & TABLE_MASK];
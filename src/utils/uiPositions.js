@@ -1,6 +1,19 @@
 // UI Position Management System
 // Stores and manages positions for draggable UI elements
 
+// Default positions for UI elements
+const DEFAULT_UI_POSITIONS = {
+  debugPanel: { x: 280, y: 20 },
+  entityPanel: { x: 700, y: 20 },
+  gamespacePanel: { x: 20, y: 20 },
+  liveTargetingStats: { x: 560, y: 20 },
+  validationResults: { x: 840, y: 20 },
+  autoFireStats: { x: 300, y: 20 },
+  // Add more UI elements as needed
+};
+
+const FALLBACK_POSITION = { x: 20, y: 20 };
+
 class UIPositionManager {
   constructor() {
     this.positions = this.loadPositions();
@@ -22,17 +35,10 @@ class UIPositionManager {
     }
   }
   
-  // Default positions for UI elements
+  // Default positions for UI elements (a fresh top-level copy, since
+  // setPosition replaces entries on the returned object)
   getDefaultPositions() {
-    return {
-      debugPanel: { x: 280, y: 20 },
-      entityPanel: { x: 700, y: 20 },
-      gamespacePanel: { x: 20, y: 20 },
-      liveTargetingStats: { x: 560, y: 20 },
-      validationResults: { x: 840, y: 20 },
-      autoFireStats: { x: 300, y: 20 },
-      // Add more UI elements as needed
-    };
+    return { ...DEFAULT_UI_POSITIONS };
   }
   
   // Load positions from localStorage
@@ -61,13 +67,16 @@ class UIPositionManager {
   
   // Get position for a UI element
   getPosition(elementId) {
-    return this.positions[elementId] || this.getDefaultPositions()[elementId] || { x: 20, y: 20 };
+    return this.positions[elementId] || DEFAULT_UI_POSITIONS[elementId] || FALLBACK_POSITION;
   }
   
-  // Set position for a UI element
-  setPosition(elementId, position) {
+  // Set position for a UI element; pass persist=false to defer the
+  // localStorage write (dragging saves once on mouse up)
+  setPosition(elementId, position, persist = true) {
     this.positions[elementId] = { ...position };
-    this.savePositions();
+    if (persist) {
+      this.savePositions();
+    }
   }
   
   // Reset all positions to defaults
@@ -172,7 +181,7 @@ class UIPositionManager {
     newPosition.x = Math.max(0, Math.min(maxX, newPosition.x));
     newPosition.y = Math.max(0, Math.min(maxY, newPosition.y));
     
-    this.setPosition(this.dragElement, newPosition);
+    this.setPosition(this.dragElement, newPosition, false);
     
     // Trigger re-render by dispatching a custom event
     window.dispatchEvent(new CustomEvent('ui-position-changed', {
@@ -183,6 +192,9 @@ class UIPositionManager {
   // Handle mouse up for dragging
   handleMouseUp(event) {
     if (this.isDragging) {
+      // Persist the final drag position in a single write
+      this.savePositions();
+      
       // Remove visual feedback
       const elements = document.querySelectorAll('[data-draggable]');
       elements.forEach(el => {
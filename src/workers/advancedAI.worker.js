@@ -153,6 +153,23 @@ class ThreatAnalyzer {
   }
 }
 
+// A* open set is kept sorted by descending f, so the cheapest node is
+// popped from the end. Binary insertion places a node ahead of equal-f
+// entries, so ties still pop oldest-first as the old stable sort did.
+function insertByCost(openSet, node) {
+  let low = 0;
+  let high = openSet.length;
+  while (low < high) {
+    const mid = (low + high) >>> 1;
+    if (openSet[mid].f > node.f) {
+      low = mid + 1;
+    } else {
+      high = mid;
+    }
+  }
+  openSet.splice(low, 0, node);
+}
+
 // Advanced Pathfinding using A* with 3D modifications
 class Pathfinder {
   static findPath(start, goal, obstacles = []) {
@@ -177,9 +194,8 @@ class Pathfinder {
     const resolution = aiConfig.pathfindingResolution;
     
     while (openSet.length > 0) {
-      // Find lowest f score
-      openSet.sort((a, b) => a.f - b.f);
-      const current = openSet.shift();
+      // Lowest f score is at the end (see insertByCost)
+      const current = openSet.pop();
       
       // Check if we reached the goal
       if (vec3.distance(current.pos, goal) < resolution) {
@@ -232,7 +248,7 @@ class Pathfinder {
           if (existing) {
             openSet.splice(openSet.indexOf(existing), 1);
           }
-          openSet.push({ pos: neighbor, f, g, h, parent: current });
+          insertByCost(openSet, { pos: neighbor, f, g, h, parent: current });
         }
       }
       
@@ -6,6 +6,81 @@
 /* global self */
 /* eslint no-restricted-globals: ["error", "event", "fdescribe"] */
 
+import { SpatialHashGrid } from '../utils/spatialHashGrid';
+
+// Wing hit by side, indexed with +(relativeX < 0) instead of branching
+const WING_SIDES = ['rightWing', 'leftWing'];
+
+// Flat per-frame copy of collision targets (aliens or asteroids).
+// Positions and base radii sit in contiguous Float64Arrays so the narrow-phase
+// is a tight numeric loop over indices; objects[] maps an index back to its entity.
+class CollisionTargetArrays {
+  constructor(capacity = 128) {
+    this.count = 0;
+    this.objects = [];
+    this.allocate(capacity);
+  }
+
+  allocate(capacity) {
+    this.capacity = capacity;
+    this.x = new Float64Array(capacity);
+    this.y = new Float64Array(capacity);
+    this.z = new Float64Array(capacity);
+    this.radius = new Float64Array(capacity);
+  }
+
+  reset() {
+    this.count = 0;
+    this.objects.length = 0;
+  }
+
+  push(object, x, y, z, radius) {
+    if (this.count === this.capacity) {
+      const { x, y, z, radius } = this;
+      this.allocate(this.capacity * 2);
+      this.x.set(x);
+      this.y.set(y);
+      this.z.set(z);
+      this.radius.set(radius);
+    }
+    const index = this.count++;
+    this.x[index] = x;
+    this.y[index] = y;
+    this.z[index] = z;
+    this.radius[index] = radius;
+    this.objects[index] = object;
+    return index;
+  }
+}
+
+// Closest target within (radius + missileSize) of a point, from the first
+// candidateCount candidate indices. Returns the index or -1; squared distance goes to out[0].
+function findClosestTarget(targets, candidates, candidateCount, x, y, z, missileSize, out) {
+  const tx = targets.x;
+  const ty = targets.y;
+  const tz = targets.z;
+  const tr = targets.radius;
+  let closestIndex = -1;
+  let closestDistanceSquared = Infinity;
+
+  for (let i = 0; i < candidateCount; i++) {
+    const j = candidates[i];
+    const dx = x - tx[j];
+    const dy = y - ty[j];
+    const dz = z - tz[j];
+    const distanceSquared = dx * dx + dy * dy + dz * dz;
+    const collisionRadius = tr[j] + missileSize;
+
+    if (distanceSquared < collisionRadius * collisionRadius && distanceSquared < closestDistanceSquared) {
+      closestDistanceSquared = distanceSquared;
+      closestIndex = j;
+    }
+  }
+
+  out[0] = closestDistanceSquared;
+  return closestIndex;
+}
+
 class SOAMissilePhysicsWorker {
   constructor() {
     this.buffer = null;
@@ -17,7 +92,19 @@ class SOAMissilePhysicsWorker {
     this.aliens = [];
     this.asteroids = [];
     this.playerPosition = { x: 0, y: 0, z: 0 };
-    
+
+    // Broad-phase grids, reused every frame
+    this.alienGrid = new SpatialHashGrid(20);
+    this.asteroidGrid = new SpatialHashGrid(20);
+
+    // Narrow-phase target arrays, reused every frame
+    this.alienTargets = new CollisionTargetArrays();
+    this.asteroidTargets = new CollisionTargetArrays();
+    this.closestDistanceOut = new Float64Array(1);
+    
+    // Alien positions for homing, packed on the first homing missile of a frame
+    this.homingTargets = new CollisionTargetArrays();
+    this.homingTargetsPacked = false;
   }
 
   initializeBuffer(buffer, rawArrays) {
@@ -98,6 +185,12 @@ class SOAMissilePhysicsWorker {
     };
     
     let activeMissiles = 0;
+    this.homingTargetsPacked = false;
+    
+    // Typed-array views read into locals once for the whole pass
+    const positions = this.positions;
+    const velocities = this.velocities;
+    const metadata = this.metadata;
     
     // CACHE-FRIENDLY: Process all positions in vectorized chunks
     for (let i = 0; i < missileCount; i++) {
@@ -107,11 +200,11 @@ class SOAMissilePhysicsWorker {
       const metaIdx = i * 4;
       
       // Check if missile is active (metadata[3] = flags, bit 7 = active)
-      const flags = this.metadata[metaIdx + 3];
+      const flags = metadata[metaIdx + 3];
       if ((flags & (1 << 7)) === 0) continue; // Skip inactive
       
-      const weaponType = this.metadata[metaIdx + 1];
-      const missileType = this.metadata[metaIdx + 2];
+      const weaponType = metadata[metaIdx + 1];
+      const missileType = metadata[metaIdx + 2];
       
       // Skip exploded bombs
       if (weaponType === 7 && (flags & (1 << 2))) { // bomb + exploded flag
@@ -126,28 +219,28 @@ class SOAMissilePhysicsWorker {
       }
       
       // VECTORIZED position update (CPU can optimize this)
-      const oldX = this.positions[posIdx + 0];
-      const oldZ = this.positions[posIdx + 2];
-      const velX = this.velocities[velIdx + 0];
-      const velZ = this.velocities[velIdx + 2];
+      const oldX = positions[posIdx + 0];
+      const oldZ = positions[posIdx + 2];
+      const velX = velocities[velIdx + 0];
+      const velZ = velocities[velIdx + 2];
       
       const newX = oldX + velX * adjustedDelta;
-      const newY = this.positions[posIdx + 1] + this.velocities[velIdx + 1] * adjustedDelta;
+      const newY = positions[posIdx + 1] + velocities[velIdx + 1] * adjustedDelta;
       const newZ = oldZ + velZ * adjustedDelta;
       
       
       // Boundary culling
       if (this.shouldCullMissileSOA(weaponType, missileType, newX, newY, newZ, gameMode)) {
         // Mark as inactive
-        this.metadata[metaIdx + 3] = flags & ~(1 << 7);
+        metadata[metaIdx + 3] = flags & ~(1 << 7);
         cullStats.culled++;
         continue;
       }
       
       // Write back updated positions (SOA layout optimizes this)
-      this.positions[posIdx + 0] = newX;
-      this.positions[posIdx + 1] = newY;
-      this.positions[posIdx + 2] = newZ;
+      positions[posIdx + 0] = newX;
+      positions[posIdx + 1] = newY;
+      positions[posIdx + 2] = newZ;
       
       activeMissiles++;
     }
@@ -163,36 +256,49 @@ class SOAMissilePhysicsWorker {
     const maxHomingRange = 100;
     const maxHomingRangeSquared = maxHomingRange * maxHomingRange;
     
-    let closestAlien = null;
-    let closestDistance = Infinity;
+    // Alien positions are packed once per frame and shared by every homing missile
+    const targets = this.homingTargets;
+    if (!this.homingTargetsPacked) {
+      targets.reset();
+      for (let i = 0; i < this.aliens.length; i++) {
+        const position = this.aliens[i].position;
+        targets.push(this.aliens[i], position.x, position.y, position.z, 0);
+      }
+      this.homingTargetsPacked = true;
+    }
+    
+    let closestIndex = -1;
+    let closestDistanceSquared = Infinity;
     let targetDx, targetDy, targetDz;
     
     const missileX = this.positions[posIdx + 0];
     const missileY = this.positions[posIdx + 1];
     const missileZ = this.positions[posIdx + 2];
+    const tx = targets.x;
+    const ty = targets.y;
+    const tz = targets.z;
     
     // Find closest alien
-    for (let i = 0; i < this.aliens.length; i++) {
-      const alien = this.aliens[i];
-      
-      const dx = alien.position.x - missileX;
-      const dy = alien.position.y - missileY;
-      const dz = alien.position.z - missileZ;
+    for (let i = 0; i < targets.count; i++) {
+      const dx = tx[i] - missileX;
+      const dy = ty[i] - missileY;
+      const dz = tz[i] - missileZ;
       
       const distanceSquared = dx * dx + dy * dy + dz * dz;
       
       if (distanceSquared > maxHomingRangeSquared) continue;
       
-      if (distanceSquared < closestDistance * closestDistance) {
-        closestDistance = Math.sqrt(distanceSquared);
-        closestAlien = alien;
+      if (distanceSquared < closestDistanceSquared) {
+        closestDistanceSquared = distanceSquared;
+        closestIndex = i;
         targetDx = dx;
         targetDy = dy;
         targetDz = dz;
       }
     }
     
-    if (closestAlien && closestDistance > 0) {
+    const closestDistance = Math.sqrt(closestDistanceSquared);
+    if (closestIndex !== -1 && closestDistance > 0) {
       const homingStrength = 0.15;
       
       // Get original missile speed before homing adjustment
@@ -270,25 +376,44 @@ class SOAMissilePhysicsWorker {
     
     const startTime = performance.now();
     
-    // Create spatial hash grids (same as before)
-    const gridSize = 20;
-    const alienGrid = new Map();
-    const asteroidGrid = new Map();
-    
-    // Hash aliens into grid
-    this.aliens.forEach(alien => {
-      if (alien.isInvulnerable) return;
-      const key = this.getGridKey(alien.position);
-      if (!alienGrid.has(key)) alienGrid.set(key, []);
-      alienGrid.get(key).push(alien);
-    });
-    
-    // Hash asteroids into grid
-    this.asteroids.forEach(asteroid => {
-      const key = this.getGridKey(asteroid.position);
-      if (!asteroidGrid.has(key)) asteroidGrid.set(key, []);
-      asteroidGrid.get(key).push(asteroid);
-    });
+    // Rebuild target arrays and spatial hash grids in place
+    const alienGrid = this.alienGrid;
+    const asteroidGrid = this.asteroidGrid;
+    const alienTargets = this.alienTargets;
+    const asteroidTargets = this.asteroidTargets;
+    alienGrid.clear();
+    asteroidGrid.clear();
+    alienTargets.reset();
+    asteroidTargets.reset();
+
+    // Pack collidable aliens and hash their indices into the grid
+    // Skip invulnerable aliens (spawning or boss special states)
+    for (let i = 0; i < this.aliens.length; i++) {
+      const alien = this.aliens[i];
+      if (alien.isInvulnerable) continue;
+      const { x, y } = alien.position;
+      const z = alien.position.z || 0;
+      const index = alienTargets.push(alien, x, y, z, (alien.size || 1.5) + 0.3);
+      alienGrid.insert(index, x, y, z);
+    }
+
+    // Pack collidable asteroids (doodads are decoration only)
+    for (let i = 0; i < this.asteroids.length; i++) {
+      const asteroid = this.asteroids[i];
+      if (asteroid.isDoodad) continue;
+      const { x, y } = asteroid.position;
+      const z = asteroid.position.z || 0;
+      const index = asteroidTargets.push(asteroid, x, y, z, asteroid.size * 2.0 + 0.8);
+      asteroidGrid.insert(index, x, y, z);
+    }
+    alienGrid.build();
+    asteroidGrid.build();
+    
+    // Player position is fixed for the whole pass - read it once, not per alien missile
+    const playerPos = this.playerPosition;
+    const playerX = playerPos ? playerPos.x : 0;
+    const playerY = playerPos ? playerPos.y : 0;
+    const playerZ = playerPos ? playerPos.z : 0;
     
     // CACHE-OPTIMIZED: Check missiles using SOA data
     let activeMissilesChecked = 0;
@@ -304,25 +429,25 @@ class SOAMissilePhysicsWorker {
       activeMissilesChecked++;
       const missileType = this.metadata[metaIdx + 2];
       const weaponType = this.metadata[metaIdx + 1];
+      // The narrow phase works on the hashed id; it is mapped back to the
+      // store id only when a hit is actually recorded
       const hashedMissileId = this.metadata[metaIdx + 0];
-      const missileId = this.hashedToOriginalId.get(hashedMissileId) || hashedMissileId;
       
-      const position = {
-        x: this.positions[posIdx + 0],
-        y: this.positions[posIdx + 1],
-        z: this.positions[posIdx + 2]
-      };
+      // Read coordinates straight from the SOA arrays - no per-missile object
+      const x = this.positions[posIdx + 0];
+      const y = this.positions[posIdx + 1];
+      const z = this.positions[posIdx + 2];
       
       const size = this.properties[propIdx + 0];
       
       if (missileType === 0 || missileType === 2) { // player or wingman
         // Check alien collisions
-        this.checkMissileAlienCollisionsSOA(missileId, position, size, alienGrid, collisions);
+        this.checkMissileAlienCollisionsSOA(hashedMissileId, x, y, z, size, alienGrid, collisions);
         
         // Check asteroid collisions  
-        this.checkMissileAsteroidCollisionsSOA(missileId, position, size, asteroidGrid, collisions);
-      } else if (missileType === 1 && this.playerPosition) { // alien missile
-        this.checkAlienMissilePlayerCollisionSOA(missileId, position, collisions);
+        this.checkMissileAsteroidCollisionsSOA(hashedMissileId, x, y, z, size, asteroidGrid, collisions);
+      } else if (missileType === 1 && playerPos) { // alien missile
+        this.checkAlienMissilePlayerCollisionSOA(hashedMissileId, x - playerX, y - playerY, z - playerZ, collisions);
       }
     }
     
@@ -332,71 +457,38 @@ class SOAMissilePhysicsWorker {
     return collisions;
   }
 
-  getGridKey(position) {
-    const gridSize = 20;
-    const gridX = Math.floor(position.x / gridSize);
-    const gridY = Math.floor(position.y / gridSize);
-    const gridZ = Math.floor((position.z || 0) / gridSize);
-    return `${gridX},${gridY},${gridZ}`;
-  }
-
-  checkMissileAlienCollisionsSOA(missileId, position, size, alienGrid, collisions) {
-    const missileGridKey = this.getGridKey(position);
-    const [gx, gy, gz] = missileGridKey.split(',').map(Number);
-    
-    let closestAlien = null;
-    let closestDistance = Infinity;
-    let hitComponent = null;
-    
-    // Check 3x3x3 grid around missile
-    for (let dx = -1; dx <= 1; dx++) {
-      for (let dy = -1; dy <= 1; dy++) {
-        for (let dz = -1; dz <= 1; dz++) {
-          const key = `${gx + dx},${gy + dy},${gz + dz}`;
-          const nearbyAliens = alienGrid.get(key);
-          
-          if (!nearbyAliens) continue;
-          
-          nearbyAliens.forEach(alien => {
-            // Skip invulnerable aliens (spawning or boss special states)
-            if (alien.isInvulnerable) return;
-            
-            const dx = position.x - alien.position.x;
-            const dy = position.y - alien.position.y;
-            const dz = (position.z || 0) - alien.position.z;
-            const distance = Math.sqrt(dx * dx + dy * dy + dz * dz);
-            
-            const collisionRadius = (alien.size || 1.5) + size + 0.3;
-            
-            if (distance < collisionRadius && distance < closestDistance) {
-              closestDistance = distance;
-              closestAlien = alien;
-              
-              // Determine hit component based on position relative to alien
-              hitComponent = this.getHitComponent(position, alien);
-            }
-          });
-        }
-      }
-    }
+  checkMissileAlienCollisionsSOA(hashedMissileId, x, y, z, size, alienGrid, collisions) {
+    // Only aliens in the 3x3x3 cells around the missile are candidates
+    const nearbyAliens = alienGrid.query(x, y, z);
+    const closestIndex = findClosestTarget(this.alienTargets, nearbyAliens, alienGrid.queryCount, x, y, z, size, this.closestDistanceOut);
     
-    if (closestAlien) {
+    if (closestIndex !== -1) {
+      const closestAlien = this.alienTargets.objects[closestIndex];
+      
+      // Determine hit component based on position relative to alien
+      const hitComponent = this.getHitComponent(x, y, z, closestAlien);
+      
       // Make sure we use the correct alien ID
       collisions.missileAlienHits.push({
-        missileId: missileId,
+        missileId: this.resolveMissileId(hashedMissileId),
         alienId: closestAlien.id, // This should be the original alien ID from the store
-        distance: closestDistance,
+        distance: Math.sqrt(this.closestDistanceOut[0]),
         component: hitComponent || 'body' // Default to body if component detection fails
       });
     }
   }
 
+  // Map a hashed SOA id back to the store's missile id
+  resolveMissileId(hashedMissileId) {
+    return this.hashedToOriginalId.get(hashedMissileId) || hashedMissileId;
+  }
+
   // Simple component detection based on hit position relative to alien center
-  getHitComponent(missilePosition, alien) {
+  getHitComponent(x, y, z, alien) {
     const alienPos = alien.position;
-    const relativeX = missilePosition.x - alienPos.x;
-    const relativeY = missilePosition.y - alienPos.y;
-    const relativeZ = missilePosition.z - alienPos.z;
+    const relativeX = x - alienPos.x;
+    const relativeY = y - alienPos.y;
+    const relativeZ = z - alienPos.z;
     
     // For flying saucer (type 5), map to standard components
     const shipType = alien.type === 5 ? 'saucer' : 'ship';
@@ -405,7 +497,7 @@ class SOAMissilePhysicsWorker {
       // Flying saucer component mapping
       if (relativeY > 0.2) return 'nose'; // Top dome
       if (relativeY < -0.2) {
-        return Math.abs(relativeX) > 0.3 ? (relativeX < 0 ? 'leftWing' : 'rightWing') : 'body';
+        return Math.abs(relativeX) > 0.3 ? WING_SIDES[+(relativeX < 0)] : 'body';
       }
       return 'body'; // Main disc
     }
@@ -413,86 +505,46 @@ class SOAMissilePhysicsWorker {
     // Standard ship component detection
     if (relativeZ < -0.8) return 'nose'; // Front cone
     if (Math.abs(relativeX) > 0.5) {
-      return relativeX < 0 ? 'leftWing' : 'rightWing';
+      return WING_SIDES[+(relativeX < 0)];
     }
     return 'body'; // Main fuselage
   }
 
-  checkMissileAsteroidCollisionsSOA(missileId, position, size, asteroidGrid, collisions) {
-    const missileGridKey = this.getGridKey(position);
-    const [gx, gy, gz] = missileGridKey.split(',').map(Number);
-    
-    let closestAsteroid = null;
-    let closestDistance = Infinity;
-    
-    for (let dx = -1; dx <= 1; dx++) {
-      for (let dy = -1; dy <= 1; dy++) {
-        for (let dz = -1; dz <= 1; dz++) {
-          const key = `${gx + dx},${gy + dy},${gz + dz}`;
-          const nearbyAsteroids = asteroidGrid.get(key);
-          
-          if (!nearbyAsteroids) continue;
-          
-          nearbyAsteroids.forEach(asteroid => {
-            if (asteroid.isDoodad) return;
-            
-            const dx = position.x - asteroid.position.x;
-            const dy = position.y - asteroid.position.y;
-            const dz = (position.z || 0) - asteroid.position.z;
-            const distance = Math.sqrt(dx * dx + dy * dy + dz * dz);
-            
-            const collisionRadius = asteroid.size * 2.0 + size + 0.8;
-            
-            if (distance < collisionRadius && distance < closestDistance) {
-              closestDistance = distance;
-              closestAsteroid = asteroid;
-            }
-          });
-        }
-      }
-    }
+  checkMissileAsteroidCollisionsSOA(hashedMissileId, x, y, z, size, asteroidGrid, collisions) {
+    const nearbyAsteroids = asteroidGrid.query(x, y, z);
+    const closestIndex = findClosestTarget(this.asteroidTargets, nearbyAsteroids, asteroidGrid.queryCount, x, y, z, size, this.closestDistanceOut);
     
-    if (closestAsteroid) {
+    if (closestIndex !== -1) {
       collisions.missileAsteroidHits.push({
-        missileId: missileId,
-        asteroidId: closestAsteroid.id,
-        distance: closestDistance
+        missileId: this.resolveMissileId(hashedMissileId),
+        asteroidId: this.asteroidTargets.objects[closestIndex].id,
+        distance: Math.sqrt(this.closestDistanceOut[0])
       });
     }
   }
 
-  checkAlienMissilePlayerCollisionSOA(missileId, position, collisions) {
-    const dx = position.x - this.playerPosition.x;
-    const dy = position.y - this.playerPosition.y;
-    const dz = (position.z || 0) - this.playerPosition.z;
+  // dx/dy/dz are the missile's offsets from the player
+  checkAlienMissilePlayerCollisionSOA(hashedMissileId, dx, dy, dz, collisions) {
     const distanceSquared = dx * dx + dy * dy + dz * dz;
     
-    if (distanceSquared <= 64) { // 8x8 = 64
-      const distance = Math.sqrt(distanceSquared);
+    if (distanceSquared < 4.0) { // 2.0 * 2.0
+      // Determine hit component for player ship
+      const hitComponent = this.getPlayerHitComponent(dx, dz);
       
-      if (distance < 2.0) {
-        // Determine hit component for player ship
-        const hitComponent = this.getPlayerHitComponent(position);
-        
-        collisions.alienMissilePlayerHits.push({
-          missileId: missileId,
-          distance: distance,
-          component: hitComponent || 'body'
-        });
-      }
+      collisions.alienMissilePlayerHits.push({
+        missileId: this.resolveMissileId(hashedMissileId),
+        distance: Math.sqrt(distanceSquared),
+        component: hitComponent || 'body'
+      });
     }
   }
 
-  // Component detection for player hits
-  getPlayerHitComponent(missilePosition) {
-    const relativeX = missilePosition.x - this.playerPosition.x;
-    const relativeY = missilePosition.y - this.playerPosition.y;
-    const relativeZ = (missilePosition.z || 0) - this.playerPosition.z;
-    
+  // Component detection for player hits, from the missile's offset to the player
+  getPlayerHitComponent(relativeX, relativeZ) {
     // Player ship component detection (note: player faces negative Z)
     if (relativeZ < -0.8) return 'nose'; // Front cone
     if (Math.abs(relativeX) > 0.5) {
-      return relativeX < 0 ? 'leftWing' : 'rightWing';
+      return WING_SIDES[+(relativeX < 0)];
     }
     return 'body'; // Main fuselage
   }